@@ -0,0 +1,46 @@
+"""Compares per-element :class:`~visuscript.Transform` work with the bulk equivalent on a
+:class:`~visuscript.primatives.TransformArray`.
+
+Run from the repository root with ``python -m benchmarks.bench_arrays``.
+"""
+
+import timeit
+
+from visuscript.drawable import Rect
+from visuscript.organizer import GridOrganizer
+from visuscript.primatives import Transform, TransformArray
+
+N = 10_000
+NUMBER = 10
+
+
+def main():
+    organizer = GridOrganizer((100, 100), (10, 10)).set_transform(
+        Transform([5, 5], 2, 30)
+    )
+    rects = [Rect(5, 5) for _ in range(N)]
+    transforms = [organizer[i] for i in range(N)]
+    start = TransformArray.gather(transforms)
+    end = start.composed(Transform(rotation=90))
+    start_transforms, end_transforms = list(start), list(end)
+
+    def per_element_organize():
+        for rect, transform in zip(rects, organizer):
+            rect.set_transform(transform)
+
+    def per_element_interpolate():
+        for a, b in zip(start_transforms, end_transforms):
+            a.interpolate(b, 0.5)
+
+    for name, statement in [
+        ("organize, per element", per_element_organize),
+        ("organize, bulk", lambda: organizer.organize(rects)),
+        ("interpolate, per element", per_element_interpolate),
+        ("interpolate, bulk", lambda: start.interpolate(end, 0.5)),
+    ]:
+        seconds = timeit.timeit(statement, number=NUMBER) / NUMBER
+        print(f"{name:<28}{seconds * 1e3:9.2f} ms for {N} elements")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Compares animating many transforms with one animation per transform
+against animating them with one batch animation.
+
+Run from the repository root with ``python -m benchmarks.bench_batch_animation``.
+"""
+
+import time
+
+from visuscript.drawable import Rect
+from visuscript.primatives import Transform
+from visuscript.animation import animate_transform, animate_transforms, bundle
+
+N = 10_000
+DURATION = 1
+
+
+def main():
+    targets = [Transform([i, i], 2, 90) for i in range(N)]
+
+    rects = [Rect(1, 1) for _ in range(N)]
+    start = time.perf_counter()
+    bundle(*(animate_transform(rect.transform, target, duration=DURATION) for rect, target in zip(rects, targets))).finish()
+    separate = time.perf_counter() - start
+
+    rects = [Rect(1, 1) for _ in range(N)]
+    start = time.perf_counter()
+    animate_transforms([rect.transform for rect in rects], targets, duration=DURATION).finish()
+    batched = time.perf_counter() - start
+
+    print(f"Animated {N} transforms for {DURATION} s")
+    print(f"One animation each: {separate:.2f} s")
+    print(f"One batch:          {batched:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
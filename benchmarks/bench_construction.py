@@ -0,0 +1,30 @@
+"""Measures the time and allocations needed to construct many drawables.
+
+Run from the repository root with ``python -m benchmarks.bench_construction``.
+"""
+
+import time
+import tracemalloc
+
+from visuscript.drawable import Rect
+
+N = 100_000
+
+
+def main():
+    start = time.perf_counter()
+    rects = [Rect(10, 10) for _ in range(N)]
+    seconds = time.perf_counter() - start
+    del rects
+
+    tracemalloc.start()
+    rects = [Rect(10, 10) for _ in range(N)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Constructed {N} Rects in {seconds:.2f} s")
+    print(f"Memory held: {current / N:.0f} bytes per Rect")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Measures the cost of finishing a long animation, by generating each frame and by random access.
+
+Run from the repository root with ``python -m benchmarks.bench_finish``.
+"""
+
+import timeit
+
+from visuscript import Rect
+from visuscript.animation import Animation, sequence, bundle, animate_translation, animate_opacity
+
+N = 200
+DURATION = 2
+
+
+def build() -> Animation:
+    rects = [Rect(1, 1) for _ in range(N)]
+    return sequence(
+        bundle(animate_translation(rect.transform, [i, i], duration=DURATION) for i, rect in enumerate(rects)),
+        bundle(animate_opacity(rect, 0.5, duration=DURATION) for rect in rects),
+    )
+
+
+def main():
+    def by_frames():
+        animation = build()
+        while animation.next_frame():
+            pass
+
+    def by_random_access():
+        build().finish()
+
+    for name, function in (("Frame by frame", by_frames), ("Random access", by_random_access)):
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f"{name}: {seconds * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Measures the cost of moving the root of a large hierarchy and then drawing it.
+
+Run from the repository root with ``python -m benchmarks.bench_hierarchy``.
+"""
+
+import time
+
+from visuscript.drawable import Rect
+
+N = 1_000
+WRITES = 1_000
+FRAMES = 100
+
+
+def main():
+    root = Rect(10, 10)
+    for _ in range(N):
+        root.add_child(Rect(10, 10))
+
+    start = time.perf_counter()
+    for i in range(WRITES):
+        root.translate(i)
+    seconds = time.perf_counter() - start
+    print(f"Translated a root with {N} children {WRITES} times in {seconds * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    for i in range(FRAMES):
+        for _ in range(10):
+            root.translate(i)
+        root.draw()
+    seconds = time.perf_counter() - start
+    print(f"Drew {FRAMES} frames, each after 10 translations, in {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
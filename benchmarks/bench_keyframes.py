@@ -0,0 +1,35 @@
+"""Measures the per-frame cost of evaluating keyframed interpolations.
+
+Run from the repository root with ``python -m benchmarks.bench_keyframes``.
+"""
+
+import timeit
+
+from visuscript.primatives import Vec2
+from visuscript.animation.interpolation import interpolate, compile_track
+
+N = 100_000
+KEYFRAMES = ((Vec2(0, 0), 0.0), (Vec2(10, 5), 0.25), (Vec2(-3, 8), 0.5), (Vec2(4, 4), 0.75), (Vec2(1, 1), 1.0))
+
+
+def main():
+    first, *rest = KEYFRAMES
+    alphas = [i / N for i in range(N)]
+
+    def uncompiled():
+        for alpha in alphas:
+            interpolate(alpha, first, *rest)
+
+    track = compile_track(interpolate, first, *rest)
+
+    def compiled():
+        for alpha in alphas:
+            track(alpha)
+
+    for name, function in (("Uncompiled", uncompiled), ("Compiled", compiled)):
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f"{name}: {seconds / N * 1e6:.2f} us per frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Measures the cost of building and evaluating LazyObject attribute chains.
+
+Run from the repository root with ``python -m benchmarks.bench_lazy_object``.
+"""
+
+import timeit
+
+from visuscript import Transform
+from visuscript.lazy_object import LazyObject, make_lazy
+
+N = 100_000
+DEPTH = 2_000
+
+
+class Node:
+    def __init__(self):
+        self.next = self
+
+
+def main():
+    transforms = [Transform() for _ in range(N)]
+    lazies = [make_lazy(transform).translation for transform in transforms]
+
+    def build():
+        for transform in transforms:
+            make_lazy(transform).translation
+
+    def evaluate():
+        for lazy in lazies:
+            lazy.evaluate_lazy_object()  # type: ignore[reportAttributeAccessIssue]
+
+    def build_deep():
+        lazy = LazyObject(Node())
+        for _ in range(DEPTH):
+            lazy = lazy.next
+        lazy.evaluate_lazy_object()
+
+    for name, function, count in (
+        ("Build", build, N),
+        ("Evaluate", evaluate, N),
+        (f"Build and evaluate depth {DEPTH}", build_deep, 1),
+    ):
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f"{name}: {seconds / count * 1e6:.2f} us each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Measures the cost of building a large bundle of animations, which merges the PropertyLocker of every animation into it,
+and of checking it for conflicts with an updater.
+
+Run from the repository root with ``python -m benchmarks.bench_locker``.
+"""
+
+import timeit
+
+from visuscript import Transform
+from visuscript.animation import Animation, bundle, sequence, animate_translation
+from visuscript.drawable.scene import _check_conflicts  # type: ignore[reportPrivateUsage]
+from visuscript.updater import TranslationUpdater
+
+N = 50_000
+
+
+def main():
+    transforms = [Transform() for _ in range(N)]
+    animations: list[Animation] = [animate_translation(transform, [1, 1]) for transform in transforms]
+
+    def flat():
+        return bundle(*animations)
+
+    def nested():
+        return bundle(*(sequence(bundle(sequence(animation))) for animation in animations))
+
+    built = flat()
+    updater = TranslationUpdater(Transform(), Transform())
+
+    def check():
+        _check_conflicts(built, updater)
+        _check_conflicts(updater, built)
+
+    for name, function in (("Flat bundle", flat), ("Nested bundle", nested), ("Conflict check", check)):
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f"{name}: {seconds * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
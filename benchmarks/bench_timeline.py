@@ -0,0 +1,36 @@
+"""Measures the per-frame cost of running nested sequences and bundles directly and through a Timeline.
+
+Run from the repository root with ``python -m benchmarks.bench_timeline``.
+"""
+
+import timeit
+
+from visuscript.animation import Animation, Timeline, sequence, bundle, wait
+from visuscript.config import config
+
+N = 2000
+DURATION = 2
+
+
+def build() -> Animation:
+    frame = 1 / config.fps
+    return bundle(
+        wait(DURATION),
+        *(sequence(bundle(sequence(wait(frame))), wait(frame)) for _ in range(N)),
+    )
+
+
+def main():
+    frames = config.fps * DURATION
+
+    def run(animation: Animation):
+        while animation.next_frame():
+            pass
+
+    for name, wrap in (("Direct", lambda animation: animation), ("Timeline", Timeline)):
+        seconds = min(timeit.repeat(lambda: run(wrap(build())), number=1, repeat=3))
+        print(f"{name}: {seconds / frames * 1e3:.2f} ms per frame")
+
+
+if __name__ == "__main__":
+    main()
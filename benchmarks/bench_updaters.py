@@ -0,0 +1,45 @@
+"""Measures the cost of running many high-rate updaters in an UpdaterBundle, one frame at a time,
+against making each of their updates one at a time.
+
+Run from the repository root with ``python -m benchmarks.bench_updaters``.
+"""
+
+import timeit
+
+from visuscript import Transform
+from visuscript.config import config
+from visuscript.updater import TranslationUpdater, UpdaterBundle
+
+N = 1_000
+RATE = 1_000
+FRAMES = 30
+
+
+def _updaters() -> list[TranslationUpdater]:
+    return [
+        TranslationUpdater(Transform(), Transform(translation=[1_000, i]), max_speed=100).set_update_rate(RATE)
+        for i in range(N)
+    ]
+
+
+def main():
+    def stepped():
+        updaters = _updaters()
+        steps = RATE // config.fps
+        for frame in range(FRAMES):
+            for updater in updaters:
+                for step in range(steps):
+                    updater.update((frame * steps + step) / RATE, 1 / RATE)
+
+    def scheduled():
+        bundle = UpdaterBundle(*_updaters())
+        for _ in range(FRAMES):
+            bundle.update_for_frame()
+
+    for name, function in (("One update at a time", stepped), ("Scheduled", scheduled)):
+        seconds = min(timeit.repeat(function, number=1, repeat=3))
+        print(f"{name}: {seconds * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compares the specialized :class:`~visuscript.primatives.Vec2` with the generic, array-backed ``ArrayVec``.
+
+Run from the repository root with ``python -m benchmarks.bench_vec2``.
+"""
+
+import timeit
+
+from visuscript.primatives.primatives import ArrayVec, Vec2
+from visuscript.drawable import Rect
+from visuscript.primatives.shape import Shape
+from visuscript.primatives import Transform
+
+NUMBER = 100_000
+
+
+def _report(name: str, seconds: float, baseline: float | None = None):
+    per_call = seconds / NUMBER * 1e6
+    speedup = f"  ({baseline / seconds:.1f}x faster than ArrayVec)" if baseline else ""
+    print(f"{name:<32}{per_call:8.3f} us{speedup}")
+
+
+def main():
+    for name, statement in [
+        ("arithmetic", "(a + b) * 2 - b / 3"),
+        ("interpolation", "a.interpolate(b, 0.25)"),
+        ("matrix multiplication", "m @ a"),
+    ]:
+        generic = timeit.timeit(
+            statement,
+            setup="a = ArrayVec(1.0, 2.0); b = ArrayVec(3.0, 4.0); m = [[0.0, -1.0], [1.0, 0.0]]",
+            globals={"ArrayVec": ArrayVec},
+            number=NUMBER,
+        )
+        specialized = timeit.timeit(
+            statement,
+            setup="a = Vec2(1.0, 2.0); b = Vec2(3.0, 4.0); m = [[0.0, -1.0], [1.0, 0.0]]",
+            globals={"Vec2": Vec2},
+            number=NUMBER,
+        )
+        _report(f"ArrayVec {name}", generic)
+        _report(f"Vec2 {name}", specialized, generic)
+
+    rect = Rect(20, 10)
+    transform = Transform([10, 20], [2, 3], 30)
+    _report(
+        "Shape construction",
+        timeit.timeit(lambda: Shape(rect, transform), number=NUMBER),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import math
+import pytest
 from . import run_for, number_of_frames, MockAnimation
 from tests.primatives import rgb_diff
 from visuscript import Color, Rgb, Circle
@@ -36,4 +38,212 @@ def test_flash():
     run_for(animation, 1)
     # assert rgb_diff(circle.stroke.rgb, Rgb(50, 50, 50)) < 4
     run_for(animation, 1)
-    assert rgb_diff(circle.stroke.rgb, Rgb(0, 0, 0)) == 0
\ No newline at end of file
+    assert rgb_diff(circle.stroke.rgb, Rgb(0, 0, 0)) == 0
+
+def test_total_frames_matches_frames_generated():
+    from visuscript.animation import (
+        wait, run, sequence, bundle, animate_translation, animate_transform,
+        animate_transforms, fade_in, flash, quadratic_swap, animate_path,
+    )
+    from visuscript import Rect, Transform
+    from visuscript.segment import Path
+
+    def animations():
+        rect, other = Rect(1, 1), Rect(1, 1).translate(5)
+        yield wait(0.5)
+        yield run(lambda: None)
+        yield animate_translation(rect.transform, [10, 0], duration=0.3)
+        yield animate_transform(rect.transform, Transform([1, 1], 2, 45), duration=0.2)
+        yield animate_transforms([rect.transform], [Transform([1, 1])], duration=0.4)
+        yield fade_in(rect.fill, duration=0.1)
+        yield flash(rect.fill, "red", duration=0.2)
+        yield quadratic_swap(rect, other, duration=0.3)
+        yield animate_path(rect.transform, Path().M(0, 0).L(10, 10), duration=0.2)
+        yield sequence(wait(0.5), animate_translation(rect.transform, [1, 0], duration=0.2))
+        yield bundle(wait(0.5), animate_translation(rect.transform, [1, 0], duration=1))
+        yield sequence(wait(1), bundle(wait(0.2), wait(0.4))).set_speed(4)
+        yield wait(1).compress()
+        yield bundle()
+
+    for animation in animations():
+        expected = animation.total_frames
+        assert expected is not None, animation
+        assert number_of_frames(animation) == expected, animation
+
+
+def test_total_frames_is_none_when_unknown():
+    from visuscript.animation import sequence, bundle, wait
+
+    assert MockAnimation(3).total_frames is None
+    assert sequence(wait(1), MockAnimation(3)).total_frames is None
+    assert bundle(wait(1), MockAnimation(3)).total_frames is None
+
+
+def test_total_frames_accounts_for_speed():
+    from visuscript.animation import wait
+    from visuscript.config import config
+
+    assert wait(1).total_frames == config.fps
+    assert wait(1).set_speed(7).total_frames == config.fps // 7
+
+
+def _random_access_scene():
+    from visuscript.animation import (
+        sequence, bundle, wait, animate_translation, animate_transform, animate_opacity,
+        animate_transforms, animate_path, quadratic_swap,
+    )
+    from visuscript import Rect, Transform
+    from visuscript.segment import Path
+
+    a, b, c = Rect(1, 1), Rect(1, 1).translate(5, 0), Rect(1, 1).translate(0, 5)
+    animation = sequence(
+        animate_translation(a.transform, [10, 0], duration=0.3),
+        bundle(
+            animate_transform(a.transform, Transform([0, 10], 2, 90), duration=0.5),
+            sequence(wait(0.1), animate_opacity(b, 0.5, duration=0.2)).set_speed(2),
+            animate_transforms([c.transform], [Transform([3, 3], 3)], duration=0.4),
+        ),
+        quadratic_swap(b, c, duration=0.2),
+        animate_path(a.transform, Path().M(0, 0).L(10, 10), duration=0.2).compress(),
+        wait(0.1),
+    )
+
+    def state():
+        return [
+            value
+            for rect in (a, b, c)
+            for value in (*rect.transform.translation, *rect.transform.scale, rect.transform.rotation, rect.opacity)
+        ]
+
+    return animation, state
+
+
+def test_at_matches_frames_generated():
+    animation, state = _random_access_scene()
+    total_frames = animation.total_frames
+    assert total_frames is not None
+
+    expected = [state()]
+    while animation.next_frame():
+        expected.append(state())
+    expected.append(state())
+    assert len(expected) == total_frames + 2
+
+    for frame in [0, 1, 5, 9, 10, 11, 20, total_frames - 1, total_frames]:
+        random_access, random_access_state = _random_access_scene()
+        random_access.at(frame)
+        assert random_access_state() == pytest.approx(expected[frame]), frame
+    random_access.at(total_frames + 10)
+    assert random_access_state() == pytest.approx(expected[-1])
+
+
+def test_at_seeks_backwards():
+    animation, state = _random_access_scene()
+    animation.at(15)
+    seeked = state()
+    animation.at(22)
+    animation.at(15)
+    assert state() == pytest.approx(seeked)
+
+
+def test_finish_evaluates_last_frame_directly():
+    from visuscript.animation import construct
+
+    expected, expected_state = _random_access_scene()
+    expected.finish()
+
+    animation, state = _random_access_scene()
+    animation.next_frame()
+    animation.finish()
+    assert state() == pytest.approx(expected_state())
+    assert not animation.next_frame()
+
+    advances: list[int] = []
+    def advancer(frame: int):
+        advances.append(frame)
+        return None if frame == 100 else frame + 1
+    evaluations: list[int] = []
+    construct(advancer, 0, total_frames=100, evaluator=evaluations.append).finish()
+    assert advances == []
+    assert evaluations == [100]
+
+
+def test_at_requires_random_access():
+    from visuscript.animation import run, sequence, wait
+
+    with pytest.raises(NotImplementedError):
+        run(lambda: None).at(0)
+    with pytest.raises(NotImplementedError):
+        sequence(wait(1), MockAnimation(3)).at(0)
+    with pytest.raises(ValueError):
+        wait(1).at(-1)
+
+
+def test_fractional_speed_total_frames():
+    from visuscript.animation import wait, sequence, animate_opacity
+    from visuscript import Rect
+
+    for speed in [0.5, 2 / 3, 1.5, 2.5, 0.1]:
+        assert number_of_frames(MockAnimation(17).set_speed(speed)) == math.ceil(18 / speed) - 1, speed
+        for make in (lambda: wait(0.5), lambda: sequence(wait(0.2), animate_opacity(Rect(1, 1), 0.0, duration=0.3))):
+            expected = make().set_speed(speed).total_frames
+            assert number_of_frames(make().set_speed(speed)) == expected, speed
+
+
+def test_fractional_speed_interpolates_between_frames():
+    from visuscript.animation import animate_translation
+    from visuscript.animation.easing import linear_easing
+    from visuscript import Transform
+    from visuscript.config import config
+
+    transform = Transform()
+    animation = animate_translation(transform, [config.fps, 0], duration=1, easing_function=linear_easing).set_speed(0.5)
+    animation.next_frame()
+    assert transform.translation.x == pytest.approx(0.5)
+    animation.next_frame()
+    assert transform.translation.x == pytest.approx(1)
+    animation.finish()
+    assert transform.translation.x == pytest.approx(config.fps)
+
+    held = MockAnimation(3).set_speed(0.5)
+    assert [held.next_frame(), held.actual_advances] == [True, 0]
+    assert [held.next_frame(), held.actual_advances] == [True, 1]
+
+
+def test_time_based_evaluation():
+    from visuscript.animation import animate_translation
+    from visuscript.animation.easing import linear_easing
+    from visuscript import Transform
+
+    transform = Transform()
+    animation = animate_translation(transform, [10, 0], duration=2, easing_function=linear_easing).set_speed(0.5)
+    assert animation.duration == pytest.approx(4)
+    animation.at_time(1)
+    assert transform.translation.x == pytest.approx(2.5)
+    animation.at_time(10)
+    assert transform.translation.x == pytest.approx(10)
+
+
+def test_resample():
+    from visuscript.animation import animate_translation, run
+    from visuscript.animation.easing import linear_easing
+    from visuscript import Transform
+    from visuscript.config import config
+
+    transform = Transform()
+    animation = animate_translation(transform, [10, 0], duration=1, easing_function=linear_easing)
+    resampled = animation.resample(config.fps * 2)
+    assert resampled.total_frames == config.fps * 2
+    xs: list[float] = []
+    while resampled.next_frame():
+        xs.append(transform.translation.x)
+    assert len(xs) == config.fps * 2
+    assert xs[config.fps - 1] == pytest.approx(5)
+    assert xs[0] == pytest.approx(10 / config.fps / 2)
+    assert xs[-1] == 10
+
+    preview = animate_translation(Transform(), [10, 0], duration=1).resample(10)
+    assert number_of_frames(preview) == preview.total_frames == 10
+
+    with pytest.raises(NotImplementedError):
+        run(lambda: None).resample(10)
@@ -19,6 +19,21 @@ def test_translate():
     rect.transform.translation.y == pytest.approx(75)
 
 
+def test_path_and_wait_evaluate_fractional_frames():
+    from visuscript.segment import Path
+    from visuscript.animation.easing import linear_easing
+
+    rect = Rect(5)
+    animation = an.animate_path(rect.transform, Path().M(0, 0).L(100, 0), duration=1, easing_function=linear_easing)
+    animation.at(config.fps / 4 + 0.5)
+    assert rect.transform.translation.x == pytest.approx(100 * (config.fps / 4 + 0.5) / config.fps)
+    animation.set_speed(0.5)
+    animation.at(1.5)
+    assert rect.transform.translation.x == pytest.approx(100 * 0.75 / config.fps)
+
+    an.wait(1).at(2.5)
+
+
 
 
 
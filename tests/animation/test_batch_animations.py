@@ -0,0 +1,65 @@
+import pytest
+
+from visuscript import Rect
+from visuscript.animation import (
+    animate_transform,
+    animate_transforms,
+    animate_opacities,
+    animate_rgbs,
+    bundle,
+)
+from visuscript.primatives import Transform, Vec2, Rgb
+from visuscript.property_locker import LockedPropertyError
+
+
+def test_matches_animate_transform_on_every_frame():
+    targets = [Transform([10, -4], 2, 90), Transform([3, 3], [0.5, 1.5], -45)]
+    batch_rects = [Rect(1, 1).translate(1, 2), Rect(1, 1)]
+    single_rects = [Rect(1, 1).translate(1, 2), Rect(1, 1)]
+
+    batch = animate_transforms([r.transform for r in batch_rects], targets, duration=0.5)
+    singles = bundle(*(animate_transform(r.transform, target, duration=0.5) for r, target in zip(single_rects, targets)))
+
+    while singles.next_frame():
+        assert batch.next_frame()
+        for a, b in zip(batch_rects, single_rects):
+            assert [*a.transform.translation] == pytest.approx([*b.transform.translation])
+            assert [*a.transform.scale] == pytest.approx([*b.transform.scale])
+            assert a.transform.rotation == pytest.approx(b.transform.rotation)
+    assert not batch.next_frame()
+    assert batch_rects[0].transform.translation == Vec2(10, -4)
+
+
+def test_start_state_is_read_on_first_advance():
+    rect = Rect(1, 1)
+    animation = animate_transforms([rect.transform], [Transform([10, 0])], duration=1)
+    rect.translate(0, 10)
+    animation.next_frame()
+    assert rect.transform.translation.y > 9
+    animation.finish()
+    assert rect.transform.translation == Vec2(10, 0)
+
+
+def test_locks_properties():
+    rect = Rect(1, 1)
+    animation = animate_transforms([rect.transform], [Transform()])
+    for prop in ("translation", "scale", "rotation"):
+        assert animation.locker.locks(rect.transform, prop)
+
+    with pytest.raises(LockedPropertyError):
+        animate_transforms([rect.transform, rect.transform], [Transform(), Transform()])
+    with pytest.raises(ValueError):
+        animate_transforms([rect.transform], [])
+
+
+def test_opacities_and_rgbs():
+    rects = [Rect(1, 1), Rect(1, 1)]
+    fills = [rect.fill for rect in rects]
+    animate_opacities(fills, [0.25, 0.75], duration=0.5).finish()
+    assert [fill.opacity for fill in fills] == [0.25, 0.75]
+
+    animation = animate_rgbs(fills, ["red", Rgb(0, 0, 255)], duration=0.5)
+    assert animation.locker.locks(fills[0], "rgb")
+    animation.finish()
+    assert fills[0].rgb == Rgb.construct("red")
+    assert fills[1].rgb == Rgb(0, 0, 255)
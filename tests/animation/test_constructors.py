@@ -177,3 +177,26 @@ def get_mock_interpolation(obj: MockObject, destination: float, num_frames: int)
         return state
     return construct(advance, state)
 
+
+
+def test_eased_alphas_do_not_keep_easing_functions_alive():
+    import gc
+    import math
+    import weakref
+
+    from visuscript.animation.constructors import eased_alphas
+
+    def make_easing(power: float):
+        return lambda alpha: alpha**power
+
+    easing = make_easing(2)
+    alphas = eased_alphas(easing, 4)
+    assert alphas == (1 / 16, 1 / 4, 9 / 16, 1)
+    assert eased_alphas(easing, 4) is alphas
+
+    reference = weakref.ref(easing)
+    del easing
+    gc.collect()
+    assert reference() is None
+
+    assert eased_alphas(math.sqrt, 4) == (0.5, math.sqrt(0.5), math.sqrt(0.75), 1)
@@ -1,6 +1,6 @@
 import pytest
 from . import WFloat
-from visuscript.animation.interpolation import linearly_interpolate, keyframe, interpolate
+from visuscript.animation.interpolation import linearly_interpolate, cattmul_rom_interpolate, keyframe, interpolate, compile_track
 
 
 
@@ -52,3 +52,41 @@ def test_interpolate():
         keyframe(WFloat(0), 0.0),
         keyframe(WFloat(-5), 0.5),
         keyframe(WFloat(11), 1.0)).get_interpolated_object() == pytest.approx(11)
+
+
+@pytest.mark.parametrize("function", [linearly_interpolate, cattmul_rom_interpolate])
+@pytest.mark.parametrize("alphas", [
+    (0.0,),
+    (0.0, 1.0),
+    (0.0, 0.5, 1.0),
+    (0.0, 0.2, 0.2, 0.7, 1.0),
+    (0.1, 0.3, 0.9),
+])
+def test_compiled_track_matches_interpolation(function, alphas):
+    values = [WFloat(v) for v in (3, -5, 11, 2, 7)]
+    first, *rest = [keyframe(value, alpha) for value, alpha in zip(values, alphas)]
+    track = compile_track(function, first, *rest)
+    for i in range(-2, 103):
+        alpha = i / 100
+        if function is cattmul_rom_interpolate and len(rest) > 1 and alpha > alphas[-1]:
+            # Beyond the last keyframe, the original indexes past its padding.
+            continue
+        expected = function(alpha, first, *rest).get_interpolated_object()
+        assert track(alpha).get_interpolated_object() == pytest.approx(expected)
+
+
+def test_compiled_track_has_exact_endpoints():
+    first = keyframe(WFloat(0.1), 0.0)
+    rest = (keyframe(WFloat(0.7), 0.5), keyframe(WFloat(0.3), 1.0))
+    track = compile_track(interpolate, first, *rest)
+    assert track(0).get_interpolated_object() == 0.1
+    assert track(0.5).get_interpolated_object() == 0.7
+    assert track(1).get_interpolated_object() == 0.3
+    assert track(1.2).get_interpolated_object() == 0.3
+
+
+def test_compiled_track_falls_back_to_other_functions():
+    def constant(alpha, first_keyframe, *keyframes):
+        return WFloat(42)
+    track = compile_track(constant, keyframe(WFloat(0), 0.0), keyframe(WFloat(1), 1.0))
+    assert track(0.5) == 42
@@ -0,0 +1,79 @@
+import random
+
+from visuscript.animation import Animation, Timeline, sequence, bundle, wait, animate_opacity
+from visuscript import Rect
+
+
+class LoggingAnimation(Animation):
+    def __init__(self, name: str, num_advances: int, log: list[str]):
+        super().__init__()
+        self._name = name
+        self._remaining = num_advances
+        self._log = log
+
+    def advance(self) -> bool:
+        self._log.append(self._name)
+        if self._remaining == 0:
+            return False
+        self._remaining -= 1
+        return True
+
+
+def random_tree(rng: random.Random, log: list[str], depth: int = 0) -> Animation:
+    if depth > 3 or rng.random() < 0.3:
+        return LoggingAnimation(f"{depth}-{rng.random()}", rng.randint(0, 5), log)
+    children = [random_tree(rng, log, depth + 1) for _ in range(rng.randint(0, 4))]
+    animation = sequence(*children) if rng.random() < 0.5 else bundle(*children)
+    if rng.random() < 0.2:
+        animation.set_speed(2)
+    return animation
+
+
+def frame_logs(animation: Animation, log: list[str]) -> list[list[str]]:
+    frames: list[list[str]] = []
+    while True:
+        more = animation.next_frame()
+        frames.append(log[:])
+        log.clear()
+        if not more:
+            break
+    for _ in range(3):
+        animation.next_frame()
+    frames.append(log[:])
+    return frames
+
+
+def test_timeline_generates_same_frames_as_tree():
+    for seed in range(200):
+        expected_log: list[str] = []
+        expected = frame_logs(random_tree(random.Random(seed), expected_log), expected_log)
+        actual_log: list[str] = []
+        actual = frame_logs(Timeline(random_tree(random.Random(seed), actual_log)), actual_log)
+        assert actual == expected, seed
+
+
+def test_timeline_advances_only_running_leaves():
+    log: list[str] = []
+    long = LoggingAnimation("long", 10, log)
+    timeline = Timeline(bundle(long, *(LoggingAnimation(str(i), 1, log) for i in range(50))))
+    timeline.next_frame()
+    timeline.next_frame()
+    assert timeline.num_running == 1
+    log.clear()
+    timeline.next_frame()
+    assert log == ["long"]
+
+
+def test_timeline_runs_opaque_nodes_as_leaves():
+    rect = Rect(1, 1)
+    inner = sequence(wait(0.1), animate_opacity(rect, 0.0, duration=0.2)).set_speed(3)
+    timeline = Timeline(sequence(inner, wait(0.1)))
+    assert len(timeline) == 3
+    assert timeline.total_frames == inner.total_frames + wait(0.1).total_frames
+    timeline.finish()
+    assert rect.opacity == 0.0
+
+
+def test_empty_timeline():
+    assert not Timeline(bundle()).next_frame()
+    assert not Timeline(sequence(bundle(), sequence())).next_frame()
@@ -0,0 +1,85 @@
+from visuscript.primatives import Transform, Vec2, Vec2Array, TransformArray
+from visuscript.drawable import Rect
+from visuscript.organizer import GridOrganizer
+from visuscript.math_utility import magnitude
+import numpy as np
+import pytest
+
+
+def test_vec2_array_arithmetic():
+    a = Vec2Array([[1, 2], [3, 4]])
+    b = Vec2Array([[10, 20], [30, 40]])
+
+    assert a + b == Vec2Array([[11, 22], [33, 44]])
+    assert b - a == Vec2Array([[9, 18], [27, 36]])
+    assert a * 2 == Vec2Array([[2, 4], [6, 8]])
+    assert a + Vec2(1, -1) == Vec2Array([[2, 1], [4, 3]])
+    assert 1 - a == Vec2Array([[0, -1], [-2, -3]])
+    assert a[1] == Vec2(3, 4)
+    assert [*a] == [Vec2(1, 2), Vec2(3, 4)]
+
+
+def test_vec2_array_division_by_zero_raises_error():
+    with pytest.raises(FloatingPointError):
+        Vec2Array([[1, 2]]) / Vec2(0, 1)
+
+
+def test_vec2_array_shape_is_validated():
+    with pytest.raises(ValueError):
+        Vec2Array([1, 2, 3])
+    assert len(Vec2Array([])) == 0
+
+
+def test_vec2_array_interpolation():
+    a = Vec2Array([[0, 0], [0, 0]])
+    b = Vec2Array([[10, 20], [10, 20]])
+
+    assert a.interpolate(b, 0.5) == Vec2Array([[5, 10], [5, 10]])
+    assert a.interpolate(b, [0, 1]) == Vec2Array([[0, 0], [10, 20]])
+
+
+def test_transform_array_matches_transforms():
+    transforms = [
+        Transform(Vec2(1, 2), Vec2(3, 4), 30),
+        Transform(Vec2(-5, 6), 2, -120),
+    ]
+    parent = Transform(Vec2(10, 20), Vec2(2, 3), 45)
+
+    composed = TransformArray.gather(transforms).composed(parent)
+    for transform, expected in zip(composed, (parent @ t for t in transforms)):
+        assert magnitude(transform.translation - expected.translation) < 1e-9
+        assert magnitude(transform.scale - expected.scale) < 1e-9
+        assert transform.rotation == pytest.approx(expected.rotation)
+
+    vecs = Vec2Array([[1, 2], [-3, 4]])
+    for vec, expected in zip(vecs.transformed(parent), (parent @ v for v in vecs)):
+        assert magnitude(vec - expected) < 1e-9
+
+
+def test_transform_array_interpolation():
+    start = TransformArray([[0, 0]], [[1, 1]], [0])
+    end = TransformArray([[10, 20]], [[3, 3]], [90])
+
+    middle = start.interpolate(end, 0.5)[0]
+    assert middle.translation == Vec2(5, 10)
+    assert middle.scale == Vec2(2, 2)
+    assert middle.rotation == 45
+
+
+def test_scatter_and_gather():
+    rects = [Rect(1, 1), None, Rect(1, 1)]
+    TransformArray([[1, 2], [3, 4], [5, 6]], rotations=[10, 20, 30]).scatter(rects)
+
+    assert rects[0].transform.translation == Vec2(1, 2)
+    assert rects[2].transform.translation == Vec2(5, 6)
+    assert rects[2].transform.rotation == 30
+
+    gathered = TransformArray.gather([rects[0], rects[2]])
+    assert np.array_equal(gathered.rotations, [10, 30])
+
+
+def test_grid_organizer_transform_array_matches_transform_for():
+    organizer = GridOrganizer((3, 4), (10, 20))
+    transforms = organizer.transform_array_for(len(organizer))
+    for i, transform in enumerate(transforms):
+        assert transform.translation == organizer.transform_for(i).translation
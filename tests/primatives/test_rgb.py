@@ -1,4 +1,6 @@
-from visuscript.primatives.primatives import Rgb
+from visuscript.primatives.primatives import Rgb, PALETTE
+import copy
+import pytest
 
 
 def test_init():
@@ -23,3 +25,32 @@ def test_multiplication():
 def test_saturating_operations():
     assert Rgb(255, 255, 255) + Rgb(1, 2, 3) == Rgb(255, 255, 255)
     assert Rgb(0, 0, 0) - Rgb(1, 2, 3) == Rgb(0, 0, 0)
+
+
+def test_interning():
+    assert Rgb(1, 2, 3) is Rgb(1, 2, 3)
+    assert Rgb(0, 0, 0).interpolate(Rgb(2, 4, 6), 0.5) is Rgb(1, 2, 3)
+    assert Rgb.construct("off_white") is PALETTE["off_white"]
+    assert Rgb.construct((245, 245, 220)) is PALETTE["off_white"]
+    assert copy.deepcopy(Rgb(1, 2, 3)) is Rgb(1, 2, 3)
+
+
+def test_hashable():
+    assert {Rgb(1, 2, 3): "a"}[Rgb(1, 2, 3)] == "a"
+    assert len({Rgb(1, 2, 3), Rgb(1, 2, 3), Rgb(3, 2, 1)}) == 2
+
+
+def test_immutable():
+    with pytest.raises(AttributeError):
+        Rgb(1, 2, 3).r = 4  # type: ignore
+
+
+def test_svg():
+    assert Rgb(255, 0, 16).svg == "#ff0010"
+
+
+def test_invalid_values_raise_error():
+    with pytest.raises(ValueError):
+        Rgb(256, 0, 0)
+    with pytest.raises(ValueError):
+        Rgb(0, -1, 0)
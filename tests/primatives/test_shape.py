@@ -0,0 +1,25 @@
+from visuscript.primatives import Shape, Transform, Vec2
+from visuscript.drawable import Rect
+from visuscript.constants import Anchor
+from visuscript.math_utility import magnitude
+
+
+def test_points_are_transformed():
+    rect = Rect(20, 10).set_anchor(Anchor.TOP_LEFT)
+    transform = Transform(Vec2(1, 2), Vec2(2, 3), 90)
+    shape = Shape(rect, transform)
+
+    assert magnitude(shape.top_left - transform @ Vec2(0, 0)) < 1e-9
+    assert magnitude(shape.center - transform @ Vec2(10, 5)) < 1e-9
+    assert magnitude(shape.bottom_right - transform @ Vec2(20, 10)) < 1e-9
+    assert shape.width == 40
+    assert shape.height == 30
+
+
+def test_points_reflect_transform_at_construction():
+    rect = Rect(20, 10)
+    transform = Transform(Vec2(1, 2))
+    shape = Shape(rect, transform)
+    transform.translation = Vec2(100, 100)
+
+    assert shape.center == Vec2(1, 2)
@@ -1,5 +1,6 @@
 from visuscript.primatives.primatives import Transform, Vec2
 from visuscript.math_utility import magnitude
+from visuscript.config import config
 import pytest
 
 
@@ -29,6 +30,61 @@ def test_vec2_transformation():
     assert magnitude(transformed_vec - Vec2(13, 22)) < 1e-6
 
 
+def test_matrix_matches_vec2_transformation():
+    transform = Transform(Vec2(1, 2), Vec2(2, 3), 30)
+    a, b, c, d, e, f = transform.matrix
+    vec = Vec2(5, -3)
+    expected = transform @ vec
+    assert magnitude(Vec2(a * 5 + c * -3 + e, b * 5 + d * -3 + f) - expected) < 1e-9
+
+
+def test_matrix_is_invalidated_by_changes():
+    transform = Transform(Vec2(1, 2), Vec2(4, 4), 90)
+    assert transform.matrix is transform.matrix
+    transform.rotation = 0
+    assert transform.matrix == pytest.approx((4, 0, 0, 4, 1, 2))
+    transform.translation = Vec2(5, 6)
+    assert transform.matrix == pytest.approx((4, 0, 0, 4, 5, 6))
+    transform.scale = 2
+    assert transform.matrix == pytest.approx((2, 0, 0, 2, 5, 6))
+    transform.update(Transform(rotation=90))
+    assert magnitude(transform @ Vec2(1, 0) - Vec2(0, 1)) < 1e-9
+
+
+def test_set_components():
+    transform = Transform(Vec2(1, 2), Vec2(3, 4), 5)
+    assert transform.set_components(scale=2, rotation=90) is transform
+    assert transform.translation == Vec2(1, 2)
+    assert transform.scale == Vec2(2, 2)
+    assert transform.rotation == 90
+    assert magnitude(transform @ Vec2(1, 0) - Vec2(1, 4)) < 1e-9
+
+
+def test_svg_transform_omits_identity_parts():
+    assert Transform().svg_transform == "translate(0)"
+    assert Transform(Vec2(1.5, 0)).svg_transform == "translate(1.5)"
+    assert Transform(Vec2(1, 2), 3).svg_transform == "translate(1 2) scale(3)"
+    assert Transform(scale=Vec2(1, 2)).svg_transform == "scale(1 2)"
+    assert Transform(rotation=45).svg_transform == "rotate(45)"
+
+
+def test_svg_transform_uses_shorter_matrix():
+    assert Transform(Vec2(10, 20), Vec2(2, 3), 90).svg_transform == "matrix(0 3 -2 0 10 20)"
+    assert Transform(Vec2(10, 20), 1, 33).svg_transform == "translate(10 20) rotate(33)"
+
+
+def test_svg_transform_precision():
+    transform = Transform(Vec2(1 / 3, -1e-9), 1, 2 / 3)
+    previous_precision = config.svg_precision
+    try:
+        config.svg_precision = 2
+        assert transform.svg_transform == "translate(0.33) rotate(0.67)"
+        config.svg_precision = None
+        assert transform.svg_transform == f"translate({1 / 3} {-1e-9}) rotate({2 / 3})"
+    finally:
+        config.svg_precision = previous_precision
+
+
 # def test_inverse():
 #     transform = Transform(Vec2(1, 2), Vec2(2, 2), 90)
 #     t = transform.inv @ transform
@@ -42,3 +98,38 @@ def test_vec2_transformation():
 #     assert magnitude((t.translation - base.translation)) == pytest.approx(0)
 #     assert t.scale.x, t.scale.y == pytest.approx((base.scale.x, base.scale.y))
 #     assert t.rotation == pytest.approx(base.rotation)
+
+
+
+
+def test_discarded_drawables_are_collected():
+    from visuscript.drawable import Rect
+    from visuscript.animation import animate_transform, animate_translation
+    import gc
+    import tracemalloc
+    import weakref
+
+    shared = Transform(translation=[10, 10])
+    alive: "weakref.WeakSet[Rect]" = weakref.WeakSet()
+
+    def cycle():
+        for _ in range(100):
+            rect = Rect(10, 10)
+            follower = Rect(5, 5).set_transform(shared)
+            animate_transform(rect.transform, shared, duration=0.1).finish()
+            animate_translation(follower.transform, rect.transform.translation, duration=0.1).finish()
+            alive.add(rect)
+            alive.add(follower)
+        gc.collect()
+
+    tracemalloc.start()
+    for _ in range(3):
+        cycle()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for _ in range(20):
+        cycle()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(alive) == 0
+    assert current - baseline < 50_000
@@ -1,4 +1,4 @@
-from visuscript.primatives.primatives import Vec2
+from visuscript.primatives.primatives import ArrayVec, Vec, Vec2
 import pytest
 
 
@@ -31,3 +31,42 @@ def test_divide_by_zero_raises_error():
         Vec2(100, 2) / Vec2(1, 0)
     with pytest.raises(ZeroDivisionError):
         Vec2(100, 2) / Vec2(0, 0)
+
+
+def test_scalar_operations():
+    assert Vec2(1, 2) + 1 == Vec2(2, 3)
+    assert 10 - Vec2(1, 2) == Vec2(9, 8)
+    assert 2 * Vec2(1, 2) == Vec2(2, 4)
+    assert 4 / Vec2(1, 2) == Vec2(4, 2)
+    assert -Vec2(1, -2) == Vec2(-1, 2)
+
+
+def test_sequence_operations():
+    assert Vec2(1, 2) + [3, 4] == Vec2(4, 6)
+    assert [3, 4] - Vec2(1, 2) == Vec2(2, 2)
+    assert [*Vec2(1, 2)] == [1, 2]
+    assert Vec2(1, 2)[-1] == 2
+    with pytest.raises(ValueError):
+        Vec2(1, 2) + [1, 2, 3]
+
+
+def test_interpolation():
+    assert Vec2(0, 10).interpolate(Vec2(10, 20), 0.25) == Vec2(2.5, 12.5)
+
+
+def test_has_no_instance_dictionary():
+    assert not hasattr(Vec2(1, 2), "__dict__")
+
+
+def test_stores_only_its_own_components():
+    vec = Vec2(1, 2)
+    assert isinstance(vec, Vec)
+    assert not hasattr(vec, "_arr")
+    with pytest.raises(AttributeError):
+        vec._arr = None  # type: ignore
+
+
+def test_slicing_makes_an_array_vec():
+    assert isinstance(Vec2(1, 2)[:1], ArrayVec)
+    assert Vec2(1, 2)[:] == ArrayVec(1, 2)
+    assert ArrayVec(1, 2, 3)[1:] == Vec2(2, 3)
@@ -0,0 +1,48 @@
+from .base_class import VisuscriptTestCase
+from visuscript.config import config
+from visuscript.drawable import Rect
+from visuscript.drawable.text import Text
+from visuscript.primatives import Rgb
+from visuscript import Color
+
+
+class TestColorDefaults(VisuscriptTestCase):
+    def setUp(self):
+        self._element_fill = config.element_fill
+        self._text_fill = config.text_fill
+
+    def tearDown(self):
+        config.element_fill = self._element_fill
+        config.text_fill = self._text_fill
+
+    def test_default_is_captured_at_construction(self):
+        config.element_fill = Color("red", 0.5)
+        rect = Rect(10, 10)
+        config.element_fill = Color("blue", 1)
+        self.assertEqual(rect.fill.rgb, Rgb.construct("red"))
+        self.assertEqual(rect.fill.opacity, 0.5)
+
+    def test_fills_are_not_shared(self):
+        rect1 = Rect(10, 10)
+        rect2 = Rect(10, 10)
+        rect1.fill.rgb = "red"
+        self.assertIs(rect1.fill, rect1.fill)
+        self.assertNotEqual(rect2.fill.rgb, Rgb.construct("red"))
+        self.assertEqual(config.element_fill.rgb, rect2.fill.rgb)
+
+    def test_set_fill_before_access(self):
+        rect = Rect(10, 10).set_fill(Color("red", 0.25)).set_stroke("blue")
+        self.assertEqual(rect.fill.rgb, Rgb.construct("red"))
+        self.assertEqual(rect.fill.opacity, 0.25)
+        self.assertEqual(rect.stroke.rgb, Rgb.construct("blue"))
+        self.assertEqual(rect.stroke.opacity, 1)
+
+    def test_text_uses_text_fill(self):
+        config.text_fill = Color("red", 0.75)
+        text = Text("a")
+        self.assertEqual(text.fill.rgb, Rgb.construct("red"))
+        self.assertEqual(text.fill.opacity, 0.75)
+
+    def test_config_returns_copies(self):
+        config.element_fill.opacity = 0.125
+        self.assertNotEqual(config.element_fill.opacity, 0.125)
@@ -0,0 +1,92 @@
+import random
+
+from .base_class import VisuscriptTestCase
+from visuscript.drawable import Rect
+from visuscript.mixins import CompiledHierarchy
+from visuscript.primatives import Transform
+
+
+def random_tree(n: int, seed: int = 0) -> list[Rect]:
+    rng = random.Random(seed)
+    nodes: list[Rect] = []
+    for i in range(n):
+        node = Rect(1, 1)
+        node.transform = Transform(
+            [rng.uniform(-10, 10), rng.uniform(-10, 10)],
+            [rng.uniform(0.5, 2), rng.uniform(0.5, 2)],
+            rng.uniform(-180, 180),
+        )
+        node.opacity = rng.uniform(0.5, 1)
+        if i > 0:
+            nodes[rng.randrange(i)].add_child(node)
+        nodes.append(node)
+    return nodes
+
+
+class TestCompiledHierarchy(VisuscriptTestCase):
+    def test_parents_precede_children(self):
+        nodes = random_tree(50)
+        hierarchy = CompiledHierarchy([nodes[0]])
+        self.assertEqual(len(hierarchy), 50)
+        self.assertEqual(hierarchy.parent_indices[0], -1)
+        for i, node in enumerate(hierarchy.nodes[1:], start=1):
+            parent = hierarchy.parent_indices[i]
+            self.assertLess(parent, i)
+            self.assertIs(hierarchy.nodes[parent], node.parent)
+
+    def test_propagation_matches_global_transforms(self):
+        nodes = random_tree(50)
+        expected = [
+            (node.global_transform, node.global_opacity) for node in nodes
+        ]
+
+        hierarchy = CompiledHierarchy([nodes[0]])
+        hierarchy.update()
+        order = {id(node): i for i, node in enumerate(hierarchy.nodes)}
+        transforms = hierarchy.global_transforms
+        for node, (transform, opacity) in zip(nodes, expected):
+            i = order[id(node)]
+            self.assertVecAlmostEqual(transforms[i].translation, transform.translation)
+            self.assertVecAlmostEqual(transforms[i].scale, transform.scale)
+            self.assertAlmostEqual(transforms[i].rotation, transform.rotation)
+            self.assertAlmostEqual(hierarchy.global_opacities[i], opacity)
+            self.assertVecAlmostEqual(node.global_transform.translation, transform.translation)
+            self.assertAlmostEqual(node.global_opacity, opacity)
+
+    def test_written_back_values_stay_until_a_change(self):
+        parent = Rect(1, 1).translate(5)
+        child = Rect(1, 1)
+        parent.add_child(child)
+        hierarchy = CompiledHierarchy([parent])
+        hierarchy.update()
+
+        written = child.global_transform
+        self.assertIs(child.global_transform, written)
+        parent.translate(1)
+        self.assertVecAlmostEqual(child.global_transform.translation, [1, 0])
+
+    def test_structural_changes_are_recompiled(self):
+        parent = Rect(1, 1).translate(5)
+        child = Rect(1, 1).translate(0, 1)
+        hierarchy = CompiledHierarchy([parent])
+        self.assertEqual(len(hierarchy), 1)
+
+        parent.add_child(child)
+        self.assertTrue(hierarchy.is_stale())
+        hierarchy.update()
+        self.assertEqual(len(hierarchy), 2)
+        self.assertVecAlmostEqual(hierarchy.global_transforms[1].translation, [5, 1])
+
+    def test_root_with_outside_parent(self):
+        outside = Rect(1, 1).translate(3).set_opacity(0.5)
+        root = Rect(1, 1).translate(0, 3)
+        outside.add_child(root)
+        hierarchy = CompiledHierarchy([root])
+        hierarchy.update()
+        self.assertVecAlmostEqual(hierarchy.global_transforms[0].translation, [3, 3])
+        self.assertAlmostEqual(hierarchy.global_opacities[0], 0.5)
+
+    def test_empty(self):
+        hierarchy = CompiledHierarchy([])
+        hierarchy.update()
+        self.assertEqual(len(hierarchy), 0)
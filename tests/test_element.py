@@ -110,3 +110,53 @@ class TestElement(VisuscriptTestCase):
         child.translate(0, 100)
         self.assertVecAlmostEqual(child.global_transform.translation, Vec2(100, 100))
         self.assertVecAlmostEqual(parent.global_transform.translation, Vec2(100, 0))
+
+    def test_global_transform_follows_reparenting(self):
+        parent1 = self.MockElement(10, 10).translate(100)
+        parent2 = self.MockElement(10, 10).translate(0, 100)
+        child = self.MockElement(10, 10)
+        parent1.add_child(child)
+        self.assertVecAlmostEqual(child.global_transform.translation, Vec2(100, 0))
+        self.assertVecAlmostEqual(child.gshape.center, Vec2(100, 0))
+
+        parent2.add_child(child)
+        self.assertVecAlmostEqual(child.global_transform.translation, Vec2(0, 100))
+        self.assertVecAlmostEqual(child.gshape.center, Vec2(0, 100))
+
+        child.set_parent(None)
+        self.assertVecAlmostEqual(child.global_transform.translation, Vec2(0, 0))
+
+    def test_global_transform_is_recomputed_only_when_stale(self):
+        root = self.MockElement(10, 10)
+        node = root
+        for _ in range(10):
+            child = self.MockElement(10, 10).translate(1)
+            node.add_child(child)
+            node = child
+        leaf = node
+        sibling = self.MockElement(10, 10)
+        root.add_child(sibling)
+
+        first = leaf.global_transform
+        sibling.translate(5)
+        self.assertIs(leaf.global_transform, first)
+
+        root.translate(0, 7)
+        second = leaf.global_transform
+        self.assertIsNot(second, first)
+        self.assertVecAlmostEqual(second.translation, Vec2(10, 7))
+        self.assertIs(leaf.global_transform, second)
+
+    def test_global_opacity(self):
+        grandparent = self.MockElement(10, 10).set_opacity(0.5)
+        parent = self.MockElement(10, 10)
+        child = self.MockElement(10, 10).set_opacity(0.5)
+        grandparent.add_child(parent.add_child(child))
+        self.assertAlmostEqual(child.global_opacity, 0.25)
+
+        parent.opacity = 0.5
+        self.assertAlmostEqual(child.global_opacity, 0.125)
+
+        child.set_parent(None)
+        self.assertAlmostEqual(child.global_opacity, 0.5)
+        self.assertAlmostEqual(parent.global_opacity, 0.25)
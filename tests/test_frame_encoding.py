@@ -0,0 +1,95 @@
+from .base_class import VisuscriptTestCase
+from visuscript.drawable.scene import Scene
+from visuscript.drawable import Rect, Circle
+from visuscript.animation import animate_translation, animate_rotation
+from visuscript.frame_encoding import (
+    FrameEncoder,
+    FrameDecoder,
+    REPEAT_FRAME,
+    is_patch_frame,
+)
+
+
+def _frames(n: int) -> list[str]:
+    scene = Scene(print_initial=False)
+    rect = Rect(20, 20)
+    circle = Circle(5).translate(30, 0)
+    scene << [rect, circle]
+    animation = animate_translation(rect.transform, [40, 10], duration=n / 30)
+    frames = []
+    for _ in range(n):
+        animation.next_frame()
+        frames.append(scene.draw())
+    frames.append(scene.draw())
+    return frames
+
+
+class TestFrameEncoding(VisuscriptTestCase):
+    def test_roundtrip(self):
+        frames = _frames(10)
+        encoder = FrameEncoder(4)
+        decoder = FrameDecoder()
+        for frame in frames:
+            self.assertEqual(decoder.decode(encoder.encode(frame)), frame)
+
+    def test_patches_are_smaller_than_keyframes(self):
+        frames = _frames(5)
+        encoder = FrameEncoder(100)
+        encoded = [encoder.encode(frame) for frame in frames]
+        self.assertEqual(encoded[0], frames[0])
+        for frame, encoded_frame in zip(frames[1:-1], encoded[1:-1]):
+            self.assertTrue(is_patch_frame(encoded_frame))
+            self.assertLess(len(encoded_frame), len(frame))
+
+    def test_identical_frames_are_repeated(self):
+        frames = _frames(3)
+        encoder = FrameEncoder(100)
+        encoder.encode(frames[-1])
+        self.assertEqual(encoder.encode(frames[-1]), REPEAT_FRAME)
+
+    def test_keyframe_interval(self):
+        frames = _frames(9)
+        encoder = FrameEncoder(3)
+        for i, frame in enumerate(frames):
+            encoded_frame = encoder.encode(frame)
+            self.assertEqual(encoded_frame == frame, i % 3 == 0)
+
+    def test_structural_change_is_keyframe(self):
+        scene = Scene(print_initial=False)
+        scene << Rect(20, 20)
+        encoder = FrameEncoder(100)
+        encoder.encode(scene.draw())
+        scene << Circle(5)
+        frame = scene.draw()
+        self.assertEqual(encoder.encode(frame), frame)
+
+    def test_dependent_frame_before_keyframe_raises(self):
+        frames = _frames(2)
+        encoder = FrameEncoder(100)
+        encoder.encode(frames[0])
+        patch = encoder.encode(frames[1])
+        with self.assertRaises(ValueError):
+            FrameDecoder().decode(patch)
+        with self.assertRaises(ValueError):
+            FrameDecoder().decode(REPEAT_FRAME)
+
+    def test_text_changes_roundtrip(self):
+        frames = [
+            '<svg><text x="1">a</text></svg>',
+            '<svg><text x="2">bc</text></svg>',
+        ]
+        encoder = FrameEncoder(100)
+        decoder = FrameDecoder()
+        for frame in frames:
+            self.assertEqual(decoder.decode(encoder.encode(frame)), frame)
+
+    def test_rotation_roundtrip(self):
+        scene = Scene(print_initial=False)
+        rect = Rect(20, 20)
+        scene << rect
+        animation = animate_rotation(rect.transform, 90, duration=0.2)
+        encoder = FrameEncoder(30)
+        decoder = FrameDecoder()
+        while animation.next_frame():
+            frame = scene.draw()
+            self.assertEqual(decoder.decode(encoder.encode(frame)), frame)
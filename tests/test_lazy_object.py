@@ -51,6 +51,29 @@ class TestLazyObject(unittest.TestCase):
         self.assertEqual(lazy_a_a.evaluate_lazy_object().a, 14)
         self.assertEqual(a.a.a, 14)
 
+    def test_shared_prefixes(self):
+        a = A(A(1, 2), A(3, 4))
+        lazy_a = LazyObject(a).a
+        lazy_a_a, lazy_a_b = lazy_a.a, lazy_a.b
+        self.assertEqual(lazy_a_a.evaluate_lazy_object(), 1)
+        self.assertEqual(lazy_a_b.evaluate_lazy_object(), 2)
+        self.assertIs(lazy_a.evaluate_lazy_object(), a.a)
+        a.a = a.b
+        self.assertEqual(lazy_a_a.evaluate_lazy_object(), 3)
+        self.assertEqual(lazy_a_b.evaluate_lazy_object(), 4)
+
+    def test_consecutive_calls(self):
+        def adder(x):
+            return lambda y: x + y
+
+        a = A(adder, 2)
+        self.assertEqual(LazyObject(a).a(1)(2).evaluate_lazy_object(), 3)
+        self.assertEqual((-(LazyObject(a).b + 1) * 2).evaluate_lazy_object(), -6)
+
+    def test_evaluates_object_itself(self):
+        a = A()
+        self.assertIs(LazyObject(a).evaluate_lazy_object(), a)
+
 
 class A:
     def __init__(self, a=None, b=None, c=None):
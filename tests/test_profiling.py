@@ -0,0 +1,95 @@
+import gc
+import weakref
+
+from .base_class import VisuscriptTestCase
+from .test_scene import MockStream
+from .test_updater import MockUpdater
+from visuscript.config import config
+from visuscript.drawable.scene import Scene
+from visuscript.drawable import Rect
+from visuscript.animation import wait, sequence, animate_translation
+from visuscript.profiling import Profiler
+
+
+class TestProfiler(VisuscriptTestCase):
+    def setUp(self):
+        config.scene_output_stream = MockStream()
+
+    def test_measures_leaves_and_updaters_by_site(self):
+        with Profiler() as profiler:
+            self._measure_leaves_and_updaters_by_site(profiler)
+
+    def _measure_leaves_and_updaters_by_site(self, profiler: Profiler):
+        rect = Rect(1, 1)
+        updater = MockUpdater()
+        translation_line = _line() + 1
+        translations = [animate_translation(rect.transform, [i, 0], duration=1) for i in range(2)]
+
+        scene = Scene(print_initial=False, profiler=profiler)
+        scene.updaters << updater
+        scene.player << sequence(wait(0.5), *translations)
+
+        entries = {entry.kind: entry for entry in profiler.entries}
+        self.assertEqual(set(entries), {"_ConstructedAnimation", "_LazyAnimation", "MockUpdater"})
+
+        translation = entries["_LazyAnimation"]
+        self.assertEqual(translation.site, f"{__file__}:{translation_line}")
+        self.assertEqual(translation.instances, 2)
+        self.assertEqual(translation.calls, 2 * (config.fps + 1))
+        self.assertEqual(translation.modifications, 2 * config.fps)
+
+        self.assertEqual(entries["MockUpdater"].calls, updater.update_calls)
+        self.assertEqual(entries["_ConstructedAnimation"].modifications, 0)
+
+        self.assertEqual(profiler.entries, sorted(profiler.entries, key=lambda entry: -entry.seconds))
+        report = profiler.report().splitlines()
+        self.assertEqual(len(report), 4)
+        self.assertIn(f"{__file__}:{translation_line}", profiler.report())
+        self.assertEqual(len(profiler.report(limit=1).splitlines()), 2)
+
+
+def _line() -> int:
+    import sys
+
+    return sys._getframe(1).f_lineno
+
+
+class TestProfilerLifetime(VisuscriptTestCase):
+    def setUp(self):
+        config.scene_output_stream = MockStream()
+
+    def test_sites_are_recorded_only_while_open(self):
+        with Profiler():
+            self.assertIsNotNone(wait(1)._creation_site)  # type: ignore[reportPrivateUsage]
+            with Profiler():
+                pass
+            self.assertIsNotNone(MockUpdater()._creation_site)  # type: ignore[reportPrivateUsage]
+        self.assertIsNone(wait(1)._creation_site)  # type: ignore[reportPrivateUsage]
+        self.assertIsNone(MockUpdater()._creation_site)  # type: ignore[reportPrivateUsage]
+
+    def test_measured_animations_are_not_kept_alive(self):
+        with Profiler() as profiler:
+            rect = Rect(1, 1)
+            animation = animate_translation(rect.transform, [1, 0], duration=1)
+            Scene(print_initial=False, profiler=profiler).player << animation
+        reference = weakref.ref(animation)
+        del animation
+        gc.collect()
+        self.assertIsNone(reference())
+        self.assertEqual(sum(entry.instances for entry in profiler.entries), 1)
+
+    def test_collected_subjects_are_forgotten(self):
+        profiler = Profiler()
+        profiler.close()
+        updaters = [MockUpdater() for _ in range(10)]
+        for _ in range(2):
+            for measured in map(profiler.measure, updaters, [lambda: None] * len(updaters)):
+                self.assertIsNone(measured)
+        self.assertEqual(len(profiler._subjects), 10)  # type: ignore[reportPrivateUsage]
+        del updaters
+        gc.collect()
+        self.assertEqual(len(profiler._subjects), 0)  # type: ignore[reportPrivateUsage]
+
+        profiler.measure(MockUpdater(), lambda: None)
+        entry = profiler.entries[0]
+        self.assertEqual((entry.instances, entry.calls), (11, 21))
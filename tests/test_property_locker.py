@@ -0,0 +1,44 @@
+import unittest
+
+from visuscript.property_locker import PropertyLocker, LockedPropertyError
+
+
+class Equal:
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Equal)
+
+    def __hash__(self) -> int:
+        return 0
+
+
+class TestPropertyLocker(unittest.TestCase):
+    def test_locks_by_identity(self):
+        a, b = Equal(), Equal()
+        locker = PropertyLocker({a: ["x", "y"]})
+        self.assertTrue(locker.locks(a, "x"))
+        self.assertFalse(locker.locks(b, "x"))
+        self.assertFalse(locker.locks(a, "z"))
+        locker.add(b, "x")
+        self.assertEqual(len(locker), 3)
+        self.assertRaises(LockedPropertyError, lambda: locker.add(a, "y"))
+
+    def test_merged_lockers_do_not_share_modifications(self):
+        a, b = object(), object()
+        child = PropertyLocker({a: ["x"]})
+        parent = PropertyLocker()
+        parent.update(child)
+        parent.add(b, "x")
+        child.add(a, "y")
+        self.assertEqual(set(parent), {(a, "x"), (b, "x")})
+        self.assertEqual(set(child), {(a, "x"), (a, "y")})
+
+    def test_conflicting_update_modifies_nothing(self):
+        a, b = object(), object()
+        locker = PropertyLocker({a: ["x"]})
+        other = PropertyLocker({b: ["x"], a: ["x"]})
+        self.assertRaises(LockedPropertyError, lambda: locker.update(other))
+        self.assertEqual(set(locker), {(a, "x")})
+        self.assertRaises(LockedPropertyError, lambda: other.check_conflicts(locker))
+
+        locker.update(other, ignore_conflicts=True)
+        self.assertEqual(set(locker), {(a, "x"), (b, "x")})
@@ -1,9 +1,15 @@
+from unittest import mock
+
 from .base_class import VisuscriptTestCase
 from .test_animation import MockAnimation
 from .test_updater import MockUpdater
 from visuscript.config import config
 from visuscript.property_locker import LockedPropertyError
 from visuscript.drawable.scene import Scene
+from visuscript.drawable import Rect
+from visuscript.mixins.mixins import _Token  # type: ignore[reportPrivateUsage]
+from visuscript.animation import wait, animate_translation
+from visuscript.frame_encoding import REPEAT_FRAME
 
 
 class TestScene(VisuscriptTestCase):
@@ -122,9 +128,119 @@ class TestScene(VisuscriptTestCase):
         self.assertRaises(LockedPropertyError, conflict1)
         self.assertRaises(LockedPropertyError, conflict2)
 
+    def test_unchanged_frames_are_repeated(self):
+        scene = Scene(print_initial=False, skip_unchanged_frames=True)
+        rect = Rect(10)
+        scene << rect
+
+        scene.player << wait(1)
+        self.assertEqual(self.mock_stream.writes, 1)
+        self.assertEqual(self.mock_stream.repeats, config.fps - 1)
+
+        scene.player << animate_translation(rect.transform, [10, 0], duration=1)
+        self.assertEqual(self.mock_stream.writes, 1 + config.fps)
+        self.assertEqual(self.mock_stream.repeats, config.fps - 1)
+
+    def test_changed_drawables_are_not_repeated(self):
+        scene = Scene(print_initial=False, skip_unchanged_frames=True)
+        scene.print()
+        rect = Rect(10)
+        scene << rect
+        scene.print()
+        scene.print()
+        self.assertEqual(self.mock_stream.writes, 2)
+        self.assertEqual(self.mock_stream.repeats, 1)
+
+        rect.set_opacity(0.5)
+        scene.print()
+        self.assertEqual(self.mock_stream.writes, 3)
+
+    def test_unchanged_frames_are_drawn_by_default(self):
+        scene = Scene(print_initial=False)
+        scene.player << wait(1)
+        self.assertEqual(self.mock_stream.writes, config.fps)
+        self.assertEqual(self.mock_stream.repeats, 0)
+
+    def test_shared_attributes_are_hoisted(self):
+        scene = Scene(print_initial=False, optimize_svg=True)
+        scene << [Rect(10, 10), Rect(20, 20), Rect(30, 30).set_fill("red")]
+        svg = scene.draw()
+        group = svg[svg.index("<g ") : svg.index(">", svg.index("<g "))]
+        self.assertIn("stroke=", group)
+        self.assertIn("fill=", group)
+        self.assertEqual(svg.count("stroke="), 2)
+        self.assertEqual(svg.count("fill="), 3)
+        self.assertNotIn("opacity=", svg.replace("fill-opacity=", ""))
+
+    def test_repeated_geometry_is_instanced(self):
+        scene = Scene(print_initial=False, optimize_svg=True)
+        scene << [Rect(10, 10).translate(10 * i) for i in range(5)]
+        scene << Rect(20, 20)
+        svg = scene.draw()
+        self.assertIn("<defs>", svg)
+        self.assertEqual(svg.count("M -5 -5"), 1)
+        self.assertEqual(svg.count('<use href="#s0"'), 5)
+        self.assertIn('<use href="#s0" transform="translate(40)"/>', svg)
+        self.assertEqual(svg.count("M -10 -10"), 1)
+
+    def test_optimize_svg_is_disabled_by_default(self):
+        scene = Scene(print_initial=False)
+        scene << [Rect(10, 10), Rect(20, 20)]
+        svg = scene.draw()
+        self.assertEqual(svg.count("stroke="), 3)
+        self.assertEqual(svg.count(' opacity="1"'), 3)
+        self.assertNotIn("<use", svg)
+
+    def test_compiled_hierarchy_draws_identically(self):
+        def build():
+            root = Rect(10, 10).translate(30, 10).set_opacity(0.5)
+            root.transform.rotation = 30
+            child = Rect(5, 5).translate(10).set_opacity(0.5)
+            child.transform.scale = 2
+            root.add_child(child.add_child(Rect(2, 2).translate(0, 4)))
+            return root
+
+        plain = Scene(print_initial=False)
+        plain << build()
+        compiled = Scene(print_initial=False, compile_hierarchy=True)
+        compiled << build()
+        self.assertEqual(compiled.draw(), plain.draw())
+
+    def test_compiled_hierarchy_is_not_revalidated_per_node(self):
+        scene = Scene(print_initial=False, compile_hierarchy=True)
+        root = Rect(10, 10)
+        for _ in range(3):
+            child = Rect(5, 5)
+            root.add_child(child.add_child(Rect(2, 2)))
+        scene << root
+        nodes = list(root)
+        tokens = {
+            id(token)
+            for node in nodes
+            for token in (node._global_transform_token, node._global_opacity_token)  # type: ignore[reportPrivateUsage]
+        }
+        # The first draw reads each default color, which advances the epoch.
+        scene.draw()
+        scene.draw()
+
+        with mock.patch.object(_Token, "revalidate", autospec=True, side_effect=_Token.revalidate) as revalidate:
+
+            def revalidated() -> list[int]:
+                return [id(call.args[0]) for call in revalidate.call_args_list if id(call.args[0]) in tokens]
+
+            scene.draw()
+            self.assertEqual(revalidated(), [])
+
+            root.translate(5, 5)
+            scene.draw()
+            # Each token is revalidated once, when the compiled hierarchy is written back, rather than again when drawn.
+            self.assertCountEqual(revalidated(), tokens)
+
 
 class MockStream:
     writes = 0
+    repeats = 0
 
     def write(self, data: str):
         self.writes += data.count('<svg xmlns="http://www.w3.org/2000/svg"')
+        self.repeats += data.count(REPEAT_FRAME)
@@ -1,7 +1,7 @@
 from .base_class import VisuscriptTestCase
 import unittest
 from visuscript.config import config
-from visuscript.updater import TranslationUpdater, Updater
+from visuscript.updater import TranslationUpdater, Updater, UpdaterBundle, FunctionUpdater
 from visuscript.primatives import Transform
 from visuscript.property_locker import PropertyLocker
 from math import sqrt
@@ -35,6 +35,98 @@ class TestUpdater(VisuscriptTestCase):
                 )
 
 
+class TestUpdaterBundle(VisuscriptTestCase):
+    def test_updaters_run_at_their_own_rates(self):
+        rates = [1, config.fps // 3, config.fps, 75, 1000]
+        updaters = [MockUpdater().set_update_rate(rate) for rate in rates]
+        default = MockUpdater()
+        bundle = UpdaterBundle(*updaters, default)
+        for _ in frame_sequence(3):
+            bundle.update_for_frame()
+        for updater, rate in zip(updaters, rates):
+            self.assertEqual(updater.update_calls, 3 * rate)
+            self.assertAlmostEqual(sum(updater.dts), 3)
+            self.assertEqual(len(updater.ts), 3 * rate)
+            for i, t in enumerate(updater.ts):
+                self.assertAlmostEqual(t, i / rate)
+        self.assertEqual(default.update_calls, 3 * config.fps)
+
+    def test_deactivated_updaters_are_skipped(self):
+        updater = MockUpdater().set_update_rate(config.fps * 2)
+        bundle = UpdaterBundle(updater)
+        bundle.update_for_frame()
+        updater.deactivate()
+        self.assertFalse(updater.active)
+        for _ in range(5):
+            bundle.update_for_frame()
+        self.assertEqual(updater.update_calls, 2)
+        updater.activate()
+        self.assertTrue(updater.active)
+        bundle.update_for_frame()
+        self.assertEqual(updater.update_calls, 4)
+        self.assertAlmostEqual(updater.ts[-2], 12 / (config.fps * 2))
+        self.assertAlmostEqual(updater.ts[-1], 13 / (config.fps * 2))
+
+    def test_changing_rate_after_push(self):
+        updater = MockUpdater()
+        bundle = UpdaterBundle(updater)
+        bundle.update_for_frame()
+        updater.set_update_rate(config.fps * 4)
+        bundle.update_for_frame()
+        self.assertEqual(updater.update_calls, 5)
+        self.assertAlmostEqual(updater.ts[1], 4 / (config.fps * 4))
+
+    def test_order_of_updates_is_push_order(self):
+        calls: list[int] = []
+        updaters = [FunctionUpdater(lambda t, dt, i=i: calls.append(i)) for i in range(4)]
+        bundle = UpdaterBundle(*updaters)
+        updaters[1].deactivate()
+        updaters[1].activate()
+        bundle.update_for_frame()
+        self.assertEqual(calls, [0, 1, 2, 3])
+
+    def test_clear_stops_notifications(self):
+        updater = MockUpdater()
+        bundle = UpdaterBundle(updater)
+        bundle.clear()
+        updater.deactivate()
+        bundle.update_for_frame()
+        self.assertEqual(updater.update_calls, 0)
+
+    def test_nested_bundles_run_updaters_at_their_own_rates(self):
+        updater = MockUpdater().set_update_rate(config.fps * 2)
+        slow = MockUpdater().set_update_rate(config.fps // 2)
+        outer = UpdaterBundle(UpdaterBundle(updater, UpdaterBundle(slow)))
+        for _ in frame_sequence(2):
+            outer.update_for_frame()
+        self.assertEqual(updater.update_calls, 4 * config.fps)
+        self.assertEqual(slow.update_calls, config.fps)
+        self.assertAlmostEqual(sum(updater.dts), 2)
+        for i, t in enumerate(updater.ts):
+            self.assertAlmostEqual(t, i / (config.fps * 2))
+
+    def test_groups_run_in_the_order_their_rates_were_first_met(self):
+        calls: list[str] = []
+        first = FunctionUpdater(lambda t, dt: calls.append("first"))
+        fast = FunctionUpdater(lambda t, dt: calls.append("fast")).set_update_rate(config.fps * 2)
+        last = FunctionUpdater(lambda t, dt: calls.append("last"))
+        bundle = UpdaterBundle(first, fast, last)
+        bundle.update_for_frame()
+        self.assertEqual(calls, ["first", "last", "fast", "fast"])
+
+    def test_default_rate_follows_fps(self):
+        fps = config.fps
+        try:
+            config.fps = 24
+            updater = MockUpdater()
+            bundle = UpdaterBundle(updater)
+            bundle.update_for_frame()
+            self.assertEqual(updater.update_rate, 24)
+            self.assertEqual(updater.dts, [1 / 24])
+        finally:
+            config.fps = fps
+
+
 class TestTranslationUpdater(VisuscriptTestCase):
     def test_instantaneous_movement_and_stationary_destination(self):
         locations = [[0, 0], [12, 11], [0, 15], [32, 2], [100, 0], [53, 24]]
@@ -106,6 +198,18 @@ class TestTranslationUpdater(VisuscriptTestCase):
                 source.translation.x, 50, f"failed with update rate of {update_rate}"
             )
 
+    def test_batched_steps_match_single_steps(self):
+        for max_speed in [None, 3, 50, 1000]:
+            batched = Transform(translation=[0, 0])
+            stepped = Transform(translation=[0, 0])
+            destination = Transform(translation=[30, 40])
+            batched_updater = TranslationUpdater(batched, destination, max_speed=max_speed)
+            stepped_updater = TranslationUpdater(stepped, destination, max_speed=max_speed)
+            for frame in range(20):
+                batched_updater.update_steps(frame / 10, 1 / 1000, 100)
+                Updater.update_steps(stepped_updater, frame / 10, 1 / 1000, 100)
+                self.assertVecAlmostEqual(batched.translation, stepped.translation, delta=1e-6)
+
 
 class MockUpdater(Updater):
     def __init__(self, locked: dict[object, list[str]] = {}):
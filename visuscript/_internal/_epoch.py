@@ -0,0 +1,18 @@
+"""Tracks a global count of the modifications made to drawable state.
+
+Every tracked setter advances the epoch. Comparing two readings of
+:func:`current_epoch` thus reveals whether any tracked state has changed between them.
+"""
+
+_epoch: int = 0
+
+
+def advance_epoch() -> None:
+    """Records that some tracked state has been modified."""
+    global _epoch
+    _epoch += 1
+
+
+def current_epoch() -> int:
+    """Returns the number of tracked modifications made thus far."""
+    return _epoch
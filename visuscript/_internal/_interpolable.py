@@ -6,6 +6,8 @@ T = TypeVar("T", bound="Interpolable")
 
 
 class Interpolable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def interpolate(self: T, other: T, alpha: float) -> T:
         """Interpolates between this object and another and returns the result as a new object."""
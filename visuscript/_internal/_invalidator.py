@@ -1,38 +1,89 @@
-from abc import abstractmethod
-from typing import Callable, Iterable, ParamSpec, TypeVar, Concatenate
+from typing import Callable, Hashable, ParamSpec, TypeVar, Concatenate
 import functools
+import typing as t
 
-
-# TODO Track when the invalidatable should be deallocated
-class Invalidatable:
-    @abstractmethod
-    def _invalidate(self):
-        """To be called whenever an Invalidator being observed sends its signal."""
-        ...
-
-
-class Invalidator:
-    @abstractmethod
-    def _iter_invalidatables(self) -> Iterable[Invalidatable]: ...
-    @abstractmethod
-    def _add_invalidatable(self, invalidatable: Invalidatable):
-        """Adds an :class :`Invalidatable` to this Invalidator."""
-        ...
-
+from ._epoch import advance_epoch, current_epoch
 
 P = ParamSpec("P")
 T = TypeVar("T")
-_Invalidator = TypeVar("_Invalidator", bound=Invalidator)
+_Self = TypeVar("_Self")
+_Owner = TypeVar("_Owner")
 
 
 def invalidates(
-    method: Callable[Concatenate[_Invalidator, P], T],
-) -> Callable[Concatenate[_Invalidator, P], T]:
+    method: Callable[Concatenate[_Self, P], T],
+) -> Callable[Concatenate[_Self, P], T]:
+    """Advances the epoch after each call to a method that modifies tracked state."""
+
     @functools.wraps(method)
-    def invalidating_foo(self: _Invalidator, *args: P.args, **kwargs: P.kwargs) -> T:
+    def invalidating_foo(self: _Self, *args: P.args, **kwargs: P.kwargs) -> T:
         output = method(self, *args, **kwargs)
-        for invalidatable in self._iter_invalidatables():  # type: ignore[reportPrivateUsage]
-            invalidatable._invalidate()  # type: ignore[reportPrivateUsage]
+        advance_epoch()
         return output
 
     return invalidating_foo
+
+
+class KeyedCachedProperty(t.Generic[_Owner, T]):
+    """Like :func:`functools.cached_property`, but the cached value is recomputed whenever
+    the key returned by ``key(owner)`` differs from the key under which it was cached.
+
+    The key must change only along with tracked state, so it is checked at most once per epoch.
+    Assigning to the property caches the assigned value under the current key,
+    and deleting it clears the cache.
+    """
+
+    def __init__(self, key: Callable[[_Owner], Hashable], func: Callable[[_Owner], T]):
+        self._key = key
+        self._func = func
+        self._attribute = f"_{func.__name__}_cache"
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str):
+        self._attribute = f"_{name}_cache"
+
+    @t.overload
+    def __get__(self, obj: None, objtype: type | None = None) -> "KeyedCachedProperty[_Owner, T]": ...
+    @t.overload
+    def __get__(self, obj: _Owner, objtype: type | None = None) -> T: ...
+    def __get__(self, obj: _Owner | None, objtype: type | None = None) -> "T | KeyedCachedProperty[_Owner, T]":
+        if obj is None:
+            return self
+        epoch = current_epoch()
+        cache: tuple[int, Hashable, T] | None = obj.__dict__.get(self._attribute)
+        if cache is not None and cache[0] == epoch:
+            return cache[2]
+        key = self._key(obj)
+        if cache is not None and cache[1] == key:
+            value = cache[2]
+        else:
+            value = self._func(obj)
+        # Computing the value may itself advance the epoch.
+        obj.__dict__[self._attribute] = (current_epoch(), key, value)
+        return value
+
+    def __set__(self, obj: _Owner, value: T):
+        self.prime(obj, self._key(obj), value)
+
+    def __delete__(self, obj: _Owner):
+        obj.__dict__.pop(self._attribute, None)
+
+    def prime(self, obj: _Owner, key: Hashable, value: T):
+        """Caches a value, computed elsewhere, for an object as of the current epoch.
+
+        :param obj: The object for which the value is cached.
+        :param key: The key under which the value is cached, which must equal what ``key(obj)`` would return.
+        :param value: The value.
+        """
+        obj.__dict__[self._attribute] = (current_epoch(), key, value)
+
+
+def keyed_cached_property(
+    key: Callable[[_Owner], Hashable],
+) -> Callable[[Callable[[_Owner], T]], KeyedCachedProperty[_Owner, T]]:
+    """Decorates a method as a :class:`KeyedCachedProperty` whose cached value is recomputed whenever ``key(owner)`` changes."""
+
+    def decorator(func: Callable[[_Owner], T]) -> KeyedCachedProperty[_Owner, T]:
+        return KeyedCachedProperty(key, func)
+
+    return decorator
@@ -0,0 +1,36 @@
+"""Formats the numbers written into emitted SVG.
+
+The precision is set through :attr:`visuscript.config.config.svg_precision`.
+"""
+
+_precision: int | None = 3
+
+
+def get_precision() -> int | None:
+    """Returns the number of decimal places to which emitted numbers are rounded, or None for full precision."""
+    return _precision
+
+
+def set_precision(precision: int | None) -> None:
+    """Sets the number of decimal places to which emitted numbers are rounded, or None for full precision."""
+    global _precision
+    if precision is not None and precision < 0:
+        raise ValueError("The SVG precision cannot be negative.")
+    _precision = precision
+
+
+def format_number(value: float) -> str:
+    """Returns the shortest string for a number, rounded to the configured precision, with trailing zeros removed."""
+    if isinstance(value, int):
+        return str(value)
+    if _precision is None:
+        string = repr(float(value))
+        if string.endswith(".0"):
+            string = string[:-2]
+    else:
+        string = f"{value:.{_precision}f}"
+        if "." in string:
+            string = string.rstrip("0").rstrip(".")
+    if string == "-0":
+        return "0"
+    return string
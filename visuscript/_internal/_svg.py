@@ -0,0 +1,33 @@
+"""Splits emitted SVG into tokens and parses the tags thereamong."""
+
+import re
+import typing as t
+
+_TOKEN = re.compile(r"<[^>]*>|[^<]+")
+_TAG = re.compile(r'<(/?[^\s/>]+)((?:\s+[^\s=/>]+="[^"]*")*)\s*(/?)>')
+_ATTRIBUTE = re.compile(r'([^\s=/>]+)="([^"]*)"')
+
+
+class Tag(t.NamedTuple):
+    name: str
+    attributes: dict[str, str]
+    self_closing: bool
+
+    def build(self) -> str:
+        attributes = "".join(f' {key}="{value}"' for key, value in self.attributes.items())
+        return f"<{self.name}{attributes}{'/' if self.self_closing else ''}>"
+
+
+def parse_tag(token: str) -> Tag | None:
+    """Returns the parsed tag if the token is a tag that can be rebuilt exactly from its parts, else None."""
+    match = _TAG.fullmatch(token)
+    if match is None:
+        return None
+    name, attributes, self_closing = match.groups()
+    tag = Tag(name, dict(_ATTRIBUTE.findall(attributes)), self_closing == "/")
+    return tag if tag.build() == token else None
+
+
+def tokenize(svg: str) -> list[str]:
+    """Returns the tags and the text between them, in order, such that joining them reproduces the input."""
+    return _TOKEN.findall(svg)
@@ -0,0 +1,172 @@
+"""Shrinks emitted SVG without changing how it renders.
+
+Attributes that are shared by the elements in a group are hoisted onto the group,
+attributes that are set to their default values are omitted,
+and elements that are repeated are defined once and thereafter referenced with <use>.
+"""
+
+from collections import Counter
+
+from ._svg import Tag, parse_tag, tokenize
+
+_INHERITED_ATTRIBUTES = (
+    "stroke",
+    "stroke-opacity",
+    "stroke-width",
+    "fill",
+    "fill-opacity",
+    "font-family",
+    "font-size",
+    "font-style",
+)
+_INHERITED_DEFAULTS = {
+    "stroke": "none",
+    "stroke-opacity": "1",
+    "stroke-width": "1",
+    "fill-opacity": "1",
+    "font-style": "normal",
+}
+_DEFAULTS = {
+    "opacity": "1",
+    "transform": "translate(0)",
+}
+_ELEMENT_DEFAULTS = {
+    "circle": {"cx": "0", "cy": "0"},
+    "text": {"x": "0", "y": "0"},
+    "image": {"x": "0", "y": "0"},
+    "rect": {"x": "0", "y": "0"},
+}
+_INSTANCEABLE_ELEMENTS = {
+    "path",
+    "circle",
+    "ellipse",
+    "rect",
+    "line",
+    "polyline",
+    "polygon",
+    "image",
+}
+
+
+def _children(tokens: list[str]) -> list[int]:
+    """Returns the indices of the tokens that open the top-level elements."""
+    children: list[int] = []
+    depth = 0
+    for i, token in enumerate(tokens):
+        if not token.startswith("<") or token.startswith("<!"):
+            continue
+        if token.startswith("</"):
+            depth -= 1
+            continue
+        if depth == 0:
+            children.append(i)
+        if not token.endswith("/>"):
+            depth += 1
+    return children
+
+
+def _hoist(tags: list[Tag]) -> dict[str, str]:
+    hoisted: dict[str, str] = {}
+    if not tags:
+        return hoisted
+    for attribute in _INHERITED_ATTRIBUTES:
+        default = _INHERITED_DEFAULTS.get(attribute)
+        values = [tag.attributes.get(attribute, default) for tag in tags]
+        if None in values:
+            continue
+        value, count = Counter(values).most_common(1)[0]
+        # Elements left with the default must then set it explicitly, which costs what hoisting saves.
+        if value == default or count < 2 or count <= values.count(default):
+            continue
+        hoisted[attribute] = value  # type: ignore[assignment]
+    return hoisted
+
+
+def _omit_defaults(tag: Tag, hoisted: dict[str, str]):
+    attributes = tag.attributes
+    for attribute in _INHERITED_ATTRIBUTES:
+        inherited = hoisted.get(attribute, _INHERITED_DEFAULTS.get(attribute))
+        value = attributes.get(attribute)
+        if value is None:
+            if attribute in hoisted:
+                attributes[attribute] = _INHERITED_DEFAULTS[attribute]
+        elif value == inherited:
+            del attributes[attribute]
+
+    for defaults in (_DEFAULTS, _ELEMENT_DEFAULTS.get(tag.name, {})):
+        for attribute, default in defaults.items():
+            if attributes.get(attribute) == default:
+                del attributes[attribute]
+
+
+def optimize_group(svg: str) -> tuple[dict[str, str], str]:
+    """Optimizes the elements that are to be placed together in an otherwise-unstyled group.
+
+    :param svg: The elements in the group.
+    :return: The attributes to be set on the group and the optimized elements, which render identically therein.
+    """
+    tokens = tokenize(svg)
+    children = _children(tokens)
+    tags = {i: parse_tag(tokens[i]) for i in children}
+
+    # An empty element without attributes renders nothing, so what it inherits is irrelevant.
+    relevant = {
+        i: tag
+        for i, tag in tags.items()
+        if tag is None or not (tag.self_closing and not tag.attributes)
+    }
+
+    parsed = [tag for tag in relevant.values() if tag is not None]
+    hoisted = _hoist(parsed) if len(parsed) == len(relevant) else {}
+
+    for i, tag in relevant.items():
+        if tag is None:
+            continue
+        _omit_defaults(tag, hoisted)
+        tokens[i] = tag.build()
+
+    return hoisted, "".join(tokens)
+
+
+def instance_symbols(svg: str) -> tuple[str, str]:
+    """Defines once each element that is repeated, but for its transform, among the top-level elements.
+
+    :param svg: The elements among which repetitions are found.
+    :return: The definitions, which are to be placed in <defs>, and the elements with each repetition
+        replaced by a <use> of the corresponding definition.
+    """
+    tokens = tokenize(svg)
+    repetitions: dict[str, tuple[Tag, list[tuple[int, str | None]]]] = {}
+    for i in _children(tokens):
+        tag = parse_tag(tokens[i])
+        if (
+            tag is None
+            or not tag.self_closing
+            or tag.name not in _INSTANCEABLE_ELEMENTS
+            or "id" in tag.attributes
+        ):
+            continue
+        transform = tag.attributes.pop("transform", None)
+        repetitions.setdefault(tag.build(), (tag, []))[1].append((i, transform))
+
+    definitions: list[str] = []
+    for tag, instances in repetitions.values():
+        if len(instances) < 2:
+            continue
+        symbol_id = f"s{len(definitions)}"
+        definition = Tag(tag.name, {"id": symbol_id, **tag.attributes}, True).build()
+        uses = {
+            i: Tag(
+                "use",
+                {"href": f"#{symbol_id}"} if transform is None else {"href": f"#{symbol_id}", "transform": transform},
+                True,
+            ).build()
+            for i, transform in instances
+        }
+        if sum(len(tokens[i]) - len(use) for i, use in uses.items()) <= len(definition):
+            continue
+        definitions.append(definition)
+        for i, use in uses.items():
+            tokens[i] = use
+
+    return "".join(definitions), "".join(tokens)
@@ -4,6 +4,7 @@ from visuscript.animation import (
     wait,
     bundle,
     animate_transform,
+    animate_transforms,
     Animation,
     animate_opacity,
     sequence,
@@ -16,6 +17,7 @@ from visuscript.drawable.text import Text
 from visuscript.organizer import Organizer, GridOrganizer
 from visuscript.drawable import Pivot, Rect
 from visuscript.primatives import Transform
+from visuscript._internal._epoch import advance_epoch
 from visuscript.primatives.protocols import (
     HasShape,
     HasTransform,
@@ -264,16 +266,15 @@ class AnimatedCollection(ABC, Generic[_T, _CollectionDrawable]):
     ) -> Animation:
         """Returns an :class:`~visuscript.animation.Animation` that positions all of the :class:`CollectionDrawable` instances
         corresponding to `_T` instances in this :class:`AnimatedCollection` according to its rules."""
-        animation_bundle = bundle(wait(duration))
-        for var in self:
-            animation_bundle.push(
-                animate_transform(
-                    self.drawable_for(var).transform,
-                    self.target_for(var),
-                    duration=duration,
-                )
-            )
-        return animation_bundle
+        variables = list(self)
+        return bundle(
+            wait(duration),
+            animate_transforms(
+                [self.drawable_for(var).transform for var in variables],
+                [self.target_for(var) for var in variables],
+                duration=duration,
+            ),
+        )
 
     @property
     def drawables(self) -> Iterable[_CollectionDrawable]:
@@ -307,11 +308,13 @@ class AnimatedCollection(ABC, Generic[_T, _CollectionDrawable]):
     def add_auxiliary_drawable(self, drawable: CanBeDrawn, /) -> Self:
         """Adds an drawable object to de displayed along with this :class:`AnimatedCollection`."""
         self.auxiliary_drawables.append(drawable)
+        advance_epoch()
         return self
 
     def remove_auxiliary_drawable(self, drawable: CanBeDrawn, /) -> Self:
         """Removes an auxiliar drawable from this :class:`AnimatedCollection`."""
         self.auxiliary_drawables.remove(drawable)
+        advance_epoch()
         return self
 
     def is_contains(self, var: _T, /) -> bool:
@@ -672,6 +675,7 @@ class AnimatedList(AnimatedMutableSequence[_T, _CollectionDrawable], TransformMi
         new_drawable.opacity = 0.0
         new_drawable.transform = self.target_for(value)
         self._drawable_map[value] = new_drawable
+        advance_epoch()
         return animate_opacity(new_drawable, 1.0, duration=duration)
 
     def drawable_for(self, var: _T, /) -> _CollectionDrawable:
@@ -681,6 +685,7 @@ class AnimatedList(AnimatedMutableSequence[_T, _CollectionDrawable], TransformMi
 
     def set_drawable_for(self, var: _T, drawable: _CollectionDrawable, /) -> None:
         self._drawable_map[var] = drawable
+        advance_epoch()
 
     @overload
     def __getitem__(self, index: int, /) -> _T: ...
@@ -709,6 +714,7 @@ class AnimatedList(AnimatedMutableSequence[_T, _CollectionDrawable], TransformMi
             del self._drawable_map[old_var]
             self._vars[idx] = var
             self._drawable_map[var] = self.new_drawable_for(var)
+        advance_epoch()
 
     def __delitem__(self, index: int | slice, /):
         if isinstance(index, int):
@@ -716,6 +722,7 @@ class AnimatedList(AnimatedMutableSequence[_T, _CollectionDrawable], TransformMi
         for var in self[index]:
             del self._drawable_map[var]
         del self._vars[index]
+        advance_epoch()
 
     def __iter__(self):
         for var in self._vars:
@@ -3,6 +3,8 @@ from .primatives import Animation
 
 from .animation_store import AnimationBundle, AnimationSequence
 
+from .timeline import Timeline
+
 
 from .property_animations import (
     animate_translation,
@@ -24,6 +26,12 @@ from .animations import (
     animate_transform,
 )
 
+from .batch_animations import (
+    animate_transforms,
+    animate_opacities,
+    animate_rgbs,
+)
+
 from .constructors import (
     sequence,
     bundle,
@@ -37,12 +45,16 @@ __all__ = [
     "Animation",
     "AnimationSequence",
     "AnimationBundle",
+    "Timeline",
     "animate_translation",
     "animate_scale",
     "animate_rotation",
     "animate_transform",
     "animate_rgb",
     "animate_opacity",
+    "animate_transforms",
+    "animate_opacities",
+    "animate_rgbs",
     "animate_path",
     "animate_updater",
     "quadratic_swap",
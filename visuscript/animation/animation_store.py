@@ -27,6 +27,27 @@ class AnimationSequence(Animation):
             return False
         return True
 
+    def _count_frames(self) -> int | None:
+        total = 0
+        for animation in self._animations:
+            frames = animation.total_frames
+            if frames is None:
+                return None
+            total += frames
+        return total
+
+    def _is_random_access(self) -> bool:
+        return all(animation._is_random_access() for animation in self._animations)
+
+    def _evaluate(self, advances: int | float) -> None:
+        for animation in self._animations:
+            if advances <= 0:
+                break
+            frames = animation.total_frames
+            assert frames is not None
+            animation.at(min(advances, frames))
+            advances -= frames
+
     def push(
         self,
         animation: Animation | t.Iterable[Animation | None] | None,
@@ -69,6 +90,22 @@ class AnimationBundle(Animation):
         advance_made = sum(map(lambda x: x.next_frame(), self._animations)) > 0
         return advance_made
 
+    def _count_frames(self) -> int | None:
+        longest = 0
+        for animation in self._animations:
+            frames = animation.total_frames
+            if frames is None:
+                return None
+            longest = max(longest, frames)
+        return longest
+
+    def _is_random_access(self) -> bool:
+        return all(animation._is_random_access() for animation in self._animations)
+
+    def _evaluate(self, advances: int | float) -> None:
+        for animation in self._animations:
+            animation.at(advances)
+
     def push(
         self,
         animation: Animation | t.Iterable[Animation | None] | None,
@@ -9,7 +9,7 @@ from visuscript.lazy_object import make_lazy
 from visuscript.property_locker import PropertyLocker
 from visuscript.updater import Updater
 
-from .constructors import bundle, laze, construct, duration_to_frame_count
+from .constructors import bundle, laze, construct, duration_to_frame_count, hint_total_frames
 from .primatives import Animation
 from .property_animations import (
     animate_opacity,
@@ -52,7 +52,9 @@ def wait(duration: float | ConfigurationDeference = DEFER_TO_CONFIG) -> Animatio
         if frame == total_frames:
             return None    
         return frame + 1
-    return construct(advancer, 0)
+    def evaluate(frame: int | float):
+        pass
+    return construct(advancer, 0, total_frames=total_frames, evaluator=evaluate)
 
 _P = t.ParamSpec("_P")
 
@@ -60,7 +62,7 @@ def run(function: t.Callable[_P, t.Any], *args: _P.args, **kwargs: _P.kwargs) ->
     def wrapper(_: bool):
         function(*args, **kwargs)
         return None
-    return construct(wrapper, False)
+    return construct(wrapper, False, total_frames=0)
 
 def animate_path(obj: Transform, path: Path, *, duration: float | ConfigurationDeference = DEFER_TO_CONFIG, easing_function: t.Callable[[float], float] = sin_easing2) -> Animation:
     total_frames = duration_to_frame_count(duration)
@@ -70,7 +72,10 @@ def animate_path(obj: Transform, path: Path, *, duration: float | ConfigurationD
         frame_ord = frame + 1
         obj.translation = path.point_percentage(easing_function(frame_ord/total_frames))
         return frame_ord
-    return construct(advancer, 0, locker=PropertyLocker({obj: ["translation"]}))
+    def evaluate(frame: int | float):
+        # Fractional frames, as from a fractional speed, fall between the points of the frames on either side.
+        obj.translation = path.point_percentage(easing_function(frame/total_frames if frame else 0.0))
+    return construct(advancer, 0, locker=PropertyLocker({obj: ["translation"]}), total_frames=total_frames, evaluator=evaluate)
 
 
 def animate_updater(updater: Updater, *, duration: float | ConfigurationDeference = DEFER_TO_CONFIG, locker: t.Optional[PropertyLocker] = None) -> Animation:
@@ -82,7 +87,7 @@ def animate_updater(updater: Updater, *, duration: float | ConfigurationDeferenc
         dt = 1 / config.fps
         updater.update(t, dt)
         return frame + 1
-    return construct(advancer, 0, updater.locker)
+    return construct(advancer, 0, updater.locker, total_frames=total_frames)
 
 
 class Swapable(HasTransform, HasShape, t.Protocol):
@@ -118,7 +123,11 @@ def quadratic_swap(
             animate_translation(b.transform, mid + lift, a.transform.translation, duration=duration)
         )
     
-    return laze(_eager_quadratic_swap, a, b, height_multiplier=height_multiplier, duration=duration)
+    return hint_total_frames(
+        laze(_eager_quadratic_swap, a, b, height_multiplier=height_multiplier, duration=duration),
+        duration_to_frame_count(duration),
+        random_access=True,
+    )
 
 def animate_transform(obj: Transform, first_target: Transform, *targets: Transform, initial: t.Optional[Transform] = None, **kwargs: t.Unpack[_InterpolationKwargs[t.Any]]):
     translations = map(lambda t: t.translation, targets)
@@ -0,0 +1,216 @@
+"""Contains animations of one kind of property on many objects at once.
+
+Each frame of such an animation interpolates the properties of all of its objects
+in one vectorized step, rather than advancing one animation per object.
+"""
+
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+
+from visuscript.primatives import Transform, Vec2, Rgb
+from visuscript.primatives.protocols import HasOpacity, HasRgb
+from visuscript.config import ConfigurationDeference, DEFER_TO_CONFIG
+from visuscript.lazy_object import LazyObject, evaluate_lazy_object_or_tuple
+from visuscript.property_locker import PropertyLocker, LockedPropertyError
+
+from .constructors import duration_to_frame_count, eased_alphas
+from .primatives import Animation
+from .easing import sin_easing2
+
+_T = t.TypeVar("_T")
+_U = t.TypeVar("_U")
+
+__all__ = [
+    "animate_transforms",
+    "animate_opacities",
+    "animate_rgbs",
+]
+
+
+class _BatchAnimation(Animation, t.Generic[_T, _U]):
+    """Linearly interpolates a property of many objects from their states at the first advance to their targets."""
+
+    def __init__(
+        self,
+        objects: t.Sequence[_T],
+        targets: t.Sequence[_U | LazyObject],
+        properties: t.Sequence[str],
+        gather: t.Callable[[t.Sequence[_T]], npt.NDArray[np.float64]],
+        convert: t.Callable[[t.Sequence[_U]], npt.NDArray[np.float64]],
+        scatter: t.Callable[[t.Sequence[_T], npt.NDArray[np.float64]], None],
+        duration: float | ConfigurationDeference,
+        easing_function: t.Callable[[float], float],
+    ):
+        super().__init__()
+        if len(objects) != len(targets):
+            raise ValueError(
+                f"Cannot animate {len(objects)} objects to {len(targets)} targets."
+            )
+        locks: dict[object, t.Iterable[str]] = {obj: set(properties) for obj in objects}
+        if len(locks) != len(objects):
+            duplicate = next(obj for i, obj in enumerate(objects) if obj in objects[:i])
+            raise LockedPropertyError(duplicate, properties[0])
+        self.locker.update(PropertyLocker(locks))
+
+        self._objects = objects
+        self._targets = targets
+        self._gather = gather
+        self._convert = convert
+        self._scatter = scatter
+        self._alphas = eased_alphas(easing_function, duration_to_frame_count(duration))
+        self._easing_function = easing_function
+        self._frame = 0
+        self._start: npt.NDArray[np.float64] | None = None
+        self._end: npt.NDArray[np.float64] | None = None
+
+    def _count_frames(self) -> int | None:
+        return len(self._alphas)
+
+    def _is_random_access(self) -> bool:
+        return True
+
+    def _evaluate(self, advances: int | float) -> None:
+        if advances and isinstance(advances, int):
+            self._apply(self._alphas[advances - 1])
+        else:
+            self._apply(self._easing_function(advances / len(self._alphas) if advances else 0.0))
+
+    def advance(self) -> bool:
+        if self._frame == len(self._alphas):
+            return False
+        alpha = self._alphas[self._frame]
+        self._frame += 1
+        self._apply(alpha)
+        return True
+
+    def _apply(self, alpha: float):
+        if self._start is None:
+            self._start = self._gather(self._objects)
+            # Lazy targets, or tuples that contain them, evaluate to values of the type of the targets.
+            self._end = self._convert(
+                t.cast(list[_U], [evaluate_lazy_object_or_tuple(target) for target in self._targets])
+            )
+        assert self._end is not None
+
+        if alpha == 1:
+            self._scatter(self._objects, self._end)
+        else:
+            self._scatter(self._objects, self._start * (1 - alpha) + self._end * alpha)
+
+
+def _gather_transforms(transforms: t.Sequence[Transform]) -> npt.NDArray[np.float64]:
+    return np.array(
+        [
+            (*transform.translation[:2], *transform.scale[:2], transform.rotation)
+            for transform in transforms
+        ],
+        dtype=np.float64,
+    ).reshape(len(transforms), 5)
+
+
+def _scatter_transforms(transforms: t.Sequence[Transform], values: npt.NDArray[np.float64]):
+    for transform, (tx, ty, sx, sy, rotation) in zip(transforms, values.tolist()):
+        transform.set_components(Vec2(tx, ty), Vec2(sx, sy), rotation)
+
+
+def animate_transforms(
+    objs: t.Sequence[Transform],
+    targets: t.Sequence[Transform],
+    *,
+    duration: float | ConfigurationDeference = DEFER_TO_CONFIG,
+    easing_function: t.Callable[[float], float] = sin_easing2,
+) -> Animation:
+    """Returns an :class:`~visuscript.animation.Animation` that animates each :class:`~visuscript.Transform`
+    to its respective target, as would :func:`~visuscript.animation.animate_transform` for each pair.
+
+    The starting :class:`~visuscript.Transform` instances are read, and any lazy targets are evaluated, on the first advance.
+    """
+    return _BatchAnimation(
+        objs,
+        targets,
+        ["translation", "scale", "rotation"],
+        _gather_transforms,
+        _gather_transforms,
+        _scatter_transforms,
+        duration,
+        easing_function,
+    )
+
+
+def _gather_opacities(objs: t.Sequence[HasOpacity]) -> npt.NDArray[np.float64]:
+    return np.array([obj.opacity for obj in objs], dtype=np.float64)
+
+
+def _convert_opacities(opacities: t.Sequence[float]) -> npt.NDArray[np.float64]:
+    return np.array(opacities, dtype=np.float64)
+
+
+def _scatter_opacities(objs: t.Sequence[HasOpacity], values: npt.NDArray[np.float64]):
+    for obj, opacity in zip(objs, values.tolist()):
+        obj.opacity = opacity
+
+
+def animate_opacities(
+    objs: t.Sequence[HasOpacity],
+    targets: t.Sequence[float],
+    *,
+    duration: float | ConfigurationDeference = DEFER_TO_CONFIG,
+    easing_function: t.Callable[[float], float] = sin_easing2,
+) -> Animation:
+    """Returns an :class:`~visuscript.animation.Animation` that animates the opacity of each object
+    to its respective target, as would :func:`~visuscript.animation.animate_opacity` for each pair.
+
+    The starting opacities are read, and any lazy targets are evaluated, on the first advance.
+    """
+    return _BatchAnimation(
+        objs,
+        targets,
+        ["opacity"],
+        _gather_opacities,
+        _convert_opacities,
+        _scatter_opacities,
+        duration,
+        easing_function,
+    )
+
+
+def _gather_rgbs(objs: t.Sequence[HasRgb]) -> npt.NDArray[np.float64]:
+    return _convert_rgbs([obj.rgb for obj in objs])
+
+
+def _convert_rgbs(rgbs: t.Sequence[Rgb.RgbLike]) -> npt.NDArray[np.float64]:
+    return np.array(
+        [tuple(Rgb.construct(rgb)) for rgb in rgbs], dtype=np.float64
+    ).reshape(len(rgbs), 3)
+
+
+def _scatter_rgbs(objs: t.Sequence[HasRgb], values: npt.NDArray[np.float64]):
+    channels = np.clip(values, 0, 255).astype(np.int64).tolist()
+    for obj, (r, g, b) in zip(objs, channels):
+        obj.rgb = Rgb(r, g, b)
+
+
+def animate_rgbs(
+    objs: t.Sequence[HasRgb],
+    targets: t.Sequence[Rgb.RgbLike],
+    *,
+    duration: float | ConfigurationDeference = DEFER_TO_CONFIG,
+    easing_function: t.Callable[[float], float] = sin_easing2,
+) -> Animation:
+    """Returns an :class:`~visuscript.animation.Animation` that animates the :class:`~visuscript.Rgb` of each object
+    to its respective target, as would :func:`~visuscript.animation.animate_rgb` for each pair.
+
+    The starting :class:`~visuscript.Rgb` values are read, and any lazy targets are evaluated, on the first advance.
+    """
+    return _BatchAnimation(
+        objs,
+        targets,
+        ["rgb"],
+        _gather_rgbs,
+        _convert_rgbs,
+        _scatter_rgbs,
+        duration,
+        easing_function,
+    )
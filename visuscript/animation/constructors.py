@@ -1,4 +1,5 @@
 import typing as t
+import weakref
 from dataclasses import dataclass
 
 from visuscript.property_locker import PropertyLocker
@@ -6,6 +7,7 @@ from visuscript.lazy_object import evaluate_lazy
 from visuscript.config import config, ConfigurationDeference, DEFER_TO_CONFIG
 
 from .easing import linear_easing
+from .interpolation import compile_track
 from .primatives import Animation
 from .animation_store import AnimationSequence, AnimationBundle
 from .protocols import InterpolationFunction, Keyframe, Setter
@@ -15,7 +17,7 @@ from .protocols import InterpolationFunction, Keyframe, Setter
 
 _P = t.ParamSpec("_P")
 _T = t.TypeVar("_T")
-def construct(advancer: t.Callable[[_T], _T | None], initial_state: _T, locker: t.Optional[PropertyLocker] = None) -> Animation:
+def construct(advancer: t.Callable[[_T], _T | None], initial_state: _T, locker: t.Optional[PropertyLocker] = None, total_frames: int | None = None, evaluator: t.Optional[t.Callable[[int | float], None]] = None) -> Animation:
     """Builds a new :class:`~visuscript.Animation`.
 
     :param advancer: A function that processes one frame of the animation.
@@ -30,9 +32,14 @@ def construct(advancer: t.Callable[[_T], _T | None], initial_state: _T, locker:
         the :class:`~visuscript.Animation` is generated.
     :param locker: The property locker that indicates all objects (and the properties thereof)
         that are animated by the constructed :class:`~visuscript.Animation`.
+    :param total_frames: The number of frames that the `advancer` generates, if known,
+        which becomes the :attr:`~visuscript.Animation.total_frames` of the constructed :class:`~visuscript.Animation`.
+    :param evaluator: A function that sets all animated objects to their states after the given number of frames,
+        which may be fractional, independently of the `advancer` and its state. If given along with `total_frames`, the constructed
+        :class:`~visuscript.Animation` supports :meth:`~visuscript.Animation.at`.
     :return: The constructed :class:`~visuscript.Animation`. 
     """
-    return _ConstructedAnimation(advancer, locker, initial_state)
+    return _ConstructedAnimation(advancer, locker, initial_state, total_frames, evaluator)
 
 
 def sequence(*animations: Animation | None) -> AnimationSequence:
@@ -69,27 +76,68 @@ class FrameState:
     num_processed_frames: int
 
 def keyframe_construct(setter: Setter[_T], num_frames: int, interpolation_function: InterpolationFunction[_T], first_keyframe: Keyframe[_T], keyframes: t.Sequence[Keyframe[_T]], easing_function: t.Callable[[float], float] = linear_easing, locker: t.Optional[PropertyLocker] = None) -> Animation:
+    track = compile_track(interpolation_function, first_keyframe, *keyframes)
+    alphas = eased_alphas(easing_function, num_frames)
 
     def alpha_animation(state: FrameState) -> FrameState | None:
         if state.num_processed_frames == state.num_total_frames:
             return None
+        alpha = alphas[state.num_processed_frames]
         state.num_processed_frames += 1
-        alpha =  easing_function(state.num_processed_frames / state.num_total_frames)
-        setter(interpolation_function(alpha, first_keyframe, *keyframes).get_interpolated_object())
+        setter(track(alpha).get_interpolated_object())
         return state
 
-    return construct(alpha_animation, FrameState(num_total_frames=num_frames, num_processed_frames=0), locker=locker)
+    def evaluate(frame: int | float):
+        if frame and isinstance(frame, int):
+            alpha = alphas[frame - 1]
+        else:
+            alpha = easing_function(frame / num_frames if frame else 0.0)
+        setter(track(alpha).get_interpolated_object())
+
+    return construct(alpha_animation, FrameState(num_total_frames=num_frames, num_processed_frames=0), locker=locker, total_frames=num_frames, evaluator=evaluate)
+
+
+_alphas_by_easing: "weakref.WeakKeyDictionary[t.Callable[[float], float], dict[int, tuple[float, ...]]]" = weakref.WeakKeyDictionary()
+
+
+def eased_alphas(easing_function: t.Callable[[float], float], num_frames: int) -> tuple[float, ...]:
+    """Returns the eased progression after each frame of an animation, which animations of the same length and easing share.
+
+    The progressions are cached for as long as their easing function is alive; easing functions that cannot be
+    weakly referenced are not cached.
+    """
+    by_frames = _alphas_by_easing.get(easing_function)
+    if by_frames is not None and num_frames in by_frames:
+        return by_frames[num_frames]
+    alphas = tuple(easing_function(frame / num_frames) for frame in range(1, num_frames + 1))
+    try:
+        _alphas_by_easing.setdefault(easing_function, {})[num_frames] = alphas
+    except TypeError:
+        pass
+    return alphas
 
 
 
 class _ConstructedAnimation(Animation, t.Generic[_T]):
-    def __init__(self, advancer: t.Callable[[_T], _T | None], locker: t.Optional[PropertyLocker], initial_state: _T):
+    def __init__(self, advancer: t.Callable[[_T], _T | None], locker: t.Optional[PropertyLocker], initial_state: _T, total_frames: int | None = None, evaluator: t.Optional[t.Callable[[int | float], None]] = None):
         super().__init__()
         self._state = initial_state
         if locker:
             self.locker.update(locker)
         self._advancer = advancer
         self._try_advance = True
+        self._total_frames = total_frames
+        self._evaluator = evaluator
+
+    def _count_frames(self) -> int | None:
+        return self._total_frames
+
+    def _is_random_access(self) -> bool:
+        return self._evaluator is not None and self._total_frames is not None
+
+    def _evaluate(self, advances: int | float) -> None:
+        assert self._evaluator is not None
+        self._evaluator(advances)
 
     def advance(self) -> bool:
         if self._try_advance:
@@ -109,13 +157,39 @@ class _LazyAnimation(Animation, t.Generic[_P]):
         self._init_args = args
         self._init_kwargs = kwargs
         self._animation: Animation | None = None
+        self._total_frames_hint: int | None = None
+        self._random_access_hint = False
+
+    def hint(self, total_frames: int, random_access: bool):
+        """Records the number of frames that this Animation is expected to generate, and whether the
+        :class:`~visuscript.Animation` that it will evaluate to supports random access."""
+        self._total_frames_hint = total_frames
+        self._random_access_hint = random_access
+
+    def _count_frames(self) -> int | None:
+        if self._animation is not None:
+            return self._animation.total_frames
+        return self._total_frames_hint
+
+    def _is_random_access(self) -> bool:
+        if self._animation is not None:
+            return self._animation._is_random_access()
+        return self._random_access_hint
+
+    def _evaluate(self, advances: int | float) -> None:
+        self._get_animation().at(advances)
 
     @t.no_type_check
-    def advance(self):
-        self._init_args, self._init_kwargs = evaluate_lazy(self._init_args, self._init_kwargs)
-        self._animation = self._animation_factory(*self._init_args, **self._init_kwargs)
-        del self._init_args, self._init_kwargs
+    def _get_animation(self) -> Animation:
+        if self._animation is None:
+            self._init_args, self._init_kwargs = evaluate_lazy(self._init_args, self._init_kwargs)
+            self._animation = self._animation_factory(*self._init_args, **self._init_kwargs)
+            del self._init_args, self._init_kwargs
+        return self._animation
 
+    @t.no_type_check
+    def advance(self):
+        self._get_animation()
         val = self._advance()
         self.advance = self._advance
         return val
@@ -125,6 +199,15 @@ class _LazyAnimation(Animation, t.Generic[_P]):
         return self._animation.next_frame()
     
 
+def hint_total_frames(animation: Animation, total_frames: int, random_access: bool = False) -> Animation:
+    """Records the number of frames that a lazy :class:`~visuscript.Animation` is expected to generate,
+    which serves as its :attr:`~visuscript.Animation.total_frames` until it is first advanced,
+    and whether the :class:`~visuscript.Animation` that it will evaluate to supports random access."""
+    if isinstance(animation, _LazyAnimation):
+        animation.hint(total_frames, random_access)
+    return animation
+
+
 def duration_to_frame_count(seconds: float | ConfigurationDeference = DEFER_TO_CONFIG) -> int:
     seconds = config.animation_duration if isinstance(seconds, ConfigurationDeference) else seconds
     return round(seconds * config.fps)
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Contains functions for interpolating between objects."""
+from bisect import bisect_left, bisect_right
 import typing as t
 
-from .protocols import Interpolable, Keyframe
+from .protocols import Interpolable, InterpolationFunction, Keyframe
 _T = t.TypeVar("_T")
 
 
@@ -10,6 +11,7 @@ __all__ = [
     "linearly_interpolate",
     "cattmul_rom_interpolate",
     "interpolate",
+    "compile_track",
 ]
 
 
@@ -93,6 +95,105 @@ def interpolate(alpha: float, first_keyframe: Keyframe[_T], *keyframes: Keyframe
 
 
 
+Track: t.TypeAlias = t.Callable[[float], Interpolable[_T]]
+"""An interpolation over fixed keyframes, as a function of the progress alpha alone."""
+
+
+def compile_track(interpolation_function: InterpolationFunction[_T], first_keyframe: Keyframe[_T], *keyframes: Keyframe[_T]) -> Track[_T]:
+    """Prepares an interpolation over fixed keyframes such that each subsequent evaluation is cheap.
+
+    For :func:`linearly_interpolate`, :func:`cattmul_rom_interpolate`, and :func:`interpolate`
+    with keyframes in order of progression, the segments are found by bisection and
+    the polynomial coefficients for each segment are computed once herein.
+    Each evaluation at the first or last progression returns the respective keyframe's value exactly.
+    Any other interpolation function is evaluated as is.
+
+    :return: A function of alpha that returns the same as ``interpolation_function(alpha, first_keyframe, *keyframes)``.
+    """
+    alphas = [first_keyframe[1], *(k[1] for k in keyframes)]
+    in_order = all(a <= b for a, b in zip(alphas, alphas[1:]))
+
+    if in_order and interpolation_function is linearly_interpolate:
+        return _LinearTrack(first_keyframe, keyframes)
+    if in_order and interpolation_function in (cattmul_rom_interpolate, interpolate):
+        if len(keyframes) == 0:
+            value = first_keyframe[0]
+            return lambda alpha: value
+        if len(keyframes) == 1:
+            return _LinearTrack(first_keyframe, keyframes)
+        return _CatmullRomTrack(first_keyframe, keyframes)
+
+    def track(alpha: float) -> Interpolable[_T]:
+        return interpolation_function(alpha, first_keyframe, *keyframes)
+    return track
+
+
+class _LinearTrack(t.Generic[_T]):
+    def __init__(self, first_keyframe: Keyframe[_T], keyframes: t.Sequence[Keyframe[_T]]):
+        all_keyframes = (first_keyframe, *keyframes)
+        self._values: list[Interpolable[_T]] = [k[0] for k in all_keyframes]
+        self._alphas: list[float] = [k[1] for k in all_keyframes]
+        self._differences: list[Interpolable[_T]] = [b - a for a, b in zip(self._values, self._values[1:])]
+
+    def __call__(self, alpha: float) -> Interpolable[_T]:
+        alphas = self._alphas
+        last = len(alphas) - 1
+        # As in linearly_interpolate, the first keyframe is only ever the start of a segment.
+        start = max(bisect_right(alphas, alpha, 1) - 1, 0)
+        end = min(bisect_left(alphas, alpha, 1), last)
+        if alphas[start] == alphas[end]:
+            return self._values[start]
+        sub_alpha = min(max((alpha - alphas[start]) / (alphas[end] - alphas[start]), 0), 1)
+        if sub_alpha == 0:
+            return self._values[start]
+        if sub_alpha == 1:
+            return self._values[end]
+        # Consecutive keyframes with differing progressions are adjacent, so start + 1 == end.
+        return self._values[start] + sub_alpha * self._differences[start]
+
+
+_Segment: t.TypeAlias = tuple[Interpolable[_T], Interpolable[_T], Interpolable[_T], Interpolable[_T], Interpolable[_T]]
+
+
+class _CatmullRomTrack(t.Generic[_T]):
+    def __init__(self, first_keyframe: Keyframe[_T], keyframes: t.Sequence[Keyframe[_T]]):
+        left_pad = (2*first_keyframe[0] - keyframes[0][0], 2*first_keyframe[1] - keyframes[0][1])
+        right_pad = (2*keyframes[-1][0] - keyframes[-2][0], 2*keyframes[-1][1] - keyframes[-2][1])
+        padded: tuple[Keyframe[_T], ...] = (left_pad, first_keyframe, *keyframes, right_pad)
+        values: list[Interpolable[_T]] = [k[0] for k in padded]
+        self._alphas: list[float] = [k[1] for k in padded]
+
+        # The coefficients of the cubic polynomial in t for each segment i, between values[i] and values[i + 1],
+        # stored at index i - 1.
+        self._segments: list[_Segment[_T]] = []
+        for i in range(1, len(values) - 2):
+            p0, p1, p2, p3 = values[i - 1 : i + 3]
+            self._segments.append((
+                p1,
+                (p2 - p0) * 0.5,
+                (2 * p0 - 5 * p1 + 4 * p2 - p3) * 0.5,
+                (3 * p1 - 3 * p2 + p3 - p0) * 0.5,
+                p2,
+            ))
+
+    def __call__(self, alpha: float) -> Interpolable[_T]:
+        alphas = self._alphas
+        last = len(alphas) - 3
+        i = min(max(bisect_left(alphas, alpha, 2, last + 1) - 1, 1), last)
+        c0, c1, c2, c3, end = self._segments[i - 1]
+
+        start_alpha, end_alpha = alphas[i], alphas[i + 1]
+        if end_alpha == start_alpha:
+            return c0
+        t = (alpha - start_alpha) / (end_alpha - start_alpha)
+        if t <= 0:
+            return c0
+        if t >= 1:
+            return end
+        return c0 + (c1 + (c2 + c3 * t) * t) * t
+
+
+
 # def bezier_interpolate(alpha: float, first_keyframe: Keyframe[_T], *keyframes: Keyframe[_T]) -> Interpolable[_T]:
 #     if len(keyframes) == 0:
 #         return first_keyframe[0]
@@ -1,26 +1,45 @@
 from abc import ABC, abstractmethod
+from fractions import Fraction
+import math
 import typing as t
 
 from visuscript.property_locker import PropertyLocker
+from visuscript.profiling import creation_site
+from visuscript.config import config
 
 
+def _as_speed(speed: float) -> int | Fraction:
+    """Returns an animation speed as an int if it is whole and otherwise as a Fraction, so that frame counts derived from it are exact."""
+    if isinstance(speed, int):
+        return speed
+    fraction = Fraction(speed).limit_denominator(1_000_000)
+    return fraction.numerator if fraction.denominator == 1 else fraction
+
+
+def _as_advances(advances: int | float | Fraction) -> int | float:
+    """Returns a number of advances as an int if it is whole and otherwise as a float."""
+    if isinstance(advances, int):
+        return advances
+    return int(advances) if advances == int(advances) else float(advances)
+
 
 
 class Animation(ABC):
     """Modifies one or more objects over time when added to a :class:`~visuscript.Scene`."""
 
-    _num_processed_frames = 0
-    _num_advances = 0
-    _animation_speed = 1
-    _keep_advancing = True
+    _num_processed_frames: int = 0
+    _num_advances: int = 0
+    _animation_speed: int | Fraction = 1
+    _keep_advancing: bool = True
+    _smooth: bool | None = None
+    _creation_site: str | None = None
 
 
     def __init__(self):
         self.__locker__ = PropertyLocker()
+        self._creation_site = creation_site()
 
 
-    # TODO consider changing interface to return True if there is a next frame.
-    # This would allow fractional speed controls
     @abstractmethod
     def advance(self) -> bool:
         """Makes the changes for one frame of the animation when at animation speed 1.
@@ -32,9 +51,16 @@ class Animation(ABC):
     def next_frame(self) -> bool:
         """Makes the changes for one frame of the animation, accounting for the set animation speed.
 
+        At a fractional speed, an Animation that supports random access is evaluated between its advances,
+        and any other Animation repeats the state after its last whole advance.
+
         :return: True if this Animation had any frames left before it was called.
         """
         self._num_advances += 1
+        if self._smooth is None:
+            self._smooth = not isinstance(self._animation_speed, int) and self._is_random_access()
+        if self._smooth:
+            return self._next_frame_smoothly()
         num_to_advance = int(
             self._animation_speed * self._num_advances - self._num_processed_frames
         )
@@ -48,6 +74,97 @@ class Animation(ABC):
 
         return self._keep_advancing
 
+    def _next_frame_smoothly(self) -> bool:
+        if not self._keep_advancing:
+            return False
+        frames = self._count_frames()
+        assert frames is not None
+        progress: int | Fraction = self._animation_speed * self._num_advances
+        self._evaluate(_as_advances(progress if progress < frames else frames))
+        # A lazy Animation knows its exact number of frames only once evaluated.
+        frames = self._count_frames()
+        assert frames is not None
+        # As when advancing whole frames, the frame is the last only once an advance beyond the end would be needed.
+        self._keep_advancing = math.floor(progress) <= frames
+        return self._keep_advancing
+
+    def _count_frames(self) -> int | None:
+        """Returns the number of frames that this Animation generates at speed 1, or None if that is not known in advance."""
+        return None
+
+    @property
+    def total_frames(self) -> int | None:
+        """The number of frames that this Animation generates from its start, accounting for the set animation speed,
+        or None if that cannot be known without running it."""
+        frames = self._count_frames()
+        if frames is None:
+            return None
+        # The number of frames before the one that would require an advance beyond the last.
+        return math.ceil((frames + 1) / self._animation_speed) - 1
+
+    @property
+    def duration(self) -> float | None:
+        """The length of this Animation in seconds, at :attr:`config.fps <visuscript.config.config>` and accounting for the set animation speed,
+        or None if that cannot be known without running it."""
+        frames = self._count_frames()
+        if frames is None:
+            return None
+        return float(frames / self._animation_speed / config.fps)
+
+    def _is_random_access(self) -> bool:
+        """Returns True if and only if :meth:`_evaluate` is implemented for this Animation."""
+        return False
+
+    def _evaluate(self, advances: int | float) -> None:
+        """Sets everything controlled by this Animation to the state in which it would be after the given number of advances,
+        regardless of which advances have already been made.
+
+        :param advances: The number of advances, at most the number of frames that this Animation generates at speed 1.
+            A fractional number of advances is interpolated between the whole advances on either side.
+        """
+        raise NotImplementedError(f"{self} does not support random access.")
+
+    def at(self, frame: float) -> None:
+        """Sets everything controlled by this Animation to the state in which it would be after the given number of frames,
+        without generating the frames in between.
+
+        Objects that are animated only by parts of this Animation that would not yet have started are left as they are.
+        This does not change the frames that are subsequently generated by :meth:`next_frame`.
+
+        :param frame: The number of frames, accounting for the set animation speed, which may be fractional.
+            Frames beyond the last are treated as the last.
+        :raises ValueError: If `frame` is negative.
+        :raises NotImplementedError: If this Animation does not support random access,
+            as is the case for :func:`~visuscript.animation.run`, :func:`~visuscript.animation.animate_updater`,
+            and Animations built with :func:`~visuscript.animation.construct` without an `evaluator`.
+        """
+        if frame < 0:
+            raise ValueError("Cannot evaluate an Animation at a negative frame.")
+        if not self._is_random_access():
+            raise NotImplementedError(f"{self} does not support random access.")
+        advances = self._count_frames()
+        assert advances is not None
+        total_frames = self.total_frames
+        assert total_frames is not None
+        if frame < total_frames:
+            advances = min(advances, frame * self._animation_speed)
+        self._evaluate(_as_advances(advances))
+
+    def at_time(self, seconds: float) -> None:
+        """Sets everything controlled by this Animation to the state in which it would be after the given number of seconds,
+        at :attr:`config.fps <visuscript.config.config>`, as per :meth:`at`."""
+        self.at(seconds * config.fps)
+
+    def resample(self, fps: float) -> "_ResampledAnimation":
+        """Returns a version of this Animation that generates frames at another frame rate over the same duration,
+        evaluating this Animation between its own frames where necessary.
+
+        This Animation must support random access, as per :meth:`at`.
+
+        :param fps: The frames per second of the returned Animation, relative to :attr:`config.fps <visuscript.config.config>` for this one.
+        """
+        return _ResampledAnimation(self, fps)
+
     @property
     def locker(self) -> PropertyLocker:
         """
@@ -58,19 +175,28 @@ class Animation(ABC):
     def finish(self) -> None:
         """
         Brings the animation to a finish instantly, leaving everything controlled by the animation in the state in which it would have been had the animation completed naturally.
+
+        An Animation that supports random access is evaluated at its last frame directly, rather than by generating each remaining frame.
         """
+        if self._keep_advancing and self._is_random_access():
+            total_frames = self.total_frames
+            assert total_frames is not None
+            self.at(total_frames)
+            self._keep_advancing = False
+            return
         while self.next_frame():
             pass
 
-    def set_speed(self, speed: int) -> t.Self:
+    def set_speed(self, speed: float) -> t.Self:
         """Sets the playback speed for this Animation.
 
-        :param speed: The new duration of this :class:`Animation` will be duration/speed.
+        :param speed: The new duration of this :class:`Animation` will be duration/speed. A speed below 1 slows this Animation down.
         :return: self
         """
-        if not isinstance(speed, int) or speed <= 0:  # type: ignore
-            raise ValueError("Animation speed must be a positive integer.")
-        self._animation_speed = speed
+        if not isinstance(speed, (int, float, Fraction)) or speed <= 0:  # type: ignore
+            raise ValueError("Animation speed must be a positive number.")
+        self._animation_speed = _as_speed(speed)
+        self._smooth = None
         return self
 
     def compress(self) -> "_CompressedAnimation":
@@ -99,4 +225,53 @@ class _CompressedAnimation(Animation):
         advanced = False
         while self._animation.next_frame():
             advanced = True
-        return advanced
\ No newline at end of file
+        return advanced
+
+    def _count_frames(self) -> int | None:
+        frames = self._animation.total_frames
+        return None if frames is None else min(frames, 1)
+
+    def _is_random_access(self) -> bool:
+        return self._animation._is_random_access()
+
+    def _evaluate(self, advances: int | float) -> None:
+        total_frames = self._animation.total_frames
+        assert total_frames is not None
+        self._animation.at(total_frames if advances else 0)
+
+
+class _ResampledAnimation(Animation):
+    """:class:`_ResampledAnimation` wraps around another :class:`Animation` that supports random access,
+    generating a frame at each multiple of a frame interval other than that of :attr:`config.fps <visuscript.config.config>`."""
+
+    def __init__(self, animation: Animation, fps: float):
+        super().__init__()
+        if fps <= 0:
+            raise ValueError("The frames per second must be positive.")
+        if not animation._is_random_access():
+            raise NotImplementedError(f"{animation} does not support random access and so cannot be resampled.")
+        self._animation = animation
+        self._step = Fraction(config.fps) / _as_speed(fps)
+        self._frame = 0
+        self.locker.update(animation.locker)
+
+    def _count_frames(self) -> int | None:
+        frames = self._animation._count_frames()
+        if frames is None:
+            return None
+        return math.ceil(frames / self._animation._animation_speed / self._step)
+
+    def _is_random_access(self) -> bool:
+        return True
+
+    def _evaluate(self, advances: int | float) -> None:
+        self._animation.at(_as_advances(advances * self._step))
+
+    def advance(self) -> bool:
+        frames = self._count_frames()
+        assert frames is not None
+        if self._frame == frames:
+            return False
+        self._frame += 1
+        self._evaluate(self._frame)
+        return True
@@ -10,7 +10,7 @@ from visuscript.property_locker import PropertyLocker
 
 from .protocols import Setter, InterpolationFunction, Keyframe, Interpolable
 from .primatives import Animation
-from .constructors import laze, keyframe_construct, duration_to_frame_count
+from .constructors import laze, keyframe_construct, duration_to_frame_count, hint_total_frames
 from .easing import sin_easing2
 from .interpolation import interpolate
 
@@ -43,6 +43,11 @@ def _parse_interpolation_kwargs(kwargs: _InterpolationKwargs[_T], default_easing
     )
 
 
+def _total_frames(kwargs: _InterpolationKwargs[_T]) -> int:
+    """Returns the number of frames in an interpolation-like animation with the given keyword arguments."""
+    return duration_to_frame_count(kwargs.get("duration") or DEFER_TO_CONFIG)
+
+
 def _get_evenly_space_keyframes(first_state: Interpolable[_T], states: t.Sequence[Interpolable[_T]]) -> tuple[Keyframe[_T], tuple[Keyframe[_T], ...]]:
     num_states = len(states)
     return (
@@ -126,7 +131,7 @@ def _eager_animate_translation(obj: Transform, first_target: Vec2.Vec2Like | tup
         **kwargs,
         )
 def animate_translation(obj: Transform, first_target: Vec2.Vec2Like | tuple[Vec2.Vec2Like, float], *targets: Vec2.Vec2Like | tuple[Vec2.Vec2Like, float], initial: t.Optional[Vec2.Vec2Like | tuple[Vec2.Vec2Like, float]] = None, **kwargs: t.Unpack[_InterpolationKwargs[Vec2]]):
-    return laze(PropertyLocker({obj: ["translation"]}), _eager_animate_translation, obj, first_target, *targets, initial=initial or make_lazy(obj).translation, **kwargs)
+    return hint_total_frames(laze(PropertyLocker({obj: ["translation"]}), _eager_animate_translation, obj, first_target, *targets, initial=initial or make_lazy(obj).translation, **kwargs), _total_frames(kwargs), random_access=True)
 
 def _eager_animate_scale(obj: Transform, first_target: Vec2.Vec2Like | float | tuple[Vec2.Vec2Like | float, float], *targets: Vec2.Vec2Like | float | tuple[Vec2.Vec2Like | float, float], initial: t.Optional[Vec2.Vec2Like | float | tuple[Vec2.Vec2Like, float]] = None, **kwargs: t.Unpack[_InterpolationKwargs[Vec2]]):
     def converter(scale: Vec2.Vec2Like | float):
@@ -141,7 +146,7 @@ def _eager_animate_scale(obj: Transform, first_target: Vec2.Vec2Like | float | t
         **kwargs,
         )
 def animate_scale(obj: Transform, first_target: Vec2.Vec2Like | float | tuple[Vec2.Vec2Like | float, float], *targets: Vec2.Vec2Like | float | tuple[Vec2.Vec2Like | float, float], initial: t.Optional[Vec2.Vec2Like | float | tuple[Vec2.Vec2Like, float]] = None, **kwargs: t.Unpack[_InterpolationKwargs[Vec2]]):
-    return laze(PropertyLocker({obj: ["scale"]}), _eager_animate_scale, obj, first_target, *targets, initial=initial or make_lazy(obj).scale, **kwargs)
+    return hint_total_frames(laze(PropertyLocker({obj: ["scale"]}), _eager_animate_scale, obj, first_target, *targets, initial=initial or make_lazy(obj).scale, **kwargs), _total_frames(kwargs), random_access=True)
 
 def _eager_animate_rotation(obj: Transform, first_target: float | tuple[float, float], *targets: float | tuple[float, float], initial: t.Optional[float | tuple[float, float]] = None, **kwargs: t.Unpack[_InterpolationKwargs[float]]):
     convert = _get_convert_object_maybe_in_tuple(InterpolableFloat)
@@ -154,7 +159,7 @@ def _eager_animate_rotation(obj: Transform, first_target: float | tuple[float, f
         **kwargs,
         )
 def animate_rotation(obj: Transform, first_target: float | tuple[float, float], *targets: float | tuple[float, float], initial: t.Optional[float | tuple[float, float]] = None, **kwargs: t.Unpack[_InterpolationKwargs[float]]):
-    return laze(PropertyLocker({obj: ["rotation"]}), _eager_animate_rotation, obj, first_target, *targets, initial=initial or make_lazy(obj).rotation, **kwargs)
+    return hint_total_frames(laze(PropertyLocker({obj: ["rotation"]}), _eager_animate_rotation, obj, first_target, *targets, initial=initial or make_lazy(obj).rotation, **kwargs), _total_frames(kwargs), random_access=True)
 
 
 def _eager_animate_rgb(obj: HasRgb, first_target: Rgb.RgbLike | tuple[Rgb.RgbLike, float], *targets: Rgb.RgbLike | tuple[Rgb.RgbLike, float], initial: t.Optional[Rgb.RgbLike | tuple[Rgb.RgbLike, float]] = None, **kwargs: t.Unpack[_InterpolationKwargs[Rgb]]):
@@ -175,7 +180,7 @@ def _eager_animate_rgb(obj: HasRgb, first_target: Rgb.RgbLike | tuple[Rgb.RgbLik
         )
 
 def animate_rgb(obj: HasRgb, first_target: Rgb.RgbLike | tuple[Rgb.RgbLike, float], *targets: Rgb.RgbLike | tuple[Rgb.RgbLike, float], initial: t.Optional[Rgb.RgbLike | tuple[Rgb.RgbLike, float]] = None, **kwargs: t.Unpack[_InterpolationKwargs[Rgb]]):
-    return laze(PropertyLocker({obj: ["rgb"]}), _eager_animate_rgb, obj, first_target, *targets, initial=initial or make_lazy(obj).rgb, **kwargs)
+    return hint_total_frames(laze(PropertyLocker({obj: ["rgb"]}), _eager_animate_rgb, obj, first_target, *targets, initial=initial or make_lazy(obj).rgb, **kwargs), _total_frames(kwargs), random_access=True)
 
 def _eager_animate_opacity(obj: HasOpacity, first_target: float | tuple[float, float], *targets: float | tuple[float, float], initial: t.Optional[float | tuple[float, float]] = None, **kwargs: t.Unpack[_InterpolationKwargs[float]]):
     convert = _get_convert_object_maybe_in_tuple(InterpolableFloat)
@@ -191,5 +196,5 @@ def _eager_animate_opacity(obj: HasOpacity, first_target: float | tuple[float, f
         )
 
 def animate_opacity(obj: HasOpacity, first_target: float | tuple[float, float], *targets: float | tuple[float, float], initial: t.Optional[float | tuple[float, float]] = None, **kwargs: t.Unpack[_InterpolationKwargs[float]]):
-    return laze(PropertyLocker({obj: ["opacity"]}), _eager_animate_opacity, obj, first_target, *targets, initial=initial or make_lazy(obj).opacity, **kwargs)
+    return hint_total_frames(laze(PropertyLocker({obj: ["opacity"]}), _eager_animate_opacity, obj, first_target, *targets, initial=initial or make_lazy(obj).opacity, **kwargs), _total_frames(kwargs), random_access=True)
     
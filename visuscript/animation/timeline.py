@@ -0,0 +1,155 @@
+"""Contains :class:`Timeline`, which runs a tree of nested :class:`~visuscript.animation.AnimationSequence`
+and :class:`~visuscript.animation.AnimationBundle` instances by advancing only the leaves thereof that are running.
+"""
+
+import heapq
+from typing import cast
+
+from visuscript.profiling import Profiler
+
+from .primatives import Animation
+from .animation_store import AnimationSequence, AnimationBundle
+
+_LEAF = 0
+_SEQUENCE = 1
+_BUNDLE = 2
+
+
+class _Node:
+    __slots__ = ("animation", "kind", "index", "parent", "children", "position", "remaining")
+
+    def __init__(self, animation: Animation, kind: int, index: int, parent: "_Node | None"):
+        self.animation = animation
+        self.kind = kind
+        self.index = index
+        self.parent = parent
+        self.children: list[_Node] = []
+        self.position = 0
+        self.remaining = 0
+
+
+def _kind(animation: Animation) -> int:
+    """Returns the kind of node as which an Animation is compiled.
+
+    Only sequences and bundles whose behavior is exactly that of the base classes are flattened;
+    those that are subclassed, sped up, or already advanced are run as leaves.
+    """
+    if animation._animation_speed != 1 or animation._num_advances != 0:  # type: ignore[reportPrivateUsage]
+        return _LEAF
+    if type(animation) is AnimationSequence:
+        return _SEQUENCE
+    if type(animation) is AnimationBundle:
+        return _BUNDLE
+    return _LEAF
+
+
+class Timeline(Animation):
+    """Runs an :class:`~visuscript.animation.Animation` that nests sequences and bundles,
+    generating exactly the same frames, in the same order, as would the :class:`~visuscript.animation.Animation` itself.
+
+    The tree is flattened once, in depth-first order, into nodes that know their parents.
+    Each frame advances only the leaf animations that are running, in depth-first order,
+    rather than descending through every sequence and bundle and advancing every finished child therein.
+    When a leaf finishes, the node that follows it is started within the same frame.
+    The per-frame cost thereby depends only on the number of running leaves.
+    """
+
+    def __init__(self, animation: Animation, profiler: Profiler | None = None):
+        """
+        :param animation: The :class:`~visuscript.animation.Animation` to run, which must be neither advanced
+            other than through this Timeline nor pushed into thereafter.
+        :param profiler: The :class:`~visuscript.profiling.Profiler` that measures each advance of each leaf, or None for none.
+        """
+        super().__init__()
+        self.__locker__ = animation.locker
+        self._animation = animation
+        self._nodes: list[_Node] = []
+        self._compile(animation, None)
+        self._active: list[int] | None = None
+        self._heap: list[int] = []
+        self._finished = False
+        self._profiler = profiler
+
+    def _compile(self, animation: Animation, parent: _Node | None) -> _Node:
+        node = _Node(animation, _kind(animation), len(self._nodes), parent)
+        self._nodes.append(node)
+        if node.kind != _LEAF:
+            composite = cast(AnimationSequence | AnimationBundle, animation)
+            node.children = [
+                self._compile(child, node)
+                for child in composite._animations  # type: ignore[reportPrivateUsage]
+            ]
+        return node
+
+    def __len__(self) -> int:
+        """The number of nodes in the flattened tree."""
+        return len(self._nodes)
+
+    @property
+    def num_running(self) -> int:
+        """The number of leaf animations that were running after the last frame."""
+        return len(self._active or ())
+
+    def _start(self, node: _Node):
+        if node.kind == _LEAF:
+            heapq.heappush(self._heap, node.index)
+        elif not node.children:
+            self._end(node)
+        elif node.kind == _SEQUENCE:
+            node.position = 0
+            self._start(node.children[0])
+        else:
+            node.remaining = len(node.children)
+            for child in node.children:
+                self._start(child)
+
+    def _end(self, node: _Node):
+        parent = node.parent
+        if parent is None:
+            self._finished = True
+        elif parent.kind == _SEQUENCE:
+            parent.position += 1
+            if parent.position < len(parent.children):
+                self._start(parent.children[parent.position])
+            else:
+                self._end(parent)
+        else:
+            parent.remaining -= 1
+            if parent.remaining == 0:
+                self._end(parent)
+
+    def advance(self) -> bool:
+        if self._finished:
+            return False
+        if self._active is None:
+            self._start(self._nodes[0])
+        else:
+            self._heap = self._active
+
+        nodes = self._nodes
+        heap = self._heap
+        profiler = self._profiler
+        running: list[int] = []
+        while heap:
+            index = heapq.heappop(heap)
+            animation = nodes[index].animation
+            if profiler is None:
+                advanced = animation.next_frame()
+            else:
+                advanced = profiler.measure(animation, animation.next_frame)
+            if advanced:
+                running.append(index)
+            else:
+                self._end(nodes[index])
+        # Popped in increasing order, the running leaves already form a heap for the next frame.
+        self._active = running
+        return not self._finished
+
+    def _count_frames(self) -> int | None:
+        return self._animation.total_frames
+
+    def _is_random_access(self) -> bool:
+        return self._animation._is_random_access()
+
+    def _evaluate(self, advances: int | float) -> None:
+        self._animation.at(advances)
@@ -1,11 +1,15 @@
-"""Creates a video file from an input stream of plain-text SVG files."""
+"""Creates a video file from an input stream of plain-text SVG files.
+
+The stream may be encoded as described in :mod:`visuscript.frame_encoding`."""
 
 import sys
 import os
 import subprocess
 import tempfile
+import shutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from visuscript.cli.utility import convert_svg_to_png, check_tool_availability
+from visuscript.frame_encoding import is_repeat_frame, FrameDecoder
 
 
 def main():
@@ -23,13 +27,26 @@ def main():
     output_file = sys.argv[2]
 
     svg_files: list[str] = []
+    # Maps the number of each repeated frame to that of the frame it repeats.
+    repeated_frames: dict[int, int] = {}
+    frame_decoder = FrameDecoder()
     with tempfile.TemporaryDirectory() as temp_dir:
         counter = 1
         for svg_blob in sys.stdin:
+            if is_repeat_frame(svg_blob):
+                if counter == 1:
+                    print(
+                        "Received a repeated frame before any frame to repeat. Exiting.",
+                        file=sys.stderr,
+                    )
+                    sys.exit(1)
+                repeated_frames[counter] = repeated_frames.get(counter - 1, counter - 1)
+                counter += 1
+                continue
             svg_file_path = os.path.join(temp_dir, f"frame_{counter:09d}.svg")
             try:
                 with open(svg_file_path, "w", encoding="utf-8") as f:
-                    f.write(svg_blob)
+                    f.write(frame_decoder.decode(svg_blob))
                 svg_files.append(svg_file_path)
                 counter += 1
             except IOError as e:
@@ -37,6 +54,9 @@ def main():
                     f"Error writing SVG to file {svg_file_path}: {e}", file=sys.stderr
                 )
                 sys.exit(1)
+            except ValueError as e:
+                print(f"Error decoding frame {counter}: {e}", file=sys.stderr)
+                sys.exit(1)
 
         if not svg_files:
             print("No SVG data received from stdin. Exiting.", file=sys.stderr)
@@ -70,6 +90,18 @@ def main():
             f"Successfully converted {len(svg_files)} frames to PNG.", file=sys.stderr
         )
 
+        for frame_number, original_frame_number in repeated_frames.items():
+            shutil.copyfile(
+                os.path.join(temp_dir, f"frame_{original_frame_number:09d}.png"),
+                os.path.join(temp_dir, f"frame_{frame_number:09d}.png"),
+            )
+
+        if repeated_frames:
+            print(
+                f"Reused PNGs for {len(repeated_frames)} repeated frames.",
+                file=sys.stderr,
+            )
+
         png_pattern = os.path.join(temp_dir, "frame_%09d.png")
 
         ffmpeg_command = [
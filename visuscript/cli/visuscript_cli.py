@@ -15,7 +15,9 @@ import os
 from pathlib import Path
 
 from visuscript.config import config
+from visuscript.constants import OutputFormat
 from visuscript import Color
+from visuscript.profiling import Profiler
 
 THEME = ["dark", "light"]
 
@@ -69,6 +71,37 @@ def main():
         action="store_true",
         help="If set, outputs a slideshow metadata file in the same directory as the video file, with the same name but suffixed with .json",
     )
+    parser.add_argument(
+        "--skip_unchanged_frames",
+        action="store_true",
+        help="If set, frames in which nothing has changed are not redrawn but reuse the previous frame.",
+    )
+    parser.add_argument(
+        "--svg_diff",
+        action="store_true",
+        help="If set, frames are sent to the renderer as periodic keyframes and, in between, patches of what changed.",
+    )
+    parser.add_argument(
+        "--optimize_svg",
+        action="store_true",
+        help="If set, attributes shared among drawn elements are hoisted and repeated elements are instanced, which shrinks each frame at the cost of more time spent drawing it.",
+    )
+    parser.add_argument(
+        "--compile_hierarchy",
+        action="store_true",
+        help="If set, the global transforms and opacities of all drawn elements are computed together in bulk before each frame, which is faster for large hierarchies.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="If set, the time spent on and the modifications made by each animation and updater, by where it was created, are printed to stderr after rendering.",
+    )
+    parser.add_argument(
+        "--svg_precision",
+        default=3,
+        type=int,
+        help="The number of decimal places to which numbers in the emitted SVG are rounded.",
+    )
 
     parser.add_argument("--theme", default="dark", choices=THEME)
 
@@ -88,6 +121,18 @@ def main():
 
     slideshow: bool = args.slideshow
 
+    skip_unchanged_frames: bool = args.skip_unchanged_frames
+
+    svg_diff: bool = args.svg_diff
+
+    svg_precision: int = args.svg_precision
+
+    optimize_svg: bool = args.optimize_svg
+
+    compile_hierarchy: bool = args.compile_hierarchy
+
+    profile: bool = args.profile
+
     if not os.path.exists(input_filename):
         print(
             f'visuscript error: File "{input_filename}" does not exists.',
@@ -127,6 +172,20 @@ def main():
 
     config.fps = fps
 
+    config.scene_skip_unchanged_frames = skip_unchanged_frames
+
+    if svg_diff:
+        config.scene_output_format = OutputFormat.SVG_DIFF
+
+    config.svg_precision = svg_precision
+
+    config.scene_optimize_svg = optimize_svg
+
+    config.scene_compile_hierarchy = compile_hierarchy
+
+    if profile:
+        config.scene_profiler = Profiler()
+
     config.scene_output_stream = animate_proc.stdin
 
     slideshow_file = None
@@ -156,6 +215,10 @@ def main():
         if hasattr(mod, "main"):
             mod.main()
 
+        if config.scene_profiler is not None:
+            config.scene_profiler.close()
+            print(config.scene_profiler.report(), file=sys.stderr)
+
         if animate_proc.stdin is None:
             print(
                 "There was an internal problem communicating with the animation subprocess."
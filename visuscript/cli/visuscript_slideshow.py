@@ -1,4 +1,6 @@
-"""Creates a multi-page PDF from an input stream of plain-text SVG files."""
+"""Creates a multi-page PDF from an input stream of plain-text SVG files.
+
+The stream may be encoded as described in :mod:`visuscript.frame_encoding`."""
 
 import sys
 import os
@@ -6,6 +8,7 @@ import subprocess
 import tempfile
 import glob
 from visuscript.cli.utility import check_tool_availability
+from visuscript.frame_encoding import FrameDecoder
 
 
 def main():
@@ -23,8 +26,14 @@ def main():
     with tempfile.TemporaryDirectory() as temp_dir:
         counter = 1
         svg_file_paths: list[str] = []
+        frame_decoder = FrameDecoder()
 
         for svg_blob in sys.stdin:
+            try:
+                svg_blob = frame_decoder.decode(svg_blob)
+            except ValueError as e:
+                print(f"Error decoding frame {counter}: {e}", file=sys.stderr)
+                sys.exit(1)
             svg_file_path = os.path.join(temp_dir, f"temp_{counter:09d}.svg")
             try:
                 with open(svg_file_path, "w", encoding="utf-8") as f:
@@ -2,6 +2,9 @@ import sys
 
 from visuscript.constants import OutputFormat
 from visuscript.mixins import Color
+from visuscript.primatives import Rgb
+from visuscript._internal import _number_format
+from visuscript.profiling import Profiler
 
 
 class _AnimationConfig:
@@ -16,53 +19,68 @@ class _AnimationConfig:
         self.scene_logical_width = 480
         self.scene_logical_height = 270
         self.scene_output_format = OutputFormat.SVG
-        self._scene_color = Color("dark_slate", 1)
+        # Color defaults are stored as immutable (Rgb, opacity) pairs, which drawables share until they are modified.
+        self._scene_color: tuple[Rgb, float] = (Rgb.construct("dark_slate"), 1)
         self.scene_output_stream = sys.stdout
+        self.scene_skip_unchanged_frames = False
+        self.scene_keyframe_interval = 30
+        self.scene_optimize_svg = False
+        self.scene_compile_hierarchy = False
+        self.scene_profiler: Profiler | None = None
 
         # Drawing
-        self._element_stroke = Color("off_white", 1)
+        self._element_stroke: tuple[Rgb, float] = (Rgb.construct("off_white"), 1)
         self.element_stroke_width = 1
-        self._element_fill = Color("off_white", 0.0)
+        self._element_fill: tuple[Rgb, float] = (Rgb.construct("off_white"), 0.0)
 
         # Text
         self.text_font_size = 16
         self.text_font_family = "arial"
-        self._text_fill = Color("off_white", 1)
+        self._text_fill: tuple[Rgb, float] = (Rgb.construct("off_white"), 1)
 
         # Slideshow
         self.slideshow_metadata_output_stream = sys.stderr
 
     @property
-    def scene_color(self):
-        return Color.construct(self._scene_color)
+    def svg_precision(self) -> int | None:
+        """The number of decimal places to which numbers in emitted SVG are rounded, or None for full precision."""
+        return _number_format.get_precision()
+
+    @svg_precision.setter
+    def svg_precision(self, value: int | None):
+        _number_format.set_precision(value)
+
+    @property
+    def scene_color(self) -> Color:
+        return Color(*self._scene_color)
 
     @scene_color.setter
-    def scene_color(self, value: Color):
-        self._scene_color = Color.construct(value)
+    def scene_color(self, value: Color.ColorLike):
+        self._scene_color = Color.components(value)
 
     @property
-    def element_stroke(self):
-        return Color.construct(self._element_stroke)
+    def element_stroke(self) -> Color:
+        return Color(*self._element_stroke)
 
     @element_stroke.setter
-    def element_stroke(self, value: Color):
-        self._element_stroke = Color.construct(value)
+    def element_stroke(self, value: Color.ColorLike):
+        self._element_stroke = Color.components(value)
 
     @property
-    def element_fill(self):
-        return Color.construct(self._element_fill)
+    def element_fill(self) -> Color:
+        return Color(*self._element_fill)
 
     @element_fill.setter
-    def element_fill(self, value: Color):
-        self._element_fill = Color.construct(value)
+    def element_fill(self, value: Color.ColorLike):
+        self._element_fill = Color.components(value)
 
     @property
-    def text_fill(self):
-        return Color.construct(self._text_fill)
+    def text_fill(self) -> Color:
+        return Color(*self._text_fill)
 
     @text_fill.setter
-    def text_fill(self, value: Color):
-        self._text_fill = Color.construct(value)
+    def text_fill(self, value: Color.ColorLike):
+        self._text_fill = Color.components(value)
 
 
 config: _AnimationConfig = _AnimationConfig()
@@ -25,6 +25,11 @@ class OutputFormat(IntEnum):
     """
 
     SVG = auto()
+    """Each frame is output as a complete SVG document."""
+    SVG_DIFF = auto()
+    """Frames are output as periodic SVG keyframes and, in between, patches listing only what changed.
+
+    See :mod:`visuscript.frame_encoding`."""
 
 
 class LineTarget(IntEnum):
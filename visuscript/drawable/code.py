@@ -1,6 +1,7 @@
 # type: ignore
 from visuscript.mixins import HierarchicalDrawable, AnchorMixin
 from visuscript.primatives import Vec2
+from visuscript._internal._number_format import format_number
 from pygments import highlight
 from pygments.lexers import PythonLexer as _PythonLexer
 from pygments.formatters import SvgFormatter as _SvgFormatter
@@ -93,9 +94,9 @@ class PythonText(HierarchicalDrawable, AnchorMixin):
 
         line_number = line_counter()
         fix_y_coordinate = (
-            lambda _: f'x="{x_offset}" y="{line_number() * (self._spacing) + self._font_size + y_offset}"'
+            lambda _: f'x="{format_number(x_offset)}" y="{format_number(line_number() * (self._spacing) + self._font_size + y_offset)}"'
         )
         code = re.sub(r'x="([-\d\.]+)" y="([-\d\.]+)"', fix_y_coordinate, code)
 
-        element = f'<g font-family="monospace" font-size="{self._font_size}" transform="{self.global_transform.svg_transform}">{code}</g>'
+        element = f'<g font-family="monospace" font-size="{format_number(self._font_size)}" transform="{self.global_transform.svg_transform}">{code}</g>'
         return element
@@ -13,6 +13,7 @@ from visuscript.primatives import Vec2
 from visuscript.constants import LineTarget
 from visuscript.config import ConfigurationDeference, DEFER_TO_CONFIG, config
 from visuscript.math_utility import magnitude
+from visuscript._internal._epoch import advance_epoch
 from visuscript.animation import (
     fade_in,
     fade_out,
@@ -311,6 +312,7 @@ class Edges(Drawable):
 
         edge = Line(source=element1, destination=element2).set_opacity(0.0)
         self._edges[(element1, element2)] = edge
+        advance_epoch()
 
         return fade_in(edge, duration=duration)
 
@@ -332,12 +334,17 @@ class Edges(Drawable):
             edge = self._edges.pop((element2, element1))
 
         self._fading_away.add(edge)
+        advance_epoch()
 
         return sequence(
             fade_out(edge, duration=duration),
-            run(self._fading_away.remove, edge),
+            run(self._remove_faded, edge),
         )
 
+    def _remove_faded(self, edge: Line):
+        self._fading_away.remove(edge)
+        advance_epoch()
+
     def draw(self):
         drawing = ""
         for edge in self._edges.values():
@@ -8,6 +8,7 @@ from visuscript.mixins import (
     OpacityMixin,
 )
 from visuscript.constants import Anchor
+from visuscript._internal._number_format import format_number
 
 
 class Drawing(
@@ -39,10 +40,10 @@ class Drawing(
         return f"""<path \
 d="{self._path.path_str}" \
 transform="{self.global_transform.svg_transform}" \
-stroke="{self.stroke.rgb}" \
-stroke-opacity="{self.stroke.opacity}" \
-stroke-width="{self.stroke_width}" \
-fill="{self.fill.rgb}" \
-fill-opacity="{self.fill.opacity}" \
-opacity="{self.global_opacity}"\
+stroke="{self.stroke.rgb.svg}" \
+stroke-opacity="{format_number(self.stroke.opacity)}" \
+stroke-width="{format_number(self.stroke_width)}" \
+fill="{self.fill.rgb.svg}" \
+fill-opacity="{format_number(self.fill.opacity)}" \
+opacity="{format_number(self.global_opacity)}"\
 />"""
@@ -10,6 +10,8 @@ from visuscript.mixins import (
 
 from visuscript.segment import Path
 from visuscript.constants import Anchor
+from visuscript._internal._epoch import advance_epoch
+from visuscript._internal._number_format import format_number
 from .drawing import Drawing
 
 
@@ -34,7 +36,17 @@ class Circle(
 
     def __init__(self, radius: float):
         super().__init__()
-        self.radius = radius
+        self._radius = radius
+
+    @property
+    def radius(self) -> float:
+        """The radius of this circle."""
+        return self._radius
+
+    @radius.setter
+    def radius(self, value: float):
+        self._radius = value
+        advance_epoch()
 
     def calculate_top_left(self):
         return Vec2(-self.radius, -self.radius)
@@ -51,14 +63,14 @@ class Circle(
     def draw_self(self):
         x, y = self.anchor_offset
         return f"""<circle \
-cx="{x}" \
-cy="{y}" \
-r="{self.radius}" \
+cx="{format_number(x)}" \
+cy="{format_number(y)}" \
+r="{format_number(self.radius)}" \
 transform="{self.global_transform.svg_transform}" \
-stroke="{self.stroke.rgb}" \
-stroke-opacity="{self.stroke.opacity}" \
-stroke-width="{self.stroke_width}" \
-fill="{self.fill.rgb}" \
-fill-opacity="{self.fill.opacity}" \
-opacity="{self.global_opacity}"\
+stroke="{self.stroke.rgb.svg}" \
+stroke-opacity="{format_number(self.stroke.opacity)}" \
+stroke-width="{format_number(self.stroke_width)}" \
+fill="{self.fill.rgb.svg}" \
+fill-opacity="{format_number(self.fill.opacity)}" \
+opacity="{format_number(self.global_opacity)}"\
 />"""
@@ -9,16 +9,24 @@ from visuscript.mixins import (
     AnchorMixin,
     TransformMixin,
     FillMixin,
+    HierarchicalDrawable,
+    CompiledHierarchy,
+    Color,
 )
 from visuscript.constants import Anchor, OutputFormat
 from visuscript.drawable import Rect
 from visuscript.updater import UpdaterBundle
-from visuscript.primatives import Transform, Vec2
+from visuscript.profiling import Profiler
+from visuscript.primatives import Transform, Vec2, Rgb
 from visuscript.primatives.protocols import CanBeDrawn
-from visuscript.config import config
+from visuscript.config import config, ConfigurationDeference, DEFER_TO_CONFIG
+from visuscript.frame_encoding import REPEAT_FRAME, FrameEncoder
+from visuscript._internal._epoch import advance_epoch, current_epoch
+from visuscript._internal._number_format import format_number
+from visuscript._internal._svg_optimizer import optimize_group, instance_symbols
 
 
-from visuscript.animation import AnimationBundle, Animation
+from visuscript.animation import AnimationBundle, Animation, Timeline
 from visuscript.updater import Updater
 
 
@@ -61,7 +69,24 @@ class Scene(Drawable, AnchorMixin, TransformMixin, FillMixin):
     def __init__(
         self,
         print_initial: bool = True,
+        skip_unchanged_frames: bool | ConfigurationDeference = DEFER_TO_CONFIG,
+        optimize_svg: bool | ConfigurationDeference = DEFER_TO_CONFIG,
+        compile_hierarchy: bool | ConfigurationDeference = DEFER_TO_CONFIG,
+        profiler: Profiler | None | ConfigurationDeference = DEFER_TO_CONFIG,
     ):
+        """
+        :param print_initial: If True, a frame is printed before the first frames of the first animation run hereby.
+        :param skip_unchanged_frames: If True, a frame in which no tracked object has changed since the last printed
+            frame is printed as a :data:`~visuscript.frame_encoding.REPEAT_FRAME` marker instead of as a full SVG.
+        :param optimize_svg: If True, attributes shared among the drawn elements are hoisted onto their enclosing group
+            attributes set to their defaults are omitted, and elements repeated but for their transforms are defined once
+            and referenced with <use>, which shrinks each frame without changing how it renders.
+        :param compile_hierarchy: If True, the global transforms and opacities of all drawn
+            :class:`~visuscript.mixins.HierarchicalDrawable` objects are computed together, in bulk, before each frame is drawn
+            with a :class:`~visuscript.mixins.CompiledHierarchy`, which is faster for large hierarchies.
+        :param profiler: A :class:`~visuscript.profiling.Profiler` that measures each leaf animation and each updater
+            as frames are generated, or None to measure nothing.
+        """
         super().__init__()
 
         self._width = config.scene_width
@@ -79,40 +104,70 @@ class Scene(Drawable, AnchorMixin, TransformMixin, FillMixin):
         self.set_fill(config.scene_color)
 
         self._output_format = config.scene_output_format
+        self._frame_encoder = FrameEncoder(config.scene_keyframe_interval)
         self._output_stream = config.scene_output_stream
         self._print_initial = print_initial
+        self._skip_unchanged_frames = (
+            config.scene_skip_unchanged_frames
+            if isinstance(skip_unchanged_frames, ConfigurationDeference)
+            else skip_unchanged_frames
+        )
+        self._optimize_svg = (
+            config.scene_optimize_svg
+            if isinstance(optimize_svg, ConfigurationDeference)
+            else optimize_svg
+        )
+        self._compile_hierarchy = (
+            config.scene_compile_hierarchy
+            if isinstance(compile_hierarchy, ConfigurationDeference)
+            else compile_hierarchy
+        )
+        self._profiler = (
+            config.scene_profiler
+            if isinstance(profiler, ConfigurationDeference)
+            else profiler
+        )
+        self._compiled_hierarchy: CompiledHierarchy | None = None
+        self._compiled_epoch: int | None = None
+        self._background: tuple[tuple[float, float, Rgb, float], Rect] | None = None
+        self._last_printed_epoch: int | None = None
         self._animation_bundle: AnimationBundle = AnimationBundle()
         self._player = _Player(self)
 
         self._original_drawables: list[list[CanBeDrawn]] = []
         self._original_updater_bundles: list[list[Updater]] = []
 
-        self._updater_bundle: UpdaterBundle = UpdaterBundle()
+        self._updater_bundle: UpdaterBundle = UpdaterBundle().set_profiler(self._profiler)
         self._number_of_frames_animated: int = 0
 
     def clear(self):
         """Removes all :class:`~visuscript.drawable.Drawable` instances from the display."""
         self._drawables = []
+        advance_epoch()
 
     def add_drawable(self, drawable: CanBeDrawn) -> Self:
         """Adds an object that :class:`~visuscript.primatives.protocols.CanBeDrawn` to the display."""
         self._drawables.append(drawable)
+        advance_epoch()
         return self
 
     def add_drawables(self, *drawables: CanBeDrawn) -> Self:
         """Adds multiple objects that :class:`~visuscript.primatives.protocols.CanBeDrawn` to the display."""
         self._drawables.extend(drawables)
+        advance_epoch()
         return self
 
     def remove_drawable(self, drawable: CanBeDrawn) -> Self:
         """Removes an object that :class:`~visuscript.primatives.protocols.CanBeDrawn` from the display."""
         self._drawables.remove(drawable)
+        advance_epoch()
         return self
 
     def remove_drawables(self, drawables: list[CanBeDrawn]) -> Self:
         """Removes multiple objects that :class:`~visuscript.primatives.protocols.CanBeDrawn` from the display."""
         for drawable in drawables:
             self._drawables.remove(drawable)
+        advance_epoch()
         return self
 
     def __lshift__(self, other: CanBeDrawn | Iterable[CanBeDrawn] | None):
@@ -161,7 +216,49 @@ class Scene(Drawable, AnchorMixin, TransformMixin, FillMixin):
     def logical_scaling(self):
         return self._logical_scaling
 
+    def _update_compiled_hierarchy(self):
+        if self._compiled_epoch == current_epoch():
+            return
+        roots = [
+            drawable
+            for drawable in self._drawables
+            if isinstance(drawable, HierarchicalDrawable)
+        ]
+        if self._compiled_hierarchy is None or self._compiled_hierarchy.roots != roots:
+            self._compiled_hierarchy = CompiledHierarchy(roots)
+        self._compiled_hierarchy.update()
+        self._compiled_epoch = current_epoch()
+
+    def _get_background(self) -> Rect:
+        """Returns the :class:`~visuscript.Rect` drawn behind everything herein.
+
+        It is rebuilt only when its size or color changes, so that drawing an unchanged frame does not advance the epoch.
+        """
+        fill = self.fill
+        key = (
+            self.ushape.width * self.logical_scaling,
+            self.ushape.height * self.logical_scaling,
+            fill.rgb,
+            fill.opacity,
+        )
+        if self._background is None or self._background[0] != key:
+            width, height, rgb, opacity = key
+            background = (
+                Rect(width=width, height=height)
+                .set_fill(Color(rgb, opacity))
+                .set_stroke(Color(rgb, opacity))
+                .set_anchor(Anchor.TOP_LEFT)
+            )
+            self._background = (key, background)
+        return self._background[1]
+
     def draw(self) -> str:
+        # The background is built first because building it advances the epoch,
+        # which would otherwise invalidate the global transforms written back by the compiled hierarchy.
+        background_svg = self._get_background().draw()
+        if self._compile_hierarchy:
+            self._update_compiled_hierarchy()
+
         inv_rotation = Transform(rotation=-self.transform.rotation)
 
         transform = Transform(
@@ -173,29 +270,47 @@ class Scene(Drawable, AnchorMixin, TransformMixin, FillMixin):
             rotation=-self.transform.rotation,
         )
 
-        background = (
-            Rect(
-                width=self.ushape.width * self.logical_scaling,
-                height=self.ushape.height * self.logical_scaling,
-            )
-            .set_fill(self.fill)
-            .set_stroke(self.fill)
-            .set_anchor(Anchor.TOP_LEFT)
-        )
         view_width = self.ushape.width * self.logical_scaling
         view_height = self.ushape.height * self.logical_scaling
-        return f"""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {view_width} {view_height}">\
-{background.draw()}\
-<g transform="{transform.svg_transform}">\
-{" ".join([drawable.draw() for drawable in sorted(self._drawables, key=lambda d: d.extrusion)])}\
+        drawables_svg = " ".join([drawable.draw() for drawable in sorted(self._drawables, key=lambda d: d.extrusion)])
+        group_attributes = ""
+        defs = ""
+        if self._optimize_svg:
+            _, background_svg = optimize_group(background_svg)
+            hoisted, drawables_svg = optimize_group(drawables_svg)
+            group_attributes = "".join(f' {key}="{value}"' for key, value in hoisted.items())
+            definitions, drawables_svg = instance_symbols(drawables_svg)
+            if definitions:
+                defs = f"<defs>{definitions}</defs>"
+        return f"""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {format_number(view_width)} {format_number(view_height)}">\
+{defs}\
+{background_svg}\
+<g transform="{transform.svg_transform}"{group_attributes}>\
+{drawables_svg}\
 </g></svg>"""
 
     def print(self):
-        """Prints one frame with the current state hereof."""
+        """Prints one frame with the current state hereof.
+
+        If this :class:`Scene` skips unchanged frames and no tracked object has changed since the last frame was printed,
+        a :data:`~visuscript.frame_encoding.REPEAT_FRAME` marker is printed instead.
+        """
+        if self._output_format not in (OutputFormat.SVG, OutputFormat.SVG_DIFF):
+            raise ValueError("Invalid image output format")
+
+        if (
+            self._skip_unchanged_frames
+            and self._last_printed_epoch == current_epoch()
+        ):
+            print(REPEAT_FRAME, file=self._output_stream)
+            return
+
         if self._output_format == OutputFormat.SVG:
             _print_svg(self, file=self._output_stream)
         else:
-            raise ValueError("Invalid image output format")
+            print(self._frame_encoder.encode(self.draw()), file=self._output_stream)
+        # Read after drawing because drawing may itself construct tracked objects.
+        self._last_printed_epoch = current_epoch()
 
     @property
     def _embed_level(self):
@@ -241,9 +356,9 @@ class Scene(Drawable, AnchorMixin, TransformMixin, FillMixin):
         The behavior is not defined if the iterator does not complete.
         """
         if animation:
-            animation_to_use = animation
+            animation_to_use = Timeline(animation, self._profiler)
         else:
-            animation_to_use = self._animation_bundle
+            animation_to_use = Timeline(self._animation_bundle, self._profiler)
 
         while animation_to_use.next_frame():
             self._updater_bundle.update_for_frame()
@@ -269,6 +384,7 @@ class Scene(Drawable, AnchorMixin, TransformMixin, FillMixin):
     def __exit__(self, *_: Any):
         self.print_frames()
         self._drawables = self._original_drawables.pop()
+        advance_epoch()
         if self._original_updater_bundles:
             original_updaters = self._original_updater_bundles.pop()
             self._updater_bundle.clear()
@@ -281,13 +397,7 @@ def _check_conflicts(
     updater_or_animation2: Updater | Animation,
 ):
     """Check if updater conflicts with existing animations."""
-    from visuscript.property_locker import LockedPropertyError
-
-    # Check if any properties locked by the updater are also locked by animations
-    for obj in updater_or_animation1.locker._map:  # type: ignore[reportPrivateUsage]
-        for prop in updater_or_animation1.locker._map[obj]:  # type: ignore[reportPrivateUsage]
-            if updater_or_animation2.locker.locks(obj, prop):
-                raise LockedPropertyError(obj, prop)
+    updater_or_animation1.locker.check_conflicts(updater_or_animation2.locker)
 
 
 class _Player:
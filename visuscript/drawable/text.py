@@ -14,6 +14,8 @@ from visuscript.mixins import (
     GlobalShapeMixin,
 )
 from visuscript.config import config, ConfigurationDeference, DEFER_TO_CONFIG
+from visuscript._internal._epoch import advance_epoch
+from visuscript._internal._number_format import format_number
 
 # TODO Figure out why league mono is not centered properly
 fonts: dict[str, str] = {
@@ -65,9 +67,9 @@ class Text(GlobalShapeMixin, HierarchicalDrawable, AnchorMixin, FillMixin):
 
             if hasattr(self, "ushape"):
                 del self.ushape
-            if hasattr(self, "gshape"):
-                del self.gshape
+            del self.gshape
 
+            advance_epoch()
             return r
 
         return size_updating_method
@@ -93,7 +95,7 @@ class Text(GlobalShapeMixin, HierarchicalDrawable, AnchorMixin, FillMixin):
         self._height: float
 
         super().__init__()
-        self.set_fill(config.text_fill)
+        self._default_fill = config._text_fill  # type: ignore[reportPrivateUsage]
 
     @property
     def font_family(self) -> str:
@@ -140,15 +142,15 @@ class Text(GlobalShapeMixin, HierarchicalDrawable, AnchorMixin, FillMixin):
         x, y = self.anchor_offset
         return f"""\
 <text \
-x="{x}" \
-y="{y}" \
+x="{format_number(x)}" \
+y="{format_number(y)}" \
 transform="{self.global_transform.svg_transform}" \
-font-size="{self.font_size}" \
+font-size="{format_number(self.font_size)}" \
 font-family="{self.font_family}" \
 font-style="normal" \
-fill="{self.fill.rgb}" \
-fill-opacity="{self.fill.opacity}" \
-opacity="{self.global_opacity}"\
+fill="{self.fill.rgb.svg}" \
+fill-opacity="{format_number(self.fill.opacity)}" \
+opacity="{format_number(self.global_opacity)}"\
 >{xml_escape(self.text)}</text><text/>"""  # The extra tag is to skirt a bug in the rendering of the SVG
 
     def __repr__(self) -> str:
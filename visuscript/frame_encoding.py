@@ -0,0 +1,133 @@
+"""Contains the encoding for the stream of frames that a :class:`~visuscript.Scene` outputs.
+
+Each frame occupies one line of the stream and is one of the following:
+
+* A keyframe, which is a complete SVG document.
+* A :data:`REPEAT_FRAME` marker, which stands in for a frame identical to the one before it.
+* A patch, which begins with :data:`PATCH_PREFIX` and lists only the elements, and attributes thereof,
+  that differ from the frame before it.
+
+A :class:`FrameEncoder` produces keyframes and patches; a :class:`FrameDecoder` reconstructs
+the complete SVG document for each frame from them.
+"""
+
+import json
+
+from visuscript._internal._svg import parse_tag, tokenize
+
+REPEAT_FRAME = "<!-- visuscript:repeat -->"
+"""Output in place of a frame that is identical to the frame preceding it."""
+
+PATCH_PREFIX = "<!-- visuscript:patch -->"
+"""Begins a frame that is encoded as a patch on the frame preceding it."""
+
+
+def is_repeat_frame(line: str) -> bool:
+    """Returns True if and only if a line from a frame stream is a :data:`REPEAT_FRAME` marker."""
+    return line.strip() == REPEAT_FRAME
+
+
+def is_patch_frame(line: str) -> bool:
+    """Returns True if and only if a line from a frame stream is a patch."""
+    return line.startswith(PATCH_PREFIX)
+
+
+class FrameEncoder:
+    """Encodes consecutive SVG frames as keyframes interspersed with patches."""
+
+    def __init__(self, keyframe_interval: int):
+        """
+        :param keyframe_interval: The maximum number of frames output between keyframes, inclusive of the keyframe.
+        """
+        if keyframe_interval < 1:
+            raise ValueError("The keyframe interval must be at least 1.")
+        self._keyframe_interval = keyframe_interval
+        self._tokens: list[str] = []
+        self._frames_since_keyframe = keyframe_interval
+
+    def encode(self, svg: str) -> str:
+        """Returns the encoding of the next frame, given as a complete SVG document."""
+        tokens = tokenize(svg)
+        previous_tokens = self._tokens
+        self._tokens = tokens
+
+        if (
+            self._frames_since_keyframe >= self._keyframe_interval
+            or len(tokens) != len(previous_tokens)
+        ):
+            self._frames_since_keyframe = 1
+            return svg
+        self._frames_since_keyframe += 1
+
+        patch: dict[str, dict[str, str] | str] = {}
+        for index, (previous, token) in enumerate(zip(previous_tokens, tokens)):
+            if previous == token:
+                continue
+            patch[str(index)] = _diff_tokens(previous, token)
+
+        if not patch:
+            return REPEAT_FRAME
+
+        encoded_patch = PATCH_PREFIX + json.dumps(patch, separators=(",", ":"))
+        if len(encoded_patch) >= len(svg):
+            self._frames_since_keyframe = 1
+            return svg
+        return encoded_patch
+
+
+def _diff_tokens(previous: str, token: str) -> dict[str, str] | str:
+    """Returns the attributes that changed between two tags, or the new token if the two do not share a structure."""
+    previous_tag = parse_tag(previous)
+    tag = parse_tag(token)
+    if (
+        previous_tag is None
+        or tag is None
+        or previous_tag.name != tag.name
+        or previous_tag.self_closing != tag.self_closing
+        or list(previous_tag.attributes) != list(tag.attributes)
+    ):
+        return token
+    return {
+        key: value
+        for key, value in tag.attributes.items()
+        if previous_tag.attributes[key] != value
+    }
+
+
+class FrameDecoder:
+    """Reconstructs complete SVG documents from the frames output by a :class:`FrameEncoder`."""
+
+    def __init__(self):
+        self._tokens: list[str] = []
+        self._svg: str | None = None
+
+    def decode(self, line: str) -> str:
+        """Returns the complete SVG document for the next frame in a stream.
+
+        :raises ValueError: If a frame that depends on a preceding frame is decoded first.
+        """
+        line = line.rstrip("\n")
+
+        if is_repeat_frame(line) or is_patch_frame(line):
+            if self._svg is None:
+                raise ValueError("Cannot decode a frame that depends on a preceding frame before any keyframe.")
+            if is_repeat_frame(line):
+                return self._svg
+        else:
+            self._svg = line
+            self._tokens = tokenize(line)
+            return line
+
+        patch: dict[str, dict[str, str] | str] = json.loads(line[len(PATCH_PREFIX) :])
+        for index, change in patch.items():
+            i = int(index)
+            if isinstance(change, str):
+                self._tokens[i] = change
+            else:
+                tag = parse_tag(self._tokens[i])
+                assert tag is not None
+                tag.attributes.update(change)
+                self._tokens[i] = tag.build()
+
+        self._svg = "".join(self._tokens)
+        return self._svg
@@ -1,35 +1,35 @@
-from typing import cast, Any, Tuple, Self, TypeVar
-from functools import cached_property
+from typing import cast, Any, Callable, Tuple, Self, TypeVar
+from operator import attrgetter
 
 
 class LazyObject:
+    """Records attribute accesses and calls on an object to be replayed when evaluated.
+
+    Each access or call returns a new :class:`LazyObject` that links to the one from which it was made,
+    so chains share their common prefixes and each step costs constant time and memory.
+    The chain is compiled into a single function on first evaluation.
+    """
+
+    __slots__ = ("_obj", "_parent", "_attribute", "_call", "_evaluator")
+
     def __init__(
         self,
         obj: Any,
-        _attribute_chain: list[str] | None = None,
-        _calls: dict[int, Tuple[Tuple[Any, ...], dict[str, Any]]] | None = None,
+        _parent: "LazyObject | None" = None,
+        _attribute: str | None = None,
+        _call: Tuple[Tuple[Any, ...], dict[str, Any]] | None = None,
     ):
         self._obj = obj
-        self._attribute_chain = _attribute_chain or []
-        self._calls = _calls or dict()
-
-    @cached_property
-    def _level(self) -> int:
-        return len(self._attribute_chain)
+        self._parent = _parent
+        self._attribute = _attribute
+        self._call = _call
+        self._evaluator: Callable[[], Any] | None = None
 
     def __call__(self, *args: Any, **kwargs: Any) -> "LazyObject":
-        calls = self._calls.copy()
-        calls[self._level] = (args, kwargs)
-        return LazyObject(
-            self._obj, _attribute_chain=self._attribute_chain, _calls=calls
-        )
+        return LazyObject(self._obj, self, None, (args, kwargs))
 
     def __getattr__(self, attribute: str) -> "LazyObject":
-        return LazyObject(
-            self._obj,
-            _attribute_chain=self._attribute_chain + [attribute],
-            _calls=self._calls,
-        )
+        return LazyObject(self._obj, self, attribute)
 
     def __add__(self, other: Any) -> "LazyObject":
         return self.__getattr__("__add__")(other)
@@ -73,19 +73,48 @@ class LazyObject:
     def __setitem__(self, key: Any, value: Any) -> None:
         raise NotImplementedError("LazyObject does not support item assignment.")
 
-    def _lazy_call(self, obj: Any, index: int):
-        args, kwargs = self._calls[index]
-        return obj(*args, **kwargs)
+    def _compile(self) -> Callable[[], Any]:
+        steps: list[Callable[[Any], Any]] = []
+        attributes: list[str] = []
+        node = self
+        while node._parent is not None:
+            if node._attribute is not None:
+                attributes.append(node._attribute)
+            else:
+                if attributes:
+                    steps.append(attrgetter(".".join(reversed(attributes))))
+                    attributes = []
+                assert node._call is not None
+                steps.append(_caller(*node._call))
+            node = node._parent
+        if attributes:
+            steps.append(attrgetter(".".join(reversed(attributes))))
+        steps.reverse()
+
+        obj = self._obj
+        if not steps:
+            return lambda: obj
+        if len(steps) == 1:
+            step = steps[0]
+            return lambda: step(obj)
+
+        def evaluate() -> Any:
+            attr = obj
+            for step in steps:
+                attr = step(attr)
+            return attr
+
+        return evaluate
 
     def evaluate_lazy_object(self) -> Any:
-        attr = self._obj
-        for i, attribute_name in enumerate(self._attribute_chain):
-            if i in self._calls:
-                attr = self._lazy_call(attr, i)
-            attr = getattr(attr, attribute_name)
-        if self._level in self._calls:
-            attr = self._lazy_call(attr, self._level)
-        return attr
+        if self._evaluator is None:
+            self._evaluator = self._compile()
+        return self._evaluator()
+
+
+def _caller(args: Tuple[Any, ...], kwargs: dict[str, Any]) -> Callable[[Any], Any]:
+    """Returns a function that calls its argument with the given arguments and keyword arguments."""
+    return lambda attr: attr(*args, **kwargs)
 
 
 def evaluate_lazy(args: list[Any], kwargs: dict[str, Any]):
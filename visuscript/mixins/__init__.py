@@ -22,6 +22,7 @@ from .mixins import (
     Element,
     Shape,
 )
+from .compiled_hierarchy import CompiledHierarchy
 
 __all__ = [
     "RgbMixin",
@@ -38,4 +39,5 @@ __all__ = [
     "GlobalShapeMixin",
     "Element",
     "Shape",
+    "CompiledHierarchy",
 ]
@@ -3,6 +3,7 @@ import typing as t
 from visuscript.primatives.primatives import PALETTE
 from visuscript.primatives import Rgb, InterpolableFloat
 from visuscript.lazy_object import Lazible
+from visuscript._internal._epoch import advance_epoch
 
 
 class RgbMixin:
@@ -24,7 +25,8 @@ class RgbMixin:
 
     @rgb.setter
     def rgb(self, value: Rgb.RgbLike):
-            self._rgb = Rgb.construct(value)
+        self._rgb = Rgb.construct(value)
+        advance_epoch()
 
 
 class OpacityMixin:
@@ -38,6 +40,7 @@ class OpacityMixin:
     def set_opacity(self, opacity: float) -> t.Self:
         """Sets this object's opacity."""
         self._opacity = InterpolableFloat(opacity)
+        advance_epoch()
         return self
     
     @property
@@ -47,6 +50,7 @@ class OpacityMixin:
     @opacity.setter
     def opacity(self, other: float):
         self._opacity = InterpolableFloat(other)
+        advance_epoch()
 
 
 class Color(RgbMixin, OpacityMixin, Lazible):
@@ -65,10 +69,15 @@ class Color(RgbMixin, OpacityMixin, Lazible):
 
     @staticmethod
     def construct(other: ColorLike) -> "Color":
+        return Color(*Color.components(other))
+
+    @staticmethod
+    def components(other: ColorLike) -> tuple[Rgb, float]:
+        """Returns the :class:`~visuscript.Rgb` and opacity of a ColorLike without constructing a :class:`Color`."""
         if isinstance(other, Color):
-            return Color(other.rgb, other.opacity)
+            return other.rgb, other.opacity
         else:
-            return Color(other, 1)
+            return Rgb.construct(other), 1
 
     def __str__(self) -> str:
         return f"Color(color={tuple(self.rgb)}, opacity={self.opacity}"
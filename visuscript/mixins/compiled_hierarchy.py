@@ -0,0 +1,201 @@
+"""Contains :class:`CompiledHierarchy`, which computes the global transforms and opacities
+of many :class:`~visuscript.mixins.HierarchicalDrawable` objects at once."""
+
+import math
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+
+from visuscript.primatives import Transform, Vec2, InterpolableFloat
+from visuscript.primatives.arrays import TransformArray
+
+from visuscript._internal._epoch import current_epoch
+
+from .mixins import HierarchicalDrawable
+
+
+class CompiledHierarchy:
+    """A flattened copy of the structure of one or more trees of :class:`~visuscript.mixins.HierarchicalDrawable` objects.
+
+    The nodes are ordered such that every parent precedes its children and the nodes at each depth are contiguous.
+    Each :meth:`update` gathers the local transforms and opacities into NumPy arrays, propagates them
+    down the trees with one vectorized pass per depth, and writes the results back into
+    :attr:`~visuscript.mixins.HierarchicalDrawable.global_transform` and
+    :attr:`~visuscript.mixins.HierarchicalDrawable.global_opacity`,
+    from which they are then read when drawing.
+
+    The structure is recompiled whenever :meth:`update` finds that it has changed.
+    """
+
+    def __init__(self, roots: t.Iterable[HierarchicalDrawable]):
+        """
+        :param roots: The objects at the roots of the trees. An object with a parent outside of these trees is propagated from that parent's global transform and opacity.
+        """
+        self._roots = list(roots)
+        self.compile()
+
+    def compile(self):
+        """Flattens the current structure of the trees."""
+        nodes: list[HierarchicalDrawable] = []
+        parents: list[int] = []
+        levels: list[int] = [0]
+        seen: set[int] = set()
+
+        level = [(root, -1) for root in self._roots]
+        while level:
+            next_level: list[tuple[HierarchicalDrawable, int]] = []
+            for node, parent in level:
+                if id(node) in seen:
+                    continue
+                seen.add(id(node))
+                index = len(nodes)
+                nodes.append(node)
+                parents.append(parent)
+                next_level.extend((child, index) for child in node._children)  # type: ignore[reportPrivateUsage]
+            levels.append(len(nodes))
+            level = next_level
+        if len(levels) == 1:
+            levels.append(0)
+
+        self._nodes = nodes
+        self._parents: npt.NDArray[np.intp] = np.array(parents, dtype=np.intp)
+        self._levels = levels
+        self._structure = [
+            (node._parent, len(node._children))  # type: ignore[reportPrivateUsage]
+            for node in nodes
+        ]
+        n = len(nodes)
+        self._translations: npt.NDArray[np.float64] = np.zeros((n, 2))
+        self._scales: npt.NDArray[np.float64] = np.ones((n, 2))
+        self._rotations: npt.NDArray[np.float64] = np.zeros(n)
+        self._opacities: npt.NDArray[np.float64] = np.ones(n)
+
+    @property
+    def roots(self) -> list[HierarchicalDrawable]:
+        """The objects at the roots of the trees herein."""
+        return self._roots
+
+    @property
+    def nodes(self) -> list[HierarchicalDrawable]:
+        """The objects herein, each preceded by its parent."""
+        return self._nodes
+
+    @property
+    def parent_indices(self) -> npt.NDArray[np.intp]:
+        """The index of the parent of each object herein, or -1 for the roots."""
+        return self._parents
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def is_stale(self) -> bool:
+        """Returns True if and only if the structure of the trees has changed since it was compiled."""
+        return any(
+            node._parent is not parent or len(node._children) != children  # type: ignore[reportPrivateUsage]
+            for node, (parent, children) in zip(self._nodes, self._structure)
+        )
+
+    def gather(self):
+        """Reads the local transform and opacity of each object herein.
+
+        A root with a parent outside of these trees contributes its global transform and opacity instead.
+        """
+        nodes = self._nodes
+        transforms: list[Transform] = [node._transform for node in nodes]  # type: ignore[reportPrivateUsage]
+        opacities: list[float] = [node._opacity for node in nodes]  # type: ignore[reportPrivateUsage]
+        for i in range(self._levels[1]):
+            if nodes[i]._parent is not None:  # type: ignore[reportPrivateUsage]
+                transforms[i] = nodes[i].global_transform
+                opacities[i] = nodes[i].global_opacity
+
+        n = len(nodes)
+        self._translations = np.empty((n, 2))
+        self._translations[:, 0] = [t._translation._x for t in transforms]  # type: ignore[reportPrivateUsage]
+        self._translations[:, 1] = [t._translation._y for t in transforms]  # type: ignore[reportPrivateUsage]
+        self._scales = np.empty((n, 2))
+        self._scales[:, 0] = [t._scale._x for t in transforms]  # type: ignore[reportPrivateUsage]
+        self._scales[:, 1] = [t._scale._y for t in transforms]  # type: ignore[reportPrivateUsage]
+        self._rotations = np.array([t._rotation for t in transforms], dtype=np.float64)  # type: ignore[reportPrivateUsage]
+        self._opacities = np.array(opacities, dtype=np.float64)
+
+    def propagate(self):
+        """Composes the gathered values down the trees, as per :meth:`Transform.__matmul__ <visuscript.Transform.__matmul__>`,
+        so that they become global."""
+        translations, scales = self._translations, self._scales
+        rotations, opacities = self._rotations, self._opacities
+        levels = self._levels
+        for start, stop in zip(levels[1:-1], levels[2:]):
+            parents = self._parents[start:stop]
+            radians = rotations[parents] * (math.pi / 180)
+            cos, sin = np.cos(radians), np.sin(radians)
+            sx, sy = scales[parents, 0], scales[parents, 1]
+            x, y = translations[start:stop, 0], translations[start:stop, 1]
+            translations[start:stop] = np.column_stack(
+                (
+                    cos * sx * x - sin * sy * y + translations[parents, 0],
+                    sin * sx * x + cos * sy * y + translations[parents, 1],
+                )
+            )
+            scales[start:stop] *= scales[parents]
+            rotations[start:stop] += rotations[parents]
+            opacities[start:stop] *= opacities[parents]
+
+    def write_back(self):
+        """Sets the global transform and opacity of each object herein to the propagated values.
+
+        The values are primed into the caches of :attr:`~visuscript.mixins.HierarchicalDrawable.global_transform`
+        and :attr:`~visuscript.mixins.HierarchicalDrawable.global_opacity` under the keys that those would compute,
+        except that the validity of each is derived from its parent's here rather than by walking up the trees.
+        """
+        global_transform = HierarchicalDrawable.global_transform
+        global_opacity = HierarchicalDrawable.global_opacity
+        translations = self._translations.tolist()
+        scales = self._scales.tolist()
+        rotations = self._rotations.tolist()
+        opacities = self._opacities.tolist()
+        epoch = current_epoch()
+        transform_versions: list[int] = []
+        opacity_versions: list[int] = []
+        for node, parent, translation, scale, rotation, opacity in zip(
+            self._nodes, self._parents.tolist(), translations, scales, rotations, opacities
+        ):
+            if parent < 0:
+                transform_version = node._global_transform_version()  # type: ignore[reportPrivateUsage]
+                opacity_version = node._global_opacity_version()  # type: ignore[reportPrivateUsage]
+            else:
+                transform_version = node._global_transform_token.revalidate(  # type: ignore[reportPrivateUsage]
+                    epoch, (node.transform.version, transform_versions[parent])
+                )
+                opacity_version = node._global_opacity_token.revalidate(  # type: ignore[reportPrivateUsage]
+                    epoch, (node._opacity, opacity_versions[parent])  # type: ignore[reportPrivateUsage]
+                )
+            transform_versions.append(transform_version)
+            opacity_versions.append(opacity_version)
+
+            global_transform.prime(
+                node,
+                transform_version,
+                Transform._from_components(  # type: ignore[reportPrivateUsage]
+                    Vec2(*translation), Vec2(*scale), InterpolableFloat(rotation)
+                ),
+            )
+            global_opacity.prime(node, opacity_version, opacity)
+
+    def update(self):
+        """Recompiles the structure if it has changed, then gathers, propagates, and writes back the global transforms and opacities."""
+        if self.is_stale():
+            self.compile()
+        self.gather()
+        self.propagate()
+        self.write_back()
+
+    @property
+    def global_transforms(self) -> TransformArray:
+        """The global transform of each object herein as of the last :meth:`update`."""
+        return TransformArray(self._translations, self._scales, self._rotations)
+
+    @property
+    def global_opacities(self) -> npt.NDArray[np.float64]:
+        """The global opacity of each object herein as of the last :meth:`update`."""
+        return self._opacities
@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
 from functools import cached_property
+import itertools
 import typing as t
 
 from visuscript.constants import Anchor
-from visuscript.primatives import Transform, Vec2, Shape
+from visuscript.primatives import Transform, Vec2, Shape, Rgb
 from visuscript.config import config
 from visuscript.lazy_object import Lazible
-from visuscript._internal._invalidator import Invalidatable
+from visuscript._internal._invalidator import keyed_cached_property
+from visuscript._internal._epoch import advance_epoch, current_epoch
 
 from .color import Color, OpacityMixin
 
@@ -25,9 +27,6 @@ class TransformMixin:
         super().__init__()
         self._transform = Transform()
 
-        if isinstance(self, Invalidatable):
-            self._transform._add_invalidatable(self)  # type: ignore
-
     @property
     def transform(self) -> Transform:
         """The local :class:`~visuscript.Transform` for this object."""
@@ -75,7 +74,10 @@ class TransformMixin:
 
     def set_transform(self, transform: Transform.TransformLike) -> t.Self:
         """Sets this object's :class:`~visuscript.Transform`."""
-        self._transform.update(Transform.construct(transform))
+        if isinstance(transform, Transform):
+            self._transform.update(transform)
+        else:
+            self._transform.set_components(translation=transform, scale=1, rotation=0)
         return self
 
 
@@ -84,11 +86,15 @@ class FillMixin:
 
     def __init__(self):
         super().__init__()
-        self._fill = Color.construct(config.element_fill)
+        # The Color is only constructed when first accessed, until which the configured default is shared.
+        self._fill: Color | None = None
+        self._default_fill: tuple[Rgb, float] = config._element_fill  # type: ignore[reportPrivateUsage]
 
     @property
     def fill(self) -> Color:
         """The :class:`~visuscript.Color` of this object's fill."""
+        if self._fill is None:
+            self._fill = Color(*self._default_fill)
         return self._fill
 
     @fill.setter
@@ -97,9 +103,12 @@ class FillMixin:
 
     def set_fill(self, color: Color.ColorLike) -> t.Self:
         """Sets this object's fill :class:`~visuscript.Color`."""
-        color = Color.construct(color)
-        self._fill.rgb = color.rgb
-        self._fill.opacity = color.opacity
+        rgb, opacity = Color.components(color)
+        if self._fill is None:
+            self._fill = Color(rgb, opacity)
+        else:
+            self._fill.rgb = rgb
+            self._fill.opacity = opacity
         return self
 
 
@@ -108,12 +117,16 @@ class StrokeMixin:
 
     def __init__(self):
         super().__init__()
-        self._stroke = Color.construct(config.element_stroke)
+        # The Color is only constructed when first accessed, until which the configured default is shared.
+        self._stroke: Color | None = None
+        self._default_stroke: tuple[Rgb, float] = config._element_stroke  # type: ignore[reportPrivateUsage]
         self._stroke_width = config.element_stroke_width
 
     @property
     def stroke(self) -> Color:
         """The :class:`~visuscript.Color` of this object's stroke."""
+        if self._stroke is None:
+            self._stroke = Color(*self._default_stroke)
         return self._stroke
 
     @stroke.setter
@@ -122,9 +135,12 @@ class StrokeMixin:
 
     def set_stroke(self, color: Color.ColorLike) -> t.Self:
         """Sets this object's stroke :class:`~visuscript.Color`."""
-        color = Color.construct(color)
-        self._stroke.rgb = color.rgb
-        self._stroke.opacity = color.opacity
+        rgb, opacity = Color.components(color)
+        if self._stroke is None:
+            self._stroke = Color(rgb, opacity)
+        else:
+            self._stroke.rgb = rgb
+            self._stroke.opacity = opacity
         return self
 
     @property
@@ -139,6 +155,7 @@ class StrokeMixin:
     def set_stroke_width(self, width: float) -> t.Self:
         """Sets the width of this object's stroke."""
         self._stroke_width = width
+        advance_epoch()
         return self
 
 
@@ -191,14 +208,14 @@ class ShapeMixin(ABC):
 class TransformableShapeMixin(ShapeMixin, TransformMixin):
     """Adds a transformed :class:`Shape` to this object."""
 
-    @cached_property
-    def tshape(self):
+    def _tshape_version(self) -> int:
+        return self._transform.version
+
+    @keyed_cached_property(_tshape_version)
+    def tshape(self) -> Shape:
         """The :class:`Shape` for this object when it has been transformed by its :class:`~visuscript.Transform`."""
         return Shape(self, self.transform)
 
-    def _invalidate(self):
-        invalidate_property(self, "tshape")
-
     @property
     def shape(self):
         return self.tshape
@@ -223,6 +240,7 @@ class AnchorMixin(ShapeMixin):
         old_anchor_offset = self.anchor_offset
 
         self._anchor = anchor
+        advance_epoch()
 
         if isinstance(self, TransformMixin) and keep_position:
             self.translate(*old_anchor_offset - self.anchor_offset)
@@ -284,6 +302,7 @@ class Drawable(ABC, Lazible):
     @extrusion.setter
     def extrusion(self, other: float):
         self._extrusion = other
+        advance_epoch()
 
     def set_extrusion(self, extrusion: float) -> t.Self:
         """Sets this object's extrusion."""
@@ -291,12 +310,36 @@ class Drawable(ABC, Lazible):
         return self
 
 
+class _Token:
+    """Identifies the state of a value derived from an object and its ancestors.
+
+    The token is given a new version whenever the key from which it is derived changes,
+    and the key is checked at most once per epoch.
+    """
+
+    __slots__ = ("epoch", "key", "version")
+
+    _versions = itertools.count(1)
+
+    def __init__(self):
+        self.epoch: int = -1
+        self.key: tuple[t.Any, int | None] | None = None
+        self.version: int = 0
+
+    def revalidate(self, epoch: int, key: tuple[t.Any, int | None]) -> int:
+        """Records the key as of an epoch and returns the resulting version."""
+        if key != self.key:
+            self.key = key
+            self.version = next(_Token._versions)
+        self.epoch = epoch
+        return self.version
+
+
 class HierarchicalDrawable(
     Drawable,
     TransformMixin,
     OpacityMixin,
     t.Iterable["HierarchicalDrawable"],
-    Invalidatable,
 ):
     """Designates an object as being drawable and as being hierarchical in that
     the object will
@@ -304,6 +347,10 @@ class HierarchicalDrawable(
     * have a global opacity as the product of its own and its ancestor's opacity,
     * and have a global :class:`Transform` that is the composition of its own and its ancestor's :class:`Transform`s.
 
+    Changes to an opacity, a :class:`Transform`, or the hierarchy are not propagated to descendants.
+    Instead, a global opacity or :class:`Transform` is checked against what it depends on when it is read,
+    at most once per epoch, and is recomputed only if any of that has changed.
+
     .. note::
 
         :meth:`HierarchicalDrawable.draw` should not be overwritten.
@@ -314,6 +361,8 @@ class HierarchicalDrawable(
         super().__init__()
         self._children: list[HierarchicalDrawable] = []
         self._parent: HierarchicalDrawable | None = None
+        self._global_transform_token = _Token()
+        self._global_opacity_token = _Token()
 
     @abstractmethod
     def draw_self(self) -> str:
@@ -322,11 +371,35 @@ class HierarchicalDrawable(
         """
         ...
 
-    def _invalidate(self):
-        super()._invalidate()  # type: ignore
-        invalidate_property(self, "global_transform")
-        for child in self.iter_children():
-            child._invalidate()
+    def _global_transform_version(self) -> int:
+        """Returns a number that changes whenever the global :class:`Transform` of this object may have changed."""
+        token = self._global_transform_token
+        epoch = current_epoch()
+        if token.epoch != epoch:
+            parent = self._parent
+            token.revalidate(
+                epoch,
+                (
+                    self._transform.version,
+                    None if parent is None else parent._global_transform_version(),
+                ),
+            )
+        return token.version
+
+    def _global_opacity_version(self) -> int:
+        """Returns a number that changes whenever the global opacity of this object may have changed."""
+        token = self._global_opacity_token
+        epoch = current_epoch()
+        if token.epoch != epoch:
+            parent = self._parent
+            token.revalidate(
+                epoch,
+                (
+                    self._opacity,
+                    None if parent is None else parent._global_opacity_version(),
+                ),
+            )
+        return token.version
 
     @property
     def parent(self) -> t.Union["HierarchicalDrawable", None]:
@@ -388,11 +461,12 @@ class HierarchicalDrawable(
 
             parent._children.append(self)
             self._parent = parent
-            self._invalidate()
+            advance_epoch()
 
             if preserve_global_transform:
                 self.global_transform = global_transform  # type: ignore
 
+        advance_epoch()
         return self
 
     def add_child(
@@ -476,37 +550,28 @@ class HierarchicalDrawable(
             self.add_child(child, preserve_global_transform=preserve_global_transform)
         return self
 
-    @property
+    @keyed_cached_property(_global_opacity_version)
     def global_opacity(self) -> float:
         """
         The global opacity of this Element.
 
         Returns the product of all ancestors' opacities and that of this object.
         """
-        curr = self
+        if self._parent is None:
+            return self.opacity
+        return self._parent.global_opacity * self.opacity
 
-        opacity = self.opacity
-
-        while curr._parent is not None:
-            opacity *= curr._parent.opacity
-            curr = curr._parent
-
-        return opacity
-
-    @cached_property
+    @keyed_cached_property(_global_transform_version)
     def global_transform(self) -> Transform:
         """
         A copy of the global transform of this Element.
 
         Returns the composition of all ancestor transforms and this Element's transform.
         """
-        curr = self
-
         transform = self.transform
 
         if self._parent:
             transform = self._parent.global_transform @ transform
-            curr = curr._parent
 
         return transform.copy()
 
@@ -535,12 +600,11 @@ class GlobalShapeMixin(HierarchicalDrawable, TransformableShapeMixin):
         :attr:`HierarchicalDrawable.global_transform`
     """
 
-    def _invalidate(self):
-        super()._invalidate()
-        invalidate_property(self, "gshape")
+    def _gshape_version(self) -> int:
+        return self._global_transform_version()
 
-    @cached_property
-    def gshape(self):
+    @keyed_cached_property(_gshape_version)
+    def gshape(self) -> Shape:
         """The :class:`Shape` for this object when it has been transformed by its global :class:`~visuscript.Transform`."""
         return Shape(self, self.global_transform)
 
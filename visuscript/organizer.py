@@ -1,7 +1,7 @@
 """Contains :class:`Organizer` types for arranging displayable objects."""
 
 from visuscript.mixins import TransformMixin
-from visuscript.primatives import Transform, Vec2
+from visuscript.primatives import Transform, Vec2, TransformArray
 from typing import Iterable, Iterator
 from abc import ABC, abstractmethod
 import numpy as np
@@ -31,16 +31,24 @@ class Organizer(ABC, TransformMixin):
         for i in range(len(self)):
             yield self[i]
 
+    def transform_array_for(self, count: int) -> TransformArray:
+        """Gets the Transforms for the first `count` indices as a :class:`~visuscript.primatives.TransformArray`.
+
+        As with :meth:`transform_for`, the output is NOT transformed by this :class:`Organizer`'s transform.
+        Implementors may override this to compute all the Transforms at once.
+        """
+        return TransformArray.gather(self.transform_for(i) for i in range(count))
+
     def organize(self, drawables: Iterable[TransformMixin | None]):
         """
         Applies transformations to at most len(self) of the input drawables
 
         The first Drawable in drawables is transformed with self[0]', the second with self[1] etc.
         """
-        for drawable, transform in zip(drawables, self):
-            if drawable is None:
-                continue
-            drawable.set_transform(transform)
+        drawables = list(drawables)[: len(self)]
+        self.transform_array_for(len(drawables)).composed(self.transform).scatter(
+            drawables
+        )
 
 
 class GridOrganizer(Organizer):
@@ -73,6 +81,16 @@ class GridOrganizer(Organizer):
 
         return Transform(translation=translation)
 
+    def transform_array_for(self, count: int) -> TransformArray:
+        if count > len(self):
+            raise IndexError(f"index {count - 1} is out of bounds for size {len(self)}")
+        indices = np.arange(count)
+        rows = indices // self._ushape[1]
+        columns = indices % self._ushape[1]
+        return TransformArray(
+            np.column_stack((columns * self._sizes[1], rows * self._sizes[0]))
+        )
+
 
 class BinaryTreeOrganizer(Organizer):
     """BinaryTreeOrganizer arranges its Transform objects into a binary tree."""
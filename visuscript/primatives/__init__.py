@@ -2,6 +2,7 @@
 
 from .primatives import Vec2, Transform, Rgb, InterpolableFloat
 from .shape import Shape
+from .arrays import Vec2Array, TransformArray
 
 
 __all__ = [
@@ -10,4 +11,6 @@ __all__ = [
     "Transform",
     "InterpolableFloat",
     "Shape",
+    "Vec2Array",
+    "TransformArray",
 ]
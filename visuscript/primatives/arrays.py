@@ -0,0 +1,279 @@
+"""Contains NumPy-backed batches of :class:`~visuscript.Vec2` and :class:`~visuscript.Transform`
+for operating on many elements at once."""
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TypeAlias, Union, overload
+
+import numpy as np
+import numpy.typing as npt
+
+from .primatives import Transform, Vec2
+from .protocols import HasTransform
+
+
+def _as_pairs(value: "Vec2Array | Vec2.Vec2Like | float | npt.ArrayLike") -> npt.NDArray[np.float64] | float:
+    if isinstance(value, Vec2Array):
+        return value.data
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, Vec2):
+        return np.array((value.x, value.y))
+    return np.asarray(value, dtype=np.float64)
+
+
+def _as_alpha(alpha: "float | npt.ArrayLike") -> npt.NDArray[np.float64] | float:
+    if isinstance(alpha, (int, float)):
+        return float(alpha)
+    return np.asarray(alpha, dtype=np.float64)
+
+
+class Vec2Array:
+    """An array of two dimensional vectors, stored contiguously as an (n, 2) NumPy array.
+
+    Arithmetic is elementwise with another :class:`Vec2Array` of the same length
+    and broadcasts a single :class:`~visuscript.Vec2` or scalar across all elements.
+    """
+
+    __slots__ = ("_data",)
+
+    Operand: TypeAlias = Union["Vec2Array", Vec2.Vec2Like, float]
+
+    def __init__(self, data: npt.ArrayLike):
+        """
+        :param data: The vectors, as anything convertible into an (n, 2) NumPy array.
+        """
+        array = np.array(data, dtype=np.float64)
+        if array.size == 0:
+            array = array.reshape(0, 2)
+        if array.ndim != 2 or array.shape[1] != 2:
+            raise ValueError(
+                f"A Vec2Array must have the shape (n, 2), not {array.shape}."
+            )
+        self._data: npt.NDArray[np.float64] = array
+
+    @staticmethod
+    def wrap(data: npt.NDArray[np.float64]) -> "Vec2Array":
+        """Returns a :class:`Vec2Array` that shares an (n, 2) float64 NumPy array, which is neither copied nor validated."""
+        array = Vec2Array.__new__(Vec2Array)
+        array._data = data
+        return array
+
+    @staticmethod
+    def from_vec2s(vecs: Iterable[Vec2.Vec2Like]) -> "Vec2Array":
+        """Gathers a :class:`Vec2Array` from individual vectors."""
+        return Vec2Array([[*vec] for vec in vecs])
+
+    @property
+    def data(self) -> npt.NDArray[np.float64]:
+        """The underlying (n, 2) NumPy array, which may be modified in place."""
+        return self._data
+
+    @property
+    def x(self) -> npt.NDArray[np.float64]:
+        """The x values of the vectors herein."""
+        return self._data[:, 0]
+
+    @property
+    def y(self) -> npt.NDArray[np.float64]:
+        """The y values of the vectors herein."""
+        return self._data[:, 1]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> Vec2: ...
+    @overload
+    def __getitem__(self, index: slice) -> "Vec2Array": ...
+    def __getitem__(self, index: int | slice) -> Union[Vec2, "Vec2Array"]:
+        if isinstance(index, slice):
+            return Vec2Array.wrap(self._data[index])
+        x, y = self._data[index]
+        return Vec2(x, y)
+
+    def __iter__(self) -> Iterator[Vec2]:
+        for x, y in self._data.tolist():
+            yield Vec2(x, y)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Vec2Array):
+            return NotImplemented
+        return bool(np.array_equal(self._data, other._data))
+
+    def __add__(self, other: Operand) -> "Vec2Array":
+        return Vec2Array.wrap(self._data + _as_pairs(other))
+
+    def __radd__(self, other: Operand) -> "Vec2Array":
+        return Vec2Array.wrap(_as_pairs(other) + self._data)
+
+    def __sub__(self, other: Operand) -> "Vec2Array":
+        return Vec2Array.wrap(self._data - _as_pairs(other))
+
+    def __rsub__(self, other: Operand) -> "Vec2Array":
+        return Vec2Array.wrap(_as_pairs(other) - self._data)
+
+    def __mul__(self, other: Operand) -> "Vec2Array":
+        return Vec2Array.wrap(self._data * _as_pairs(other))
+
+    def __rmul__(self, other: Operand) -> "Vec2Array":
+        return Vec2Array.wrap(_as_pairs(other) * self._data)
+
+    def __truediv__(self, other: Operand) -> "Vec2Array":
+        with np.errstate(divide="raise"):
+            return Vec2Array.wrap(self._data / _as_pairs(other))
+
+    def __rtruediv__(self, other: Operand) -> "Vec2Array":
+        with np.errstate(divide="raise"):
+            return Vec2Array.wrap(_as_pairs(other) / self._data)
+
+    def __neg__(self) -> "Vec2Array":
+        return Vec2Array.wrap(-self._data)
+
+    def interpolate(self, other: Operand, alpha: float | npt.ArrayLike) -> "Vec2Array":
+        """Interpolates elementwise between this :class:`Vec2Array` and another.
+
+        :param alpha: The progress of the interpolation, either one value for all elements or one value per element.
+        """
+        alpha = _as_alpha(alpha)
+        if isinstance(alpha, np.ndarray):
+            alpha = alpha[:, np.newaxis]
+        return Vec2Array.wrap(self._data * (1 - alpha) + _as_pairs(other) * alpha)
+
+    def transformed(self, transform: Transform) -> "Vec2Array":
+        """Returns the vectors herein as transformed by a :class:`~visuscript.Transform`."""
+        a, b, c, d, e, f = transform.matrix
+        return Vec2Array.wrap(self._data @ np.array([[a, b], [c, d]]) + (e, f))
+
+    def __repr__(self) -> str:
+        return f"Vec2Array({self._data.tolist()})"
+
+
+def _as_transform(obj: Transform | HasTransform) -> Transform:
+    return obj if isinstance(obj, Transform) else obj.transform
+
+
+class TransformArray:
+    """An array of :class:`~visuscript.Transform` data, stored as an (n, 2) array of translations,
+    an (n, 2) array of scales, and an (n,) array of rotations in degrees.
+
+    A :class:`TransformArray` is gathered from and scattered into existing :class:`~visuscript.Transform` instances,
+    such as those of drawables, so that the work in between happens in bulk.
+    """
+
+    __slots__ = ("_translations", "_scales", "_rotations")
+
+    def __init__(
+        self,
+        translations: Vec2Array | npt.ArrayLike,
+        scales: Vec2Array | npt.ArrayLike | None = None,
+        rotations: npt.ArrayLike | None = None,
+    ):
+        """
+        :param translations: The translations, as an (n, 2) array.
+        :param scales: The scales, as an (n, 2) array, or None for no scaling.
+        :param rotations: The rotations in degrees, as an (n,) array, or None for no rotation.
+        """
+        self._translations = (
+            translations if isinstance(translations, Vec2Array) else Vec2Array(translations)
+        )
+        n = len(self._translations)
+        if scales is None:
+            self._scales = Vec2Array.wrap(np.ones((n, 2)))
+        else:
+            self._scales = scales if isinstance(scales, Vec2Array) else Vec2Array(scales)
+        if rotations is None:
+            self._rotations: npt.NDArray[np.float64] = np.zeros(n)
+        else:
+            self._rotations = np.array(rotations, dtype=np.float64).reshape(-1)
+        if len(self._scales) != n or len(self._rotations) != n:
+            raise ValueError(
+                "The translations, scales, and rotations of a TransformArray must have the same length."
+            )
+
+    @staticmethod
+    def gather(objects: Iterable[Transform | HasTransform]) -> "TransformArray":
+        """Gathers a :class:`TransformArray` from Transforms or from the Transforms of objects that have them."""
+        transforms = [_as_transform(obj) for obj in objects]
+        return TransformArray(
+            [[*transform.translation] for transform in transforms],
+            [[*transform.scale] for transform in transforms],
+            [float(transform.rotation) for transform in transforms],
+        )
+
+    def scatter(self, objects: Sequence[Transform | HasTransform | None]):
+        """Writes each Transform herein, in place, into the respective Transform or object that has one.
+
+        Objects that are None are skipped.
+        """
+        if len(objects) > len(self):
+            raise ValueError(
+                f"Cannot scatter {len(self)} transforms into {len(objects)} objects."
+            )
+        translations = self._translations.data.tolist()
+        scales = self._scales.data.tolist()
+        rotations = self._rotations.tolist()
+        for i, obj in enumerate(objects):
+            if obj is None:
+                continue
+            _as_transform(obj).set_components(
+                translation=Vec2(*translations[i]),
+                scale=Vec2(*scales[i]),
+                rotation=rotations[i],
+            )
+
+    @property
+    def translations(self) -> Vec2Array:
+        return self._translations
+
+    @property
+    def scales(self) -> Vec2Array:
+        return self._scales
+
+    @property
+    def rotations(self) -> npt.NDArray[np.float64]:
+        return self._rotations
+
+    def __len__(self) -> int:
+        return len(self._rotations)
+
+    @overload
+    def __getitem__(self, index: int) -> Transform: ...
+    @overload
+    def __getitem__(self, index: slice) -> "TransformArray": ...
+    def __getitem__(self, index: int | slice) -> Union[Transform, "TransformArray"]:
+        if isinstance(index, slice):
+            return TransformArray(
+                self._translations[index], self._scales[index], self._rotations[index]
+            )
+        return Transform(
+            self._translations[index], self._scales[index], float(self._rotations[index])
+        )
+
+    def __iter__(self) -> Iterator[Transform]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def composed(self, parent: Transform) -> "TransformArray":
+        """Returns ``parent @ transform`` for each Transform herein, as per :meth:`Transform.__matmul__ <visuscript.Transform.__matmul__>`."""
+        return TransformArray(
+            self._translations.transformed(parent),
+            self._scales * parent.scale,
+            self._rotations + float(parent.rotation),
+        )
+
+    def interpolate(
+        self, other: "TransformArray", alpha: float | npt.ArrayLike
+    ) -> "TransformArray":
+        """Interpolates elementwise between this :class:`TransformArray` and another.
+
+        :param alpha: The progress of the interpolation, either one value for all elements or one value per element.
+        """
+        alpha = _as_alpha(alpha)
+        return TransformArray(
+            self._translations.interpolate(other._translations, alpha),
+            self._scales.interpolate(other._scales, alpha),
+            self._rotations * (1 - alpha) + other._rotations * alpha,
+        )
+
+    def __repr__(self) -> str:
+        return f"TransformArray(translations={self._translations.data.tolist()}, scales={self._scales.data.tolist()}, rotations={self._rotations.tolist()})"
@@ -1,5 +1,6 @@
-from visuscript._internal._invalidator import Invalidator, Invalidatable, invalidates
+from visuscript._internal._invalidator import invalidates
 from visuscript._internal._interpolable import Interpolable
+from visuscript._internal._number_format import format_number
 from visuscript.lazy_object import Lazible
 
 import math
@@ -13,10 +14,10 @@ from typing import (
     Union,
     TypeAlias,
     no_type_check,
-    Iterable,
 )
 from operator import add, mul, sub, truediv, neg, pow, eq
 from array import array
+from weakref import WeakValueDictionary
 
 
 MatrixLike: TypeAlias = Sequence[Sequence[float]]
@@ -46,10 +47,14 @@ class InterpolableFloat(float):
         return float(self)
 
 class Vec(Sequence[float], Interpolable):
-    VecLike: TypeAlias = Union["Vec", Sequence[float]]
+    """A vector of any dimension, whose arithmetic is element-wise.
 
-    def __init__(self, *args: float):
-        self._arr = array("d", [*args])
+    Vec stores no components itself; its subclasses, :class:`ArrayVec` and :class:`Vec2`, each store their own.
+    """
+
+    __slots__ = ()
+
+    VecLike: TypeAlias = Union["Vec", Sequence[float]]
 
     def interpolate(self, other: VecLike, alpha: float) -> Self:  # type: ignore[reportIncompatibleMethodOverride]
         return self._element_wise(lambda a, b: a * (1 - alpha) + b * alpha, other)
@@ -83,18 +88,6 @@ class Vec(Sequence[float], Interpolable):
         prods = self._element_wise(mul, other)
         return sum(prods)
 
-    @overload
-    def __getitem__(self, index: int) -> float: ...
-    @overload
-    def __getitem__(self, index: slice) -> "Vec": ...
-    def __getitem__(self, index: int | slice) -> Union[float, "Vec"]:  # type: ignore
-        if isinstance(index, slice):
-            return Vec(*self._arr[index])
-        return self._arr[index]
-
-    def __len__(self) -> int:
-        return len(self._arr)
-
     def __eq__(self, other: VecLike) -> bool:  # type: ignore
         return sum(self._element_wise(eq, other)) == len(self)
 
@@ -153,25 +146,143 @@ class Vec(Sequence[float], Interpolable):
         return max(self)
 
 
+class ArrayVec(Vec):
+    """A :class:`Vec` of any dimension, whose components are stored in an array."""
+
+    __slots__ = ("_arr",)
+
+    def __init__(self, *args: float):
+        self._arr = array("d", [*args])
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+    @overload
+    def __getitem__(self, index: slice) -> "Vec": ...
+    def __getitem__(self, index: int | slice) -> Union[float, "Vec"]:  # type: ignore
+        if isinstance(index, slice):
+            return ArrayVec(*self._arr[index])
+        return self._arr[index]
+
+    def __len__(self) -> int:
+        return len(self._arr)
+
+
 class Vec2(Vec):
     """A two dimensional vector, having an x value and a y value."""
 
+    __slots__ = ("_x", "_y")
+
     Vec2Like: TypeAlias = Union["Vec2", Sequence[float]]
 
+    # Vec2 is used throughout interpolation, Transform composition, and Shape calculation,
+    # so it stores its two components directly and specializes the arithmetic of Vec.
     def __init__(self, x: float, y: float):
-        super().__init__(x, y)
+        self._x = float(x)
+        self._y = float(y)
 
     @property
     def x(self) -> float:
-        return self[0]
+        return self._x
 
     @property
     def y(self) -> float:
-        return self[1]
+        return self._y
+
+    def _components(self, other: Vec.VecLike | float, operation: str) -> tuple[float, float]:
+        if isinstance(other, Vec2):
+            return other._x, other._y
+        if not isinstance(other, Sequence):
+            return other, other  # type: ignore[return-value]
+        if len(other) != 2:
+            raise SizeMismatch(2, len(other), operation)
+        return other[0], other[1]
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+    @overload
+    def __getitem__(self, index: slice) -> "Vec": ...
+    def __getitem__(self, index: int | slice) -> Union[float, "Vec"]:  # type: ignore
+        if isinstance(index, slice):
+            return ArrayVec(*(self._x, self._y)[index])
+        return (self._x, self._y)[index]
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self) -> Iterator[float]:
+        yield self._x
+        yield self._y
+
+    def interpolate(self, other: Vec.VecLike, alpha: float) -> "Vec2":  # type: ignore[reportIncompatibleMethodOverride]
+        x, y = self._components(other, "interpolate")
+        return Vec2(self._x * (1 - alpha) + x * alpha, self._y * (1 - alpha) + y * alpha)
+
+    def dot(self, other: Vec.VecLike) -> float:
+        x, y = self._components(other, "__mul__")
+        return self._x * x + self._y * y
+
+    def __eq__(self, other: Vec.VecLike) -> bool:  # type: ignore
+        x, y = self._components(other, "__eq__")
+        return self._x == x and self._y == y
+
+    def __add__(self, other: Vec.VecLike | float) -> "Vec2":
+        x, y = self._components(other, "__add__")
+        return Vec2(self._x + x, self._y + y)
+
+    def __radd__(self, other: Vec.VecLike | float) -> "Vec2":
+        x, y = self._components(other, "__add__")
+        return Vec2(x + self._x, y + self._y)
+
+    def __sub__(self, other: Vec.VecLike | float) -> "Vec2":
+        x, y = self._components(other, "__sub__")
+        return Vec2(self._x - x, self._y - y)
+
+    def __rsub__(self, other: Vec.VecLike | float) -> "Vec2":
+        x, y = self._components(other, "__sub__")
+        return Vec2(x - self._x, y - self._y)
+
+    def __mul__(self, other: Vec.VecLike | float) -> "Vec2":
+        x, y = self._components(other, "__mul__")
+        return Vec2(self._x * x, self._y * y)
+
+    def __rmul__(self, other: Vec.VecLike | float) -> "Vec2":
+        x, y = self._components(other, "__mul__")
+        return Vec2(x * self._x, y * self._y)
+
+    def __truediv__(self, other: Vec.VecLike | float) -> "Vec2":
+        x, y = self._components(other, "__truediv__")
+        return Vec2(self._x / x, self._y / y)
+
+    def __rtruediv__(self, other: Vec.VecLike | float) -> "Vec2":
+        x, y = self._components(other, "__truediv__")
+        return Vec2(x / self._x, y / self._y)
+
+    def __pow__(self, other: Vec.VecLike | float) -> "Vec2":
+        x, y = self._components(other, "__pow__")
+        return Vec2(self._x**x, self._y**y)
+
+    def __neg__(self) -> "Vec2":
+        return Vec2(-self._x, -self._y)
+
+    @no_type_check
+    def __rmatmul__(self, other: MatrixLike):
+        (a, b), (c, d) = other
+        return Vec2(a * self._x + b * self._y, c * self._x + d * self._y)
+
+    def __str__(self):
+        return f"[{self._x}, {self._y}]"
+
+    def __repr__(self):
+        return f"Vec({self._x}, {self._y})"
+
+    def max(self):
+        return max(self._x, self._y)
 
     @staticmethod
     def construct(other: Vec2Like) -> "Vec2":
         """Constructs and returns a :class:`Vec2` from an integer sequence of length two."""
+        if isinstance(other, Vec2):
+            return Vec2(other._x, other._y)
         if len(other) == 2:
             return Vec2(*other)
 
@@ -185,44 +296,77 @@ class Vec2(Vec):
 
 
 class Rgb(Interpolable):
-    """A Red Green Blue (RGB) color."""
+    """A Red Green Blue (RGB) color.
+
+    An Rgb is immutable and interned: constructing an Rgb with the same values as one that already exists
+    returns the existing instance.
+    """
+
+    __slots__ = ("_packed", "_svg", "__weakref__")
+    _packed: int
+    _svg: str
 
     RgbLike: TypeAlias = Union["Rgb", str, tuple[int, int, int]]
 
-    def __init__(self, r: int, g: int, b: int):
-        for v in [r, g, b]:
-            if v < 0 or v > 255:
-                raise ValueError(
-                    f"{v} is not a valid RGB value. RGB values must be between 0 and 255, includsive."
-                )
-        self._rgb: list[int] = [r, g, b]
+    _interned: "WeakValueDictionary[int, Rgb]" = WeakValueDictionary()
+
+    def __new__(cls, r: int, g: int, b: int):
+        if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+            for v in [r, g, b]:
+                if v < 0 or v > 255:
+                    raise ValueError(
+                        f"{v} is not a valid RGB value. RGB values must be between 0 and 255, includsive."
+                    )
+        r, g, b = int(r), int(g), int(b)
+        packed = r << 16 | g << 8 | b
+        rgb = cls._interned.get(packed)
+        if rgb is None:
+            rgb = super().__new__(cls)
+            rgb._packed = packed
+            rgb._svg = f"#{packed:06x}"
+            cls._interned[packed] = rgb
+        return rgb
+
+    def __reduce__(self):
+        return (Rgb, (self.r, self.g, self.b))
+
+    def __copy__(self) -> "Rgb":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> "Rgb":
+        return self
 
     def interpolate(self, other: "Rgb", alpha: float) -> "Rgb":  # type: ignore[reportIncompatibleMethodOverride]
         return Rgb(
             *(
                 min(max(round(s * (1 - alpha) + o * alpha), 0), 255)
-                for s, o in zip(self._rgb, other._rgb)
+                for s, o in zip(self, other)
             )
         )
     
     @staticmethod
     def construct(rgb: RgbLike):
+        if isinstance(rgb, Rgb):
+            return rgb
         if isinstance(rgb, str):
-            return Rgb(*PALETTE[rgb])
+            return PALETTE[rgb]
         else:
             return Rgb(*rgb)
 
     def __iter__(self) -> Iterator[int]:
-        yield from self._rgb
+        packed = self._packed
+        yield packed >> 16
+        yield packed >> 8 & 255
+        yield packed & 255
 
     def __add__(self, other: "Rgb") -> "Rgb":
-        return Rgb(*[min(s + o, 255) for s, o in zip(self._rgb, other._rgb)])
+        return Rgb(*[min(s + o, 255) for s, o in zip(self, other)])
 
     def __sub__(self, other: "Rgb") -> "Rgb":
-        return Rgb(*[max(s - o, 0) for s, o in zip(self._rgb, other._rgb)])
+        return Rgb(*[max(s - o, 0) for s, o in zip(self, other)])
 
     def __mul__(self, other: float) -> "Rgb":
-        return Rgb(*[min(int(s * other), 255) for s in self._rgb])
+        return Rgb(*[min(int(s * other), 255) for s in self])
 
     def __rmul__(self, other: float) -> "Rgb":
         return self * other
@@ -233,36 +377,35 @@ class Rgb(Interpolable):
     def __rtruediv__(self, other: float) -> "Rgb":
         return Rgb(*map(lambda c: int(other/c), self))
 
-    def __eq__(self, other: "Rgb"):  # type: ignore
-        return (
-            self._rgb[0] == other._rgb[0]
-            and self._rgb[1] == other._rgb[1]
-            and self._rgb[2] == other._rgb[2]
-        )
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Rgb) and self._packed == other._packed
+
+    def __hash__(self) -> int:
+        return self._packed
 
     def __str__(self):
-        r, g, b = self._rgb
+        r, g, b = self
         return f"RGB({r}, {g}, {b})"
 
     def __repr__(self):
         return str(self)
 
     @property
-    def svg(self):
-        r, g, b = self._rgb
-        return f"rgb({r},{g},{b})"
+    def svg(self) -> str:
+        """The SVG representation of this color, which is computed once."""
+        return self._svg
 
     @property
     def r(self) -> int:
-        return self._rgb[0]
+        return self._packed >> 16
 
     @property
     def g(self) -> int:
-        return self._rgb[1]
+        return self._packed >> 8 & 255
 
     @property
     def b(self) -> int:
-        return self._rgb[2]
+        return self._packed & 255
     
     def get_interpolator(self) -> "RgbInterpolator":
         return RgbInterpolator((self.r, self.g, self.b))
@@ -320,7 +463,7 @@ PALETTE: dict[str, Rgb] = {
     "white": Rgb(255, 255, 255),
 }
 
-class Transform(Invalidator, Interpolable, Lazible):
+class Transform(Interpolable, Lazible):
     """A two dimensional transformation with translation, scale, and rotation."""
 
     TransformLike: TypeAlias = Union["Transform", Vec2.Vec2Like]
@@ -338,14 +481,32 @@ class Transform(Invalidator, Interpolable, Lazible):
         self._scale: Vec2 = Vec2.construct(scale)
         self._rotation: InterpolableFloat = InterpolableFloat(rotation)
 
-        self._invalidatables: set[Invalidatable] = set()
+        # Derived from the components above and cleared whenever they change.
+        self._trig: tuple[float, float] | None = None
+        self._matrix: tuple[float, float, float, float, float, float] | None = None
+
+        # Incremented with every change, so that dependents can tell whether they are stale.
+        self._version: int = 0
 
     def copy(self) -> "Transform":
-        return Transform(
-            translation=self.translation,
-            scale=self.scale,
-            rotation=self.rotation,
-        )
+        transform = Transform._from_components(self._translation, self._scale, self._rotation)
+        transform._trig = self._trig
+        transform._matrix = self._matrix
+        return transform
+
+    @staticmethod
+    def _from_components(
+        translation: Vec2, scale: Vec2, rotation: "InterpolableFloat"
+    ) -> "Transform":
+        """Initializes a :class:`Transform` that shares the given components, which must already be of the stored types."""
+        transform = Transform.__new__(Transform)
+        transform._translation = translation
+        transform._scale = scale
+        transform._rotation = rotation
+        transform._trig = None
+        transform._matrix = None
+        transform._version = 0
+        return transform
 
     @staticmethod
     def construct(other: TransformLike):
@@ -358,11 +519,10 @@ class Transform(Invalidator, Interpolable, Lazible):
         else:
             return Transform(translation=other, scale=[1, 1], rotation=0)
 
-    def _add_invalidatable(self, invalidatable: Invalidatable):
-        self._invalidatables.add(invalidatable)
-
-    def _iter_invalidatables(self) -> Iterable[Invalidatable]:
-        yield from self._invalidatables
+    @property
+    def version(self) -> int:
+        """A number that changes whenever the translation, scale, or rotation hereof changes."""
+        return self._version
 
     @property
     def rotation(self) -> InterpolableFloat:
@@ -372,12 +532,40 @@ class Transform(Invalidator, Interpolable, Lazible):
     @invalidates
     def rotation(self, value: float):
         self._rotation = InterpolableFloat(value)
+        self._trig = None
+        self._matrix = None
+        self._version += 1
 
-    def rotate(self, vec2: Vec2.Vec2Like) -> Vec2:
-        t = self.rotation * math.pi / 180
-        r_matrix = [[math.cos(t), -math.sin(t)], [math.sin(t), math.cos(t)]]
+    def _cos_sin(self) -> tuple[float, float]:
+        if self._trig is None:
+            t = self._rotation * math.pi / 180
+            self._trig = (math.cos(t), math.sin(t))
+        return self._trig
+
+    @property
+    def matrix(self) -> tuple[float, float, float, float, float, float]:
+        """The 2x3 affine matrix (a, b, c, d, e, f) for this Transform,
+        which maps (x, y) to (a*x + c*y + e, b*x + d*y + f).
 
-        return Vec2(*(r_matrix @ Vec2.construct(vec2)))
+        The matrix is cached until the translation, scale, or rotation changes.
+        """
+        if self._matrix is None:
+            cos, sin = self._cos_sin()
+            sx, sy = self._scale.x, self._scale.y
+            self._matrix = (
+                cos * sx,
+                sin * sx,
+                -sin * sy,
+                cos * sy,
+                self._translation.x,
+                self._translation.y,
+            )
+        return self._matrix
+
+    def rotate(self, vec2: Vec2.Vec2Like) -> Vec2:
+        cos, sin = self._cos_sin()
+        x, y = vec2
+        return Vec2(cos * x - sin * y, sin * x + cos * y)
 
     @property
     def translation(self) -> Vec2:
@@ -388,6 +576,8 @@ class Transform(Invalidator, Interpolable, Lazible):
     def translation(self, value: Vec2.Vec2Like):
         value = Vec2.construct(value)
         self._translation = value
+        self._matrix = None
+        self._version += 1
 
     @property
     def scale(self) -> Vec2:
@@ -398,9 +588,10 @@ class Transform(Invalidator, Interpolable, Lazible):
     def scale(self, value: float | Vec2.Vec2Like):
         if isinstance(value, (int, float)):
             self._scale = Vec2(value, value)
-            return
-
-        self._scale = Vec2.construct(value)
+        else:
+            self._scale = Vec2.construct(value)
+        self._matrix = None
+        self._version += 1
 
     def set_translation(self, translation: Vec2.Vec2Like) -> Self:
         self.translation = translation
@@ -418,8 +609,32 @@ class Transform(Invalidator, Interpolable, Lazible):
     def svg_transform(self) -> str:
         """
         The SVG representation of this Transform, as can be specified with "transfrom="
+
+        Identity parts are omitted and, when it is shorter, the Transform is written as a single matrix.
         """
-        return f"translate({' '.join(map(str, self.translation[:2]))}) scale({' '.join(map(str, self.scale[:2]))}) rotate({self.rotation})"
+        tx, ty = map(format_number, self.translation[:2])
+        sx, sy = map(format_number, self.scale[:2])
+        rotation = format_number(self.rotation)
+
+        parts: list[str] = []
+        if tx != "0" or ty != "0":
+            parts.append(f"translate({tx})" if ty == "0" else f"translate({tx} {ty})")
+        if sx != "1" or sy != "1":
+            parts.append(f"scale({sx})" if sx == sy else f"scale({sx} {sy})")
+        if rotation != "0":
+            parts.append(f"rotate({rotation})")
+
+        if not parts:
+            return "translate(0)"
+        decomposed = " ".join(parts)
+        if len(parts) == 1 or rotation == "0":
+            return decomposed
+
+        # SVG applies the parts right to left: translate(t) scale(s) rotate(r) is the matrix T*S*R.
+        cos, sin = self._cos_sin()
+        scale_x, scale_y = self.scale[:2]
+        matrix = f"matrix({' '.join(map(format_number, (scale_x * cos, scale_y * sin, -scale_x * sin, scale_y * cos)))} {tx} {ty})"
+        return matrix if len(matrix) < len(decomposed) else decomposed
 
     def __str__(self):
         return self.svg_transform
@@ -439,17 +654,18 @@ class Transform(Invalidator, Interpolable, Lazible):
     @overload
     def __matmul__(self, other: Vec2) -> Vec2: ...
     def __matmul__(self, other: Union["Transform", Vec2]) -> Union["Transform", Vec2]:
-        t = self.rotation * math.pi / 180
-        r_matrix = [[math.cos(t), -math.sin(t)], [math.sin(t), math.cos(t)]]
+        a, b, c, d, e, f = self.matrix
 
         if isinstance(other, (Vec2, Sequence)):
-            return (r_matrix @ (other * self.scale)) + self._translation
-
-        return Transform(
-            translation=r_matrix @ (other._translation * self.scale)
-            + self._translation,
-            scale=self.scale * other.scale,
-            rotation=self.rotation + other.rotation,
+            x, y = other
+            return Vec2(a * x + c * y + e, b * x + d * y + f)
+
+        # The components compose separately, so that the composite remains a translation, scale, and rotation.
+        x, y = other._translation.x, other._translation.y
+        return Transform._from_components(
+            Vec2(a * x + c * y + e, b * x + d * y + f),
+            self._scale * other._scale,
+            self._rotation + other._rotation,
         )
 
     def interpolate(self, other: "Transform", alpha: float) -> "Transform":  # type: ignore[reportIncompatibleMethodOverride]
@@ -479,3 +695,33 @@ class Transform(Invalidator, Interpolable, Lazible):
         self._translation = other.translation
         self._scale = other.scale
         self._rotation = other.rotation
+        self._trig = other._trig
+        self._matrix = other._matrix
+        self._version += 1
+
+    @invalidates
+    def set_components(
+        self,
+        translation: Vec2.Vec2Like | None = None,
+        scale: Vec2.Vec2Like | float | None = None,
+        rotation: float | None = None,
+    ) -> Self:
+        """Sets any of the translation, scale, and rotation hereof in place, notifying dependents only once.
+
+        :param translation: The new translation, or None to keep the current translation.
+        :param scale: The new scale, or None to keep the current scale.
+        :param rotation: The new rotation, or None to keep the current rotation.
+        :return: self
+        """
+        if translation is not None:
+            self._translation = Vec2.construct(translation)
+        if scale is not None:
+            self._scale = (
+                Vec2(scale, scale) if isinstance(scale, (int, float)) else Vec2.construct(scale)
+            )
+        if rotation is not None:
+            self._rotation = InterpolableFloat(rotation)
+            self._trig = None
+        self._matrix = None
+        self._version += 1
+        return self
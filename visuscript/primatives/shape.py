@@ -1,4 +1,5 @@
 import typing as t
+from functools import cached_property
 
 from .primatives import Transform, Vec2
 
@@ -19,7 +20,10 @@ class HasAnchorOffset(t.Protocol):
 
 
 class Shape:
-    """Holds geometric properties for an object."""
+    """Holds geometric properties for an object.
+
+    The coordinates of the points on the object's rectangular circumscription are each computed when first accessed.
+    """
 
     def __init__(self, obj: HasCalculatableShape, transform: Transform = Transform()):
         """
@@ -34,6 +38,12 @@ class Shape:
         height = obj.calculate_height()
         circumscribed_radius = obj.calculate_circumscribed_radius()
 
+        # The matrix is an immutable tuple, so the points are computed from the transform as it is now.
+        self._matrix = transform.matrix
+        self._untransformed_top_left = top_left
+        self._untransformed_width = width
+        self._untransformed_height = height
+
         self.width: float = width * transform.scale.x
         """The width of the object's rectangular circumscription."""
 
@@ -43,29 +53,53 @@ class Shape:
         self.circumscribed_radius: float = circumscribed_radius * transform.scale.max()
         """The radius of the smallest circle that circumscribes the obj."""
 
-        self.top_left: Vec2 = transform @ (top_left)
+    def _point(self, width_fraction: float, height_fraction: float) -> Vec2:
+        a, b, c, d, e, f = self._matrix
+        x = self._untransformed_top_left.x + self._untransformed_width * width_fraction
+        y = self._untransformed_top_left.y + self._untransformed_height * height_fraction
+        return Vec2(a * x + c * y + e, b * x + d * y + f)
+
+    @cached_property
+    def top_left(self) -> Vec2:
         """The top-left coordinate of the object's rectangular circumscription."""
+        return self._point(0, 0)
 
-        self.top: Vec2 = transform @ (top_left + [width / 2, 0])
+    @cached_property
+    def top(self) -> Vec2:
         """The top-middle coordinate of the object's rectangular circumscription."""
+        return self._point(0.5, 0)
 
-        self.top_right: Vec2 = transform @ (top_left + [width, 0])
+    @cached_property
+    def top_right(self) -> Vec2:
         """The top-right coordinate of the object's rectangular circumscription."""
+        return self._point(1, 0)
 
-        self.left: Vec2 = transform @ (top_left + [0, height / 2])
+    @cached_property
+    def left(self) -> Vec2:
         """The left-middle coordinate of the object's rectangular circumscription."""
+        return self._point(0, 0.5)
 
-        self.bottom_left: Vec2 = transform @ (top_left + [0, height])
+    @cached_property
+    def bottom_left(self) -> Vec2:
         """The bottom-left coordinate of the object's rectangular circumscription."""
+        return self._point(0, 1)
 
-        self.bottom: Vec2 = transform @ (top_left + [width / 2, height])
+    @cached_property
+    def bottom(self) -> Vec2:
         """The bottom-middle coordinate of the object's rectangular circumscription."""
+        return self._point(0.5, 1)
 
-        self.bottom_right: Vec2 = transform @ (top_left + [width, height])
+    @cached_property
+    def bottom_right(self) -> Vec2:
         """The bottom-right coordinate of the object's rectangular circumscription."""
+        return self._point(1, 1)
 
-        self.right: Vec2 = transform @ (top_left + [width, height / 2])
+    @cached_property
+    def right(self) -> Vec2:
         """The right-middle coordinate of the object's rectangular circumscription."""
+        return self._point(1, 0.5)
 
-        self.center: Vec2 = transform @ (top_left + [width / 2, height / 2])
-        """The center coordinate of the object's rectangular circumscription."""
\ No newline at end of file
+    @cached_property
+    def center(self) -> Vec2:
+        """The center coordinate of the object's rectangular circumscription."""
+        return self._point(0.5, 0.5)
@@ -0,0 +1,151 @@
+"""Contains :class:`Profiler`, which measures what each :class:`~visuscript.animation.Animation`
+and :class:`~visuscript.updater.Updater` run by a :class:`~visuscript.Scene` costs.
+
+Example::
+
+    with Profiler() as profiler:
+        with Scene(profiler=profiler) as s:
+            s.animations << animate_translation(rect.transform, [10, 0])
+    print(profiler.report(), file=sys.stderr)
+"""
+
+import functools
+import os
+import sys
+import time
+import typing as t
+import weakref
+from dataclasses import dataclass
+
+from visuscript._internal._epoch import current_epoch
+
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_open_profilers = 0
+
+_T = t.TypeVar("_T")
+
+
+def creation_site() -> str | None:
+    """Returns the file and line, as ``file:line``, of the code outside of visuscript that is creating an object,
+    or None if no :class:`Profiler` is open."""
+    if not _open_profilers:
+        return None
+    frame = sys._getframe(1)  # type: ignore[reportPrivateUsage]
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIRECTORY):
+        frame = frame.f_back
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+@dataclass
+class ProfileEntry:
+    """The measurements for all animations or updaters of one type created at one site."""
+
+    kind: str
+    """The name of the type of the animations or updaters."""
+    site: str | None
+    """Where the animations or updaters were created, as ``file:line``, or None if that was not recorded."""
+    instances: int = 0
+    """The number of distinct animations or updaters measured."""
+    calls: int = 0
+    """The number of times that the animations were advanced or the updaters were updated."""
+    seconds: float = 0.0
+    """The cumulative wall time spent advancing or updating."""
+    modifications: int = 0
+    """The number of modifications to tracked state, such as through setters, made while advancing or updating."""
+
+
+class Profiler:
+    """Records, for each leaf :class:`~visuscript.animation.Animation` and each :class:`~visuscript.updater.Updater`
+    run by a :class:`~visuscript.Scene`, how many times it ran, for how long, and how many modifications it made.
+
+    Measurements are grouped by the type of each animation or updater and the site at which it was created.
+    Sites are recorded only for animations and updaters created while a :class:`Profiler` is open,
+    from its construction until :meth:`close`, which is called on leaving it as a context manager.
+    No reference to a measured animation or updater is kept.
+    """
+
+    def __init__(self):
+        global _open_profilers
+        _open_profilers += 1
+        self._open = True
+        self._entries: dict[tuple[str, str | None], ProfileEntry] = {}
+        # Each subject measured is remembered, by its identity, only until it is collected.
+        self._subjects: dict[int, tuple[weakref.ref[object], ProfileEntry]] = {}
+
+    def close(self):
+        """Stops recording the creation sites of animations and updaters, unless another :class:`Profiler` is open.
+
+        Measurements can still be made and reported thereafter.
+        """
+        global _open_profilers
+        if self._open:
+            self._open = False
+            _open_profilers -= 1
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, *args: object):
+        self.close()
+
+    def measure(self, subject: object, function: t.Callable[[], _T]) -> _T:
+        """Calls a function that runs an animation or updater and records what the call cost.
+
+        :param subject: The animation or updater that the call runs, which must support weak references.
+        :param function: The function that runs it.
+        :return: The result of `function`.
+        """
+        key = id(subject)
+        subject_entry = self._subjects.get(key)
+        if subject_entry is not None and subject_entry[0]() is subject:
+            entry = subject_entry[1]
+        else:
+            kind = type(subject).__name__
+            site: str | None = getattr(subject, "_creation_site", None)
+            entry = self._entries.get((kind, site))
+            if entry is None:
+                entry = self._entries[(kind, site)] = ProfileEntry(kind, site)
+            entry.instances += 1
+            self._subjects[key] = (weakref.ref(subject, functools.partial(self._forget, key)), entry)
+
+        epoch = current_epoch()
+        start = time.perf_counter()
+        result = function()
+        entry.seconds += time.perf_counter() - start
+        entry.modifications += current_epoch() - epoch
+        entry.calls += 1
+        return result
+
+    def _forget(self, key: int, reference: weakref.ref[object]):
+        subject_entry = self._subjects.get(key)
+        if subject_entry is not None and subject_entry[0] is reference:
+            del self._subjects[key]
+
+    @property
+    def entries(self) -> list[ProfileEntry]:
+        """The measurements, from the most to the least cumulative wall time."""
+        return sorted(self._entries.values(), key=lambda entry: entry.seconds, reverse=True)
+
+    def report(self, limit: int | None = None) -> str:
+        """Returns a table of the measurements, from the most to the least cumulative wall time.
+
+        :param limit: The maximum number of rows, or None for all of them.
+        """
+        rows = [("time (ms)", "calls", "us/call", "modifications", "instances", "type", "site")]
+        for entry in self.entries[:limit]:
+            rows.append(
+                (
+                    f"{entry.seconds * 1e3:.3f}",
+                    str(entry.calls),
+                    f"{entry.seconds / entry.calls * 1e6:.2f}" if entry.calls else "-",
+                    str(entry.modifications),
+                    str(entry.instances),
+                    entry.kind,
+                    entry.site or "<unknown>",
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]) - 1)]
+        return "\n".join(
+            "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) + "  " + row[-1]
+            for row in rows
+        )
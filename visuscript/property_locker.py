@@ -1,4 +1,4 @@
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
 class LockedPropertyError(ValueError):
@@ -10,23 +10,60 @@ class LockedPropertyError(ValueError):
 
 
 class PropertyLocker:
+    """Identifies the properties of objects that are locked, such as by an animation that sets them.
+
+    Locks are indexed by the identity of each object together with the name of each property.
+    A :class:`PropertyLocker` that is merged into an empty :class:`PropertyLocker` shares its index therewith
+    until either is next modified, so merges and conflict checks cost in proportion to the smaller of the two.
+    """
+
+    __slots__ = ("_locks", "_shared")
+
     def __init__(self, locks: dict[object, Iterable[str]] | None = None):
-        self._map: dict[object, set[str]] = dict()
+        self._locks: dict[tuple[int, str], object] = dict()
+        self._shared = False
         if not locks is None:
             for obj, properties in locks.items():
-                self._map[obj] = set(properties)
+                for property in properties:
+                    self._locks[(id(obj), property)] = obj
+
+    def _own(self) -> dict[tuple[int, str], object]:
+        """Returns the index of locks, copying it first if it is shared with another PropertyLocker."""
+        if self._shared:
+            self._locks = self._locks.copy()
+            self._shared = False
+        return self._locks
 
     def add(self, obj: object, property: str, ignore_conflicts: bool = False):
         """Raises LockedPropertyError if the property is already locked by this PropertyLocker."""
-        if not ignore_conflicts and self.locks(obj, property):
+        key = (id(obj), property)
+        if not ignore_conflicts and key in self._locks:
             raise LockedPropertyError(obj, property)
-        self._map[obj] = self._map.get(obj, set()).union(set([property]))
+        self._own()[key] = obj
 
     def update(self, other: "PropertyLocker", ignore_conflicts: bool = False):
-        """Merges this PropertyLocker with another in place. Raises LockedPropertyError if the two PropertyLockers lock one or more of the same properties on the same object."""
-        for obj in other._map:
-            for property in other._map[obj]:
-                self.add(obj, property, ignore_conflicts=ignore_conflicts)
+        """Merges this PropertyLocker with another in place. Raises LockedPropertyError if the two PropertyLockers lock one or more of the same properties on the same object,
+        in which case neither is modified."""
+        if not ignore_conflicts:
+            self.check_conflicts(other)
+        if not other._locks:
+            return
+        if not self._locks:
+            self._locks = other._locks
+            self._shared = other._shared = True
+            return
+        self._own().update(other._locks)
+
+    def check_conflicts(self, other: "PropertyLocker"):
+        """Raises LockedPropertyError if this and another PropertyLocker lock one or more of the same properties on the same object."""
+        smaller, larger = self._locks, other._locks
+        if len(smaller) > len(larger):
+            smaller, larger = larger, smaller
+        if not smaller or smaller.keys().isdisjoint(larger.keys()):
+            return
+        for key, obj in smaller.items():
+            if key in larger:
+                raise LockedPropertyError(obj, key[1])
 
     def locks(self, obj: object, property: str) -> bool:
         """Returns whether this :class:`PropertyLocker` locks the specified property.
@@ -38,5 +75,12 @@ class PropertyLocker:
         :return: True if this :class:`PropertyLocker` locks the specified property; else False
         :rtype: bool
         """
-        lock_set = self._map.get(obj, set())
-        return property in lock_set
+        return (id(obj), property) in self._locks
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def __iter__(self) -> Iterator[tuple[object, str]]:
+        """Iterates over each locked object along with each of its properties that is locked."""
+        for (_, property), obj in self._locks.items():
+            yield obj, property
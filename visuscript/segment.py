@@ -3,6 +3,8 @@ from typing import Self, overload
 from abc import ABC, abstractmethod
 from visuscript.primatives.primatives import Vec2
 from visuscript.math_utility import magnitude
+from visuscript._internal._epoch import advance_epoch
+from visuscript._internal._number_format import format_number
 
 
 class Segment(ABC):
@@ -98,7 +100,7 @@ class MSegment(Segment):
 
     @property
     def path_str(self) -> str:
-        return f"M {self._x1} {self._y1}"
+        return f"M {format_number(self._x1)} {format_number(self._y1)}"
 
 
 class LSegment(Segment):
@@ -142,7 +144,7 @@ class LSegment(Segment):
 
     @property
     def path_str(self) -> str:
-        return f"L {self._x2} {self._y2}"
+        return f"L {format_number(self._x2)} {format_number(self._y2)}"
 
 
 class ZSegment(LSegment):
@@ -215,7 +217,7 @@ class QSegment(Segment):
 
     @property
     def path_str(self) -> str:
-        return f"Q {self._p2[0]} {self._p2[1]} {self._p3[0]} {self._p3[1]}"
+        return f"Q {format_number(self._p2[0])} {format_number(self._p2[1])} {format_number(self._p3[0])} {format_number(self._p3[1])}"
 
 
 # class ArcSegment(Segment):
@@ -279,7 +281,7 @@ class Path(Segment):
     @property
     def path_str(self) -> str:
         if len(self._segments) == 0 or str(self._segments[0])[0] != "M":
-            string = f"M {self._x_offset} {self._y_offset}"
+            string = f"M {format_number(self._x_offset)} {format_number(self._y_offset)}"
         else:
             string = ""
 
@@ -335,6 +337,7 @@ class Path(Segment):
         segment = MSegment(x, y)
         self._cursor = segment.end
         self._segments.append(segment)
+        advance_epoch()
         return self
 
     @overload
@@ -357,6 +360,7 @@ class Path(Segment):
         segment = LSegment(self._cursor[0], self._cursor[1], x, y)
         self._cursor = segment.end
         self._segments.append(segment)
+        advance_epoch()
         return self
 
     def l(self, dx: float, dy: float) -> Self:
@@ -373,6 +377,7 @@ class Path(Segment):
         segment = ZSegment(self._cursor[0], self._cursor[1], x2, y2)
         self._cursor = segment.end
         self._segments.append(segment)
+        advance_epoch()
         return self
 
     z = Z
@@ -390,6 +395,7 @@ class Path(Segment):
 
         self._cursor = segment.end
         self._segments.append(segment)
+        advance_epoch()
         return self
 
     def q(self, dx1: float, dy1: float, dx: float, dy: float) -> Self:
@@ -1,12 +1,14 @@
 """This module contains the abstract base class of all updaters alongside a bevy of basic updaters"""
 
+import functools
+import math
 from abc import ABC, abstractmethod
 from visuscript.primatives import Transform
 from visuscript.property_locker import PropertyLocker
 from visuscript.math_utility import magnitude
 from visuscript.config import config
+from visuscript.profiling import Profiler, creation_site
 from typing import Iterable, Self, Callable, cast, Any
-import numpy as np
 
 
 class UpdaterActivityError(ValueError):
@@ -23,10 +25,16 @@ class UpdaterAlreadyDeactiveError(UpdaterActivityError):
 
 class Updater(ABC):
     _num_frames = 0
-    _updates_per_second = config.fps
-    _updates_per_frame = 1
+    _updates_per_second: float | None = None
     _num_updates_processed = 0
     _active = True
+    _creation_site: str | None = None
+    _schedulers: tuple["UpdaterBundle", ...] = ()
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        updater = super().__new__(cls)
+        updater._creation_site = creation_site()
+        return updater
 
     @property
     def active(self) -> bool:
@@ -37,24 +45,34 @@ class Updater(ABC):
         """Activate this Updater."""
         if self._active:
             raise UpdaterAlreadyActiveError()
-        self._active = False
+        self._active = True
+        self._reschedule()
 
     def deactivate(self):
         """Deactivate this Updater."""
         if not self._active:
             raise UpdaterAlreadyDeactiveError()
-        self._active = True
+        self._active = False
+        self._reschedule()
+
+    def _reschedule(self):
+        for scheduler in self._schedulers:
+            scheduler._on_updater_changed(self)  # type: ignore[reportPrivateUsage]
+
+    @property
+    def update_rate(self) -> float:
+        """The number of updates made per second, which defaults to the frame rate at the time of each frame."""
+        return self._updates_per_second or config.fps
 
     def update_for_frame(self) -> Self:
         self._num_frames += 1
+        rate = self.update_rate
         num_updates_to_make = int(
-            self._num_frames * self._updates_per_frame - self._num_updates_processed
+            self._num_frames * rate // config.fps - self._num_updates_processed
         )
-        sub_dt = 1 / self._updates_per_second
-        for _ in range(num_updates_to_make):
-            self.update(self._num_updates_processed / self._updates_per_second, sub_dt)
-
-        self._num_updates_processed += num_updates_to_make
+        if num_updates_to_make > 0:
+            self.update_steps(self._num_updates_processed / rate, 1 / rate, num_updates_to_make)
+            self._num_updates_processed += num_updates_to_make
 
         return self
 
@@ -71,6 +89,15 @@ class Updater(ABC):
         """Makes this Updater's update."""
         ...
 
+    def update_steps(self, t: float, dt: float, steps: int) -> Self:
+        """Makes `steps` consecutive updates, the first at time `t` and each thereafter `dt` later.
+
+        Updaters that can advance several updates at once more cheaply than one at a time should override this.
+        """
+        for step in range(steps):
+            self.update(t + step * dt, dt)
+        return self
+
     def set_update_rate(self, updates_per_second: float) -> Self:
         """Sets the rate that updates occur for this Updater.
 
@@ -79,21 +106,120 @@ class Updater(ABC):
         or less often than once per frame.
         """
         self._updates_per_second = updates_per_second
-        self._updates_per_frame = updates_per_second / config.fps
+        self._reschedule()
         return self
 
 
+class _UpdaterGroup:
+    """The active updaters in an :class:`UpdaterBundle` that share an update rate,
+    along with the number of updates made at that rate."""
+
+    __slots__ = ("rate", "updaters", "ordered", "num_updates_processed")
+
+    def __init__(self, rate: float | None, num_updates_processed: int):
+        self.rate = rate
+        self.updaters: dict[int, Updater] = {}
+        self.ordered: list[Updater] | None = None
+        self.num_updates_processed = num_updates_processed
+
+    def add(self, position: int, updater: Updater):
+        self.updaters[position] = updater
+        self.ordered = None
+
+    def remove(self, position: int):
+        del self.updaters[position]
+        self.ordered = None
+
+    def in_order(self) -> list[Updater]:
+        """Returns the updaters herein in the order in which they were pushed."""
+        if self.ordered is None:
+            self.ordered = [self.updaters[position] for position in sorted(self.updaters)]
+        return self.ordered
+
+
 class UpdaterBundle(Updater):
+    """Runs many updaters together.
+
+    When run with :meth:`update_for_frame`, as by a :class:`~visuscript.Scene`, or with :meth:`update_steps`,
+    as when nested in another :class:`UpdaterBundle`, the active updaters herein are grouped by their update rates.
+    For each step of this bundle, at its own :attr:`~Updater.update_rate`, the number of updates due is computed once
+    per group, and each updater in the group makes all of them with one call to :meth:`Updater.update_steps`.
+    Activating, deactivating, or changing the rate of an updater herein moves it between groups as it happens,
+    so that a frame costs nothing for inactive updaters.
+
+    Within a frame, the groups run one after another, in the order in which this bundle first met their rates,
+    and the updaters in each group run in the order in which they were pushed.
+    Updaters with different rates are thus not necessarily run in the order in which they were pushed.
+    """
+
     def __init__(self, *updaters: Updater):
         self._updaters: list[Updater] = []
         self._locker: PropertyLocker = PropertyLocker()
+        self._profiler: Profiler | None = None
+        self._groups: dict[float | None, _UpdaterGroup] = {}
+        self._positions: dict[int, list[int]] = {}
+        self._group_of: dict[int, _UpdaterGroup] = {}
+        self._num_steps = 0
 
         for updater in updaters:
             self.push(updater)
 
     def update(self, t: float, dt: float) -> Self:
-        for updater in filter(lambda u: u.active, self._updaters):
-            updater.set_update_rate(config.fps).update(t, dt)
+        for updater in self._updaters:
+            if not updater._active:  # type: ignore[reportPrivateUsage]
+                continue
+            if self._profiler is None:
+                updater.update(t, dt)
+            else:
+                self._profiler.measure(updater, functools.partial(updater.update, t, dt))
+        return self
+
+    def update_steps(self, t: float, dt: float, steps: int) -> Self:
+        """Advances this bundle by `steps` of its own steps, running each updater herein at its own rate."""
+        self._num_steps += steps
+        rate_of_bundle = self.update_rate
+        profiler = self._profiler
+        for group in self._groups.values():
+            rate = group.rate or config.fps
+            group_steps = int(self._num_steps * rate // rate_of_bundle - group.num_updates_processed)
+            if group_steps <= 0:
+                continue
+            group_t = group.num_updates_processed / rate
+            group_dt = 1 / rate
+            group.num_updates_processed += group_steps
+            if not group.updaters:
+                continue
+            for updater in group.in_order():
+                if profiler is None:
+                    updater.update_steps(group_t, group_dt, group_steps)
+                else:
+                    profiler.measure(updater, functools.partial(updater.update_steps, group_t, group_dt, group_steps))
+        return self
+
+    def _group(self, rate: float | None) -> _UpdaterGroup:
+        group = self._groups.get(rate)
+        if group is None:
+            # A new group starts at the time of this bundle, rather than at zero.
+            num_updates_processed = int(self._num_steps * (rate or config.fps) // self.update_rate)
+            group = self._groups[rate] = _UpdaterGroup(rate, num_updates_processed)
+        return group
+
+    def _schedule(self, position: int, updater: Updater):
+        old_group = self._group_of.pop(position, None)
+        if old_group is not None:
+            old_group.remove(position)
+        if updater._active:  # type: ignore[reportPrivateUsage]
+            group = self._group(updater._updates_per_second)  # type: ignore[reportPrivateUsage]
+            group.add(position, updater)
+            self._group_of[position] = group
+
+    def _on_updater_changed(self, updater: Updater):
+        for position in self._positions[id(updater)]:
+            self._schedule(position, updater)
+
+    def set_profiler(self, profiler: Profiler | None) -> Self:
+        """Sets the :class:`~visuscript.profiling.Profiler` that measures each update of each Updater herein, or None for none."""
+        self._profiler = profiler
         return self
 
     @property
@@ -108,7 +234,14 @@ class UpdaterBundle(Updater):
 
         if isinstance(updater, Updater):
             self._locker.update(updater.locker)
+            position = len(self._updaters)
             self._updaters.append(updater)
+            positions = self._positions.get(id(updater))
+            if positions is None:
+                positions = self._positions[id(updater)] = []
+                updater._schedulers = (*updater._schedulers, self)  # type: ignore[reportPrivateUsage]
+            positions.append(position)
+            self._schedule(position, updater)
         elif isinstance(updater, Iterable):  # type: ignore
             for updater_ in updater:
                 self.push(updater_)
@@ -122,8 +255,15 @@ class UpdaterBundle(Updater):
         self.push(other, _call_method="<<")
 
     def clear(self):
+        for updater in self._updaters:
+            updater._schedulers = tuple(  # type: ignore[reportPrivateUsage]
+                scheduler for scheduler in updater._schedulers if scheduler is not self  # type: ignore[reportPrivateUsage]
+            )
         self._updaters = []
         self._locker = PropertyLocker()
+        self._groups = {}
+        self._positions = {}
+        self._group_of = {}
 
 
 class FunctionUpdater(Updater):
@@ -191,7 +331,7 @@ class TranslationUpdater(Updater):
             )
 
             max_speed = min(
-                self._last_speed + acceleration * dt, self._max_speed or np.inf
+                self._last_speed + acceleration * dt, self._max_speed or math.inf
             )
             self._last_speed = max_speed
 
@@ -203,6 +343,13 @@ class TranslationUpdater(Updater):
 
         return self
 
+    def update_steps(self, t: float, dt: float, steps: int) -> Self:
+        # Without acceleration, consecutive updates toward the target, which does not move between them,
+        # cover the smaller of the remaining distance and the maximum speed over all of them.
+        if self._acceleration is not None or steps == 1:
+            return super().update_steps(t, dt, steps)
+        return self.update(t, dt * steps)
+
 
 def run_updater(updater: Updater, duration: float):
     t = 0